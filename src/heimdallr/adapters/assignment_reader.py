@@ -3,14 +3,12 @@ Adapter for reading assignments from a file.
 """
 import abc
 import datetime
-import os
+import re
+import shutil
 import string
 import tempfile
-from io import BytesIO
-from itertools import dropwhile
 
 import docx
-import fitz
 import joblib
 import nltk
 import pandas as pd
@@ -20,11 +18,16 @@ from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.pipeline import Pipeline
 from sklearn.svm import LinearSVC
 from spacy import Language
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
 
+from heimdallr.adapters.page_pool import ProcessPoolPageReader, extract_pages, open_pdf
 from heimdallr.adapters.text_processing import CleanTextTransformer
 from heimdallr.domain.models.assignment import UNKNOWN_AUTHOR, Assignment, Topic
 from heimdallr.utils import content_type
 from heimdallr.utils.formatting import contains_letters_or_numbers, normalize_sentence
+from heimdallr.utils.process_pool import ForkedProcessPool
+from heimdallr.utils.uploads import descriptor_path, unspool
 
 
 class AssignmentReader(abc.ABC):
@@ -59,11 +62,22 @@ class TopicPredictor(abc.ABC):
 class SpacyAssignmentReader(AssignmentReader):
     SPACY_PERSON_LABEL = "PER"
 
+    # components not needed to split sentences, with or without recognizing the author's name
+    SENTENCES_DISABLED = ["morphologizer", "attribute_ruler", "lemmatizer", "ner"]
+    AUTHOR_DISABLED = ["morphologizer", "attribute_ruler", "lemmatizer"]
+
+    # pages parsed at once while looking for the author
+    AUTHOR_BATCH_SIZE = 4
+
+    PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
     def __init__(
         self,
         nlp: Language,
         excluded_names: list[str] | None = None,
         topic_predictor: TopicPredictor | None = None,
+        workers: int = 1,
+        pool: ForkedProcessPool | None = None,
     ):
         """
         A PDF Reader that maps the document into a domain model.
@@ -71,9 +85,13 @@ class SpacyAssignmentReader(AssignmentReader):
         Args:
             nlp (Language): The Natural Language Processor.
             excluded_names (list[str] | None): A list of names to be excluded from the document.
+            workers (int): Number of processes that read the pages of a PDF. A single one reads them in process.
+                Forked on creation, so the reader must be created before any other thread starts.
+            pool (ForkedProcessPool | None): A process pool shared with the verifier, which forks the workers instead
+                once both registered.
         """
         if excluded_names is None:
-            self.excluded_names = [
+            excluded_names = [
                 "Dr",
                 "Ingeniero",
                 "Ing",
@@ -98,6 +116,8 @@ class SpacyAssignmentReader(AssignmentReader):
                 "SISTEMAS",
             ]
 
+        self.excluded_names = excluded_names
+
         self.exclude_from_name = [
             "Dr",
             "Ingeniero",
@@ -117,8 +137,17 @@ class SpacyAssignmentReader(AssignmentReader):
 
         self.nlp = nlp
 
+        # a trie of the excluded names' tokens, with and without a trailing period, e.g. "Ing."
+        self.excluded_matcher = PhraseMatcher(nlp.vocab)
+        self.excluded_matcher.add(
+            "EXCLUDED",
+            [nlp.make_doc(name + suffix) for name in self.excluded_names for suffix in ("", ".")],
+        )
+
         self.topic_predictor = topic_predictor
 
+        self.page_reader = ProcessPoolPageReader(self._parse_pages, workers, pool=pool) if workers > 1 else None
+
     def read(self, file: UploadFile) -> Assignment:
         assignment = Assignment(content=[], date=datetime.date.today(), author=UNKNOWN_AUTHOR, title=file.filename)
 
@@ -146,16 +175,20 @@ class SpacyAssignmentReader(AssignmentReader):
         Returns:
             Assignment: A mapped document.
         """
-        file_document = fitz.Document(stream=file.file.read(), filetype="pdf")
+        source = unspool(file.file)
 
-        pages: list[list[str]] = [self._parse_page(page.get_textpage().extractText()) for page in file_document]
-
-        author = self._find_out_author(file_document[0].get_textpage().extractText())
+        if self.page_reader:
+            pages, author = self.page_reader.read(source)
+        else:
+            file_document = open_pdf(source)
 
-        file_document.close()
+            try:
+                pages, author = self._parse_pages(extract_pages(file_document, 0, len(file_document)), 1)
+            finally:
+                file_document.close()
 
         return Assignment(
-            author=author,
+            author=author or UNKNOWN_AUTHOR,
             title=file.filename,
             content=[sentence for page in pages for sentence in page],
             date=datetime.date.today(),
@@ -171,24 +204,17 @@ class SpacyAssignmentReader(AssignmentReader):
         Returns:
             Assignment: A mapped document.
         """
-        # obtain the file as a stream compatible with python-docx Document
-        bytes_io = BytesIO()
-        bytes_io.write(file.file.read())
-
-        doc = docx.Document(bytes_io)
+        # python-docx reads the archive straight from the upload
+        doc = docx.Document(unspool(file.file))
 
         paragraphs = [p.text for p in doc.paragraphs if contains_letters_or_numbers(p.text)]
 
-        content = [sentence for paragraph in paragraphs for sentence in self._parse_page(paragraph)]
-
-        maybe_authors = [self._find_out_author(sentence) for sentence in content]
-
-        author = next(dropwhile(lambda name: name == UNKNOWN_AUTHOR, maybe_authors), UNKNOWN_AUTHOR)
+        pages, author = self._parse_pages(paragraphs, len(paragraphs))
 
         return Assignment(
-            author=author,
+            author=author or UNKNOWN_AUTHOR,
             title=file.filename,
-            content=content,
+            content=[sentence for page in pages for sentence in page],
             date=datetime.date.today(),
         )
 
@@ -202,42 +228,79 @@ class SpacyAssignmentReader(AssignmentReader):
         Returns:
             Assignment: A mapped document.
         """
+        source = unspool(file.file)
+        path = descriptor_path(source)
 
-        # create a temporary file with a specific name
-        with tempfile.NamedTemporaryFile(delete=False, prefix="temp_doc_", suffix=".doc") as temp_file:
-            temp_file.write(file.file.read())
-
-        text = pytextract.process(temp_file.name, extension="doc")
+        # antiword reads the upload where it is on disk, or a temporary copy of it while it is in memory
+        if path:
+            text = pytextract.process(path, extension="doc")
+        else:
+            with tempfile.NamedTemporaryFile(prefix="temp_doc_", suffix=".doc") as temp_file:
+                shutil.copyfileobj(source, temp_file)
+                temp_file.flush()
 
-        content = list(self._parse_page(text)) if text else []
+                text = pytextract.process(temp_file.name, extension="doc")
 
-        maybe_authors = list(self._find_out_author(sentence) for sentence in content) if text else []
+        # pytextract encodes the text it extracts
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
 
-        author = next(dropwhile(lambda name: name == UNKNOWN_AUTHOR, maybe_authors), UNKNOWN_AUTHOR)
+        # paragraphs are parsed apart, so that looking for the author stops at the first one naming somebody
+        paragraphs = [paragraph for paragraph in self.PARAGRAPH_BREAK.split(text or "") if paragraph.strip()]
 
-        temp_file.close()
-        os.remove(temp_file.name)
+        pages, author = self._parse_pages(paragraphs, len(paragraphs))
 
         return Assignment(
-            author=author,
+            author=author or UNKNOWN_AUTHOR,
             title=file.filename,
-            content=content,
+            content=[sentence for page in pages for sentence in page],
         )
 
-    def _parse_page(self, page_text: str) -> list[str]:
+    def _parse_pages(self, page_texts: list[str], author_pages: int) -> tuple[list[list[str]], str | None]:
         """
-        Parses string from a page into a list of sentences.
+        Parses the text of many pages, or paragraphs, into sentences in a single pass, streaming them through spaCy.
+
+        The leading pages are also parsed with the named entities recognizer, until one of them names the author, and
+        the remaining ones only split into sentences.
 
         Args:
-            page_text: the string to be parsed.
+            page_texts (list[str]): The text of each page.
+            author_pages (int): The number of leading pages the author is looked for in.
 
         Returns:
-            list[str]: A list of sentences.
+            tuple[list[list[str]], str | None]: The sentences of each page, and the author's name when found.
         """
+        texts = [page_text.replace("●", "") for page_text in page_texts]
+        pages: list[list[str]] = []
+        author = None
+
+        # small batches, so that few pages are parsed with the recognizer past the one naming the author
+        docs = self.nlp.pipe(
+            texts[:author_pages],
+            disable=self._disabled(self.AUTHOR_DISABLED),
+            batch_size=self.AUTHOR_BATCH_SIZE,
+        )
+
+        for doc in docs:
+            pages.append(self._sentences(doc))
+            author = self._author(doc)
+
+            if author:
+                break
 
-        # Parse the page text into a spacy document
-        doc = self.nlp(page_text.replace("●", ""))
+        docs = self.nlp.pipe(texts[len(pages) :], disable=self._disabled(self.SENTENCES_DISABLED))
+
+        return pages + [self._sentences(doc) for doc in docs], author
+
+    @staticmethod
+    def _sentences(doc: Doc) -> list[str]:
+        """
+        Args:
+            doc (Doc): A parsed page.
 
+        Returns:
+            list[str]: The normalized sentences of the page, split on line breaks.
+        """
         # Split the page text into sentences
         page_sentences = [normalize_sentence(str(s)) for s in doc.sents if contains_letters_or_numbers(str(s))]
 
@@ -245,36 +308,43 @@ class SpacyAssignmentReader(AssignmentReader):
 
         return [sentence for sublist in splits if sublist for sentence in sublist]
 
-    def _find_out_author(self, page_text: str) -> str:
+    def _author(self, doc: Doc) -> str | None:
         """
         Finds out the author of the assignment.
         It supposes that the document contains a page with the author's name on it.
 
         Args:
-            page_text: The first page of the assignment.
+            doc (Doc): A page parsed with the named entities recognizer.
 
         Returns:
-            str: The author's name.
+            str | None: The first person named in the page that is not excluded, None when there is none.
         """
-        page_text = page_text.replace("\n", " ")
+        for ent in doc.ents:
+            if ent.label_ != self.SPACY_PERSON_LABEL or self.excluded_matcher(ent):
+                continue
 
-        doc = self.nlp(page_text)
+            # the line breaks within a name become spaces
+            possible_name = " ".join(ent.text.split()).title()
 
-        names = [
-            ent.text.title()
-            for ent in doc.ents
-            if (ent.label_ == self.SPACY_PERSON_LABEL and not any(name in ent.text for name in self.excluded_names))
-        ]
+            for noun in self.exclude_from_name:
+                possible_name = possible_name.replace(noun, "")
+
+            if possible_name.strip():
+                return possible_name.strip()
 
-        possible_name = next(dropwhile(lambda name: name == UNKNOWN_AUTHOR, names), None)
+        return None
 
-        if not possible_name:
-            return UNKNOWN_AUTHOR
+    def _disabled(self, components: list[str]) -> list[str]:
+        """
+        Filters the components to disable down to the ones in the pipeline.
 
-        for noun in self.exclude_from_name:
-            possible_name = possible_name.replace(noun, "")
+        Args:
+            components (list[str]): The names of the components to disable.
 
-        return possible_name.strip()
+        Returns:
+            list[str]: The names of the components both given and in the pipeline.
+        """
+        return [name for name in components if name in self.nlp.pipe_names]
 
 
 class SklearnTopicPredictor(TopicPredictor):
@@ -15,8 +15,9 @@ class ClientFactory:
     def __init__(self, url):
         global client
 
+        # connects on the first operation, so that no thread runs yet when the worker forks its process pools
         if not client:
-            client = AsyncIOMotorClient(url, uuidRepresentation="standard")
+            client = AsyncIOMotorClient(url, uuidRepresentation="standard", connect=False)
 
         self._client = client
 
@@ -5,16 +5,28 @@ Repositories based on Motor engine for MongoDB.
 """
 
 
+import datetime
+from typing import BinaryIO, Iterable
+from uuid import UUID, uuid4
+
 from fastapi.encoders import jsonable_encoder
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from gridfs.errors import NoFile
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorGridFSBucket,
+)
+from pymongo import ReturnDocument
 
 from heimdallr.adapters.repository import (
     AsyncAssignmentRepository,
+    AsyncJobRepository,
     AsyncReadOnlyRepository,
     AsyncWriteOnlyRepository,
     T,
 )
-from heimdallr.domain.models.assignment import Assignment
+from heimdallr.domain.models.assignment import Assignment, AssignmentVerification
+from heimdallr.domain.models.job import Job, JobStatus, utcnow
 
 
 class MotorRepositoryMixin:
@@ -31,6 +43,7 @@ class MotorRepositoryMixin:
         """
         self.collection_name = model_factory.__name__.lower()
         self.collection: AsyncIOMotorCollection = client.get_database(db_name).get_collection(self.collection_name)
+        self.versions: AsyncIOMotorCollection = client.get_database(db_name).get_collection("versions")
         self.model_factory = model_factory
 
     def to_model(self, document: dict | None) -> T | None:
@@ -85,11 +98,20 @@ class MotorReadOnlyRepository(AsyncReadOnlyRepository, MotorRepositoryMixin):
 class MotorWriteOnlyRepository(AsyncWriteOnlyRepository, MotorRepositoryMixin):
     async def save(self, entity: T, *args, **kwargs) -> T:
         entry = jsonable_encoder(entity)
-        await self.collection.insert_one(entry)
+        # replaces a previous save, so that a retried job does not fail on its own partial work
+        await self.collection.replace_one({"_id": entry["_id"]}, entry, upsert=True)
+        await self._increment_version()
         return entity
 
     async def delete(self, entity: T, *args, **kwargs) -> None:
-        await self.collection.delete_one({"_id": entity.id})
+        await self.collection.delete_one({"_id": str(entity.id)})
+        await self._increment_version()
+
+    async def _increment_version(self) -> None:
+        """
+        Lets readers know the collection changed.
+        """
+        await self.versions.update_one({"_id": self.collection_name}, {"$inc": {"version": 1}}, upsert=True)
 
 
 class MotorAssignmentRepository(AsyncAssignmentRepository, MotorWriteOnlyRepository, MotorReadOnlyRepository):
@@ -99,3 +121,232 @@ class MotorAssignmentRepository(AsyncAssignmentRepository, MotorWriteOnlyReposit
 
     def __init__(self, client: AsyncIOMotorClient, db_name: str):
         super().__init__(client, db_name, Assignment)
+
+    async def save(self, entity: Assignment, *args, **kwargs) -> Assignment:
+        # a new revision on every save, so that the snapshots of other processes reload the assignment
+        entity.revision = uuid4()
+        return await super().save(entity, *args, **kwargs)
+
+    async def find_revisions(self) -> dict[UUID, UUID | None]:
+        """
+        Finds the revision of each assignment, projecting nothing but their ID and revision.
+
+        Returns:
+            dict[UUID, UUID | None]: The revision of each assignment, by ID.
+        """
+        cursor = self.collection.find({}, projection={"_id": 1, "revision": 1})
+
+        return {
+            UUID(str(entry["_id"])): UUID(entry["revision"]) if entry.get("revision") else None
+            async for entry in cursor
+        }
+
+    async def find_by_ids(self, ids: Iterable[UUID], exclude: Iterable[str] = ()) -> list[Assignment]:
+        """
+        Finds the assignments with the given IDs, in a single query.
+
+        Args:
+            ids (Iterable[UUID]): The assignment IDs.
+            exclude (Iterable[str]): Fields left out of the projection, so that they are neither sent nor parsed.
+
+        Returns:
+            list[Assignment]: The assignments found.
+        """
+        projection = {field: 0 for field in exclude} or None
+        cursor = self.collection.find({"_id": {"$in": [str(key) for key in ids]}}, projection=projection)
+
+        return [self.to_model(entry) async for entry in cursor]
+
+    async def version(self) -> int:
+        """
+        Reads the counter that saves and deletions increment, from the versions collection.
+
+        Returns:
+            int: The version of the assignment collection, zero when it was never written.
+        """
+        entry = await self.versions.find_one({"_id": self.collection_name})
+
+        return entry["version"] if entry else 0
+
+
+class MotorJobRepository(AsyncJobRepository, MotorWriteOnlyRepository, MotorReadOnlyRepository):
+    """
+    Motor repository implementation for the Job queue.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        super().__init__(client, db_name, Job)
+        # GridFS splits the uploaded files into chunks, well below the document size limit
+        self.uploads = AsyncIOMotorGridFSBucket(client.get_database(db_name), bucket_name="uploads")
+
+    async def save(self, entity: Job, *args, **kwargs) -> Job:
+        # keeps the times as dates, rather than encoding them as JSON, so that leases compare by time
+        entry = entity.model_dump(by_alias=True)
+        entry["_id"] = str(entity.id)
+        entry["batch_id"] = str(entity.batch_id) if entity.batch_id else None
+        entry["upload_id"] = str(entity.upload_id) if entity.upload_id else None
+        await self.collection.replace_one({"_id": entry["_id"]}, entry, upsert=True)
+        return entity
+
+    async def enqueue(self, job: Job, file: BinaryIO) -> Job:
+        upload_id = uuid4()
+        # the file is read by chunks in a thread, so that the event loop keeps serving requests
+        await self.uploads.upload_from_stream_with_id(str(upload_id), job.filename or str(upload_id), file)
+        return await self.save(job.model_copy(update={"upload_id": upload_id}))
+
+    async def read_upload(self, job: Job, destination: BinaryIO) -> None:
+        try:
+            await self.uploads.download_to_stream(str(job.upload_id), destination)
+        except NoFile as error:
+            raise FileNotFoundError(f"Job {job.id} holds no file.") from error
+
+    async def claim(self, worker: str, lease: datetime.timedelta, max_attempts: int) -> Job | None:
+        now = utcnow()
+        expired = {"status": JobStatus.RUNNING, "lease_until": {"$lt": now}}
+        exhausted = {**expired, "attempts": {"$gte": max_attempts}}
+        ids = [entry["_id"] async for entry in self.collection.find(exhausted, projection={"_id": 1})]
+
+        # the jobs out of attempts are over, as failed ones are, and so their files are deleted too
+        for job_id in ids:
+            entry = await self.collection.find_one_and_update(
+                {**exhausted, "_id": job_id},
+                {
+                    "$set": {
+                        "status": JobStatus.FAILED,
+                        "error": "Lease expired.",
+                        "lease_until": None,
+                        "upload_id": None,
+                        "finished_at": now,
+                        "updated_at": now,
+                    }
+                },
+                projection={"upload_id": 1},
+            )
+            await self._drop_upload(entry)
+
+        entry = await self.collection.find_one_and_update(
+            {"$or": [{"status": JobStatus.QUEUED}, expired]},
+            self._claimed(worker, now, lease),
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+        return self.to_model(entry)
+
+    async def claim_batch(self, batch_id: UUID, worker: str, lease: datetime.timedelta) -> list[Job]:
+        now = utcnow()
+        queued = {"batch_id": str(batch_id), "status": JobStatus.QUEUED}
+        ids = [entry["_id"] async for entry in self.collection.find(queued, projection={"_id": 1})]
+
+        # another worker may claim some of them in between, so only those still queued are taken
+        await self.collection.update_many({**queued, "_id": {"$in": ids}}, self._claimed(worker, now, lease))
+        cursor = self.collection.find({"_id": {"$in": ids}, "worker": worker, "started_at": now})
+
+        return [self.to_model(entry) async for entry in cursor]
+
+    @staticmethod
+    def _claimed(worker: str, now: datetime.datetime, lease: datetime.timedelta) -> dict:
+        """
+        Args:
+            worker (str): The claiming worker.
+            now (datetime.datetime): When the job is claimed.
+            lease (datetime.timedelta): How long the worker holds the job.
+
+        Returns:
+            dict: The update that leases a job to a worker, resetting the progress of any previous attempt.
+        """
+        return {
+            "$set": {
+                "status": JobStatus.RUNNING,
+                "worker": worker,
+                "lease_until": now + lease,
+                "updated_at": now,
+                "started_at": now,
+                "compared": 0,
+                "total": 0,
+                "similarities": [],
+            },
+            "$inc": {"attempts": 1},
+        }
+
+    async def renew(self, job_id: UUID, worker: str, lease: datetime.timedelta) -> bool:
+        now = utcnow()
+        result = await self.collection.update_one(
+            {"_id": str(job_id), "worker": worker, "status": JobStatus.RUNNING},
+            {"$set": {"lease_until": now + lease, "updated_at": now}},
+        )
+
+        return result.matched_count == 1
+
+    async def report(
+        self,
+        job_id: UUID,
+        worker: str,
+        compared: int,
+        total: int,
+        similarities: list[AssignmentVerification],
+    ) -> None:
+        await self.collection.update_one(
+            {"_id": str(job_id), "worker": worker, "status": JobStatus.RUNNING},
+            {
+                "$set": {
+                    "compared": compared,
+                    "total": total,
+                    "similarities": jsonable_encoder(similarities),
+                    "updated_at": utcnow(),
+                }
+            },
+        )
+
+    async def find_status(self, job_id: UUID) -> Job | None:
+        entry = await self.collection.find_one({"_id": str(job_id)})
+
+        return self.to_model(entry)
+
+    async def complete(self, job_id: UUID, worker: str) -> None:
+        now = utcnow()
+        # the job as it was before the update, still referencing its file
+        entry = await self.collection.find_one_and_update(
+            {"_id": str(job_id), "worker": worker},
+            {
+                "$set": {
+                    "status": JobStatus.DONE,
+                    "lease_until": None,
+                    "upload_id": None,
+                    "updated_at": now,
+                    "finished_at": now,
+                }
+            },
+            projection={"upload_id": 1},
+        )
+        await self._drop_upload(entry)
+
+    async def fail(self, job_id: UUID, worker: str, error: str, retry: bool) -> None:
+        update = {"status": JobStatus.QUEUED if retry else JobStatus.FAILED, "lease_until": None, "error": error}
+
+        if not retry:
+            update["upload_id"], update["finished_at"] = None, utcnow()
+
+        entry = await self.collection.find_one_and_update(
+            {"_id": str(job_id), "worker": worker},
+            {"$set": {**update, "updated_at": utcnow()}},
+            projection={"upload_id": 1},
+        )
+
+        if not retry:
+            await self._drop_upload(entry)
+
+    async def _drop_upload(self, entry: dict | None) -> None:
+        """
+        Deletes the uploaded file of a job that is over, which no attempt needs anymore.
+
+        Args:
+            entry (dict | None): The job document, as it was before it was over.
+        """
+        if not entry or not entry.get("upload_id"):
+            return
+
+        try:
+            await self.uploads.delete(entry["upload_id"])
+        except NoFile:
+            pass
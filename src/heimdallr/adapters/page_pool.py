@@ -0,0 +1,190 @@
+"""
+Process Pool Page Reader.
+
+Extracting the text of a PDF page and splitting it into sentences are both CPU bound, and a thesis holds hundreds of
+pages. This pool forks worker processes that inherit the already loaded language model, and hands each worker the path
+of the PDF on disk and a range of pages: the worker opens its own PyMuPDF handle over the file, extracts the text of its
+pages and parses them with a single nlp.pipe call, so only the path, the page numbers and the resulting sentences are
+pickled, and the PDF itself is never copied.
+
+The workers are forked as soon as the pool is created, unless it shares the process pool of the vectorizer, which forks
+them once both registered. Either must happen before the process starts any other thread: a thread holding a lock while
+the process forks leaves it held forever in the child.
+
+PDFs are opened straight from the upload: by the path of its descriptor once it is on disk, or from the bytes of its
+in-memory buffer.
+
+See Also:
+    https://pymupdf.readthedocs.io/en/latest/recipes-multiprocessing.html
+"""
+import io
+import shutil
+import tempfile
+from typing import BinaryIO, Callable
+
+import fitz
+
+from heimdallr.utils.process_pool import ForkedProcessPool
+from heimdallr.utils.uploads import descriptor_path
+
+ParsePages = Callable[[list[str], int], tuple[list[list[str]], str | None]]
+
+_parse_pages: ParsePages | None = None
+
+
+def _init_worker(parse_pages: ParsePages) -> None:
+    """
+    Keeps the page parser inherited by a forked worker.
+
+    Args:
+        parse_pages (ParsePages): Splits page texts into sentences, and finds out the author from the first one.
+    """
+    global _parse_pages
+    _parse_pages = parse_pages
+
+
+def open_pdf(file: BinaryIO) -> fitz.Document:
+    """
+    Opens a PDF without copying it.
+
+    Args:
+        file (BinaryIO): The PDF file, as returned by unspool.
+
+    Returns:
+        fitz.Document: The open PDF.
+    """
+    path = descriptor_path(file)
+
+    if path:
+        return fitz.Document(path, filetype="pdf")
+
+    # PyMuPDF takes the bytes a BytesIO holds, rather than a copy of them
+    return fitz.Document(stream=file if isinstance(file, io.BytesIO) else file.read(), filetype="pdf")
+
+
+def extract_pages(document: fitz.Document, start: int, end: int) -> list[str]:
+    """
+    Args:
+        document (fitz.Document): An open PDF.
+        start (int): The number of the first page.
+        end (int): The number past the last page.
+
+    Returns:
+        list[str]: The text of each page.
+    """
+    return [document[number].get_textpage().extractText() for number in range(start, end)]
+
+
+def _read_chunk(path: str, start: int, end: int) -> tuple[list[list[str]], str | None]:
+    """
+    Reads a range of pages of the PDF on disk.
+
+    Args:
+        path (str): The path of the PDF.
+        start (int): The number of the first page.
+        end (int): The number past the last page.
+
+    Returns:
+        tuple[list[list[str]], str | None]: The sentences of each page, and the author when the range holds the first
+            page.
+    """
+    if _parse_pages is None:
+        raise RuntimeError("The worker was not initialized.")
+
+    document = fitz.Document(path, filetype="pdf")
+
+    try:
+        texts = extract_pages(document, start, end)
+    finally:
+        document.close()
+
+    return _parse_pages(texts, 1 if start == 0 else 0)
+
+
+class ProcessPoolPageReader:
+    """
+    Reads the pages of a PDF across forked worker processes.
+    """
+
+    def __init__(
+        self,
+        parse_pages: ParsePages,
+        workers: int,
+        chunk_size: int = 8,
+        pool: ForkedProcessPool | None = None,
+    ):
+        """
+        Args:
+            parse_pages (ParsePages): Splits page texts into sentences, and finds out the author from the first one.
+                Inherited by every worker.
+            workers (int): Number of worker processes, unless the pool is shared.
+            chunk_size (int): Pages per task. Documents with fewer pages than this are read in the calling process.
+            pool (ForkedProcessPool | None): A process pool shared with the vectorizer, whose workers are forked once
+                every user registered. None forks a pool of its own on creation.
+        """
+        self.parse_pages = parse_pages
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool = pool or ForkedProcessPool(workers)
+        self._pool.register(_init_worker, parse_pages)
+
+        if pool is None:
+            self._pool.start()
+
+    def read(self, file: BinaryIO) -> tuple[list[list[str]], str | None]:
+        """
+        Splits every page of a PDF into sentences.
+
+        Args:
+            file (BinaryIO): The PDF file, as returned by unspool.
+
+        Returns:
+            tuple[list[list[str]], str | None]: The sentences of each page, in order, and the author found out from the
+                first page.
+        """
+        document = open_pdf(file)
+
+        try:
+            pages = len(document)
+
+            if pages <= self.chunk_size:
+                return self.parse_pages(extract_pages(document, 0, pages), 1)
+        finally:
+            document.close()
+
+        path = descriptor_path(file)
+
+        if path:
+            return self._read_chunks(path, pages)
+
+        # a file only in memory is written to disk once, rather than sent to every worker
+        with tempfile.NamedTemporaryFile(prefix="temp_pdf_", suffix=".pdf") as temp_file:
+            file.seek(0)
+            shutil.copyfileobj(file, temp_file)
+            temp_file.flush()
+
+            return self._read_chunks(temp_file.name, pages)
+
+    def _read_chunks(self, path: str, pages: int) -> tuple[list[list[str]], str | None]:
+        """
+        Args:
+            path (str): The path of a PDF on disk.
+            pages (int): The number of pages of the PDF.
+
+        Returns:
+            tuple[list[list[str]], str | None]: The sentences of each page, in order, and the author found out from the
+                first page.
+        """
+        futures = [
+            self._pool.submit(_read_chunk, path, start, min(start + self.chunk_size, pages))
+            for start in range(0, pages, self.chunk_size)
+        ]
+        chunks = [future.result() for future in futures]
+
+        return [page for chunk_pages, _ in chunks for page in chunk_pages], chunks[0][1]
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        self._pool.shutdown()
@@ -2,9 +2,16 @@
 This module abstracts the Database layer with a Repository pattern.
 """
 import abc
-from typing import TypeVar
+import datetime
+from typing import BinaryIO, Iterable, TypeVar
+from uuid import UUID
 
-from heimdallr.domain.models.assignment import BaseDocument
+from heimdallr.domain.models.assignment import (
+    Assignment,
+    AssignmentVerification,
+    BaseDocument,
+)
+from heimdallr.domain.models.job import Job
 
 T = TypeVar("T", bound=BaseDocument)
 
@@ -133,3 +140,177 @@ class AsyncAssignmentRepository(AsyncRepository, abc.ABC):
     """
     Abstract Base Class for Assignment Repository implementations.
     """
+
+    @abc.abstractmethod
+    async def find_revisions(self) -> dict[UUID, UUID | None]:
+        """
+        Finds the revision of each entity, i.e. which of its saves is stored, without loading them.
+
+        Returns:
+            dict[UUID, UUID | None]: The revision of each entity, by ID. None for those saved before revisions.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def find_by_ids(self, ids: Iterable[UUID], exclude: Iterable[str] = ()) -> list[Assignment]:
+        """
+        Finds the assignments with the given IDs.
+
+        Args:
+            ids (Iterable[UUID]): The assignment IDs.
+            exclude (Iterable[str]): Fields not worth loading, left to their defaults.
+
+        Returns:
+            list[Assignment]: The assignments found.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def version(self) -> int:
+        """
+        Returns:
+            int: A number that increases every time an entity is saved or deleted.
+        """
+        raise NotImplementedError
+
+
+class AsyncJobRepository(AsyncRepository, abc.ABC):
+    """
+    Abstract Base Class for Job Queue implementations.
+
+    Workers claim queued jobs under a lease, which they renew while they work. When a worker dies, its lease expires
+    and another worker claims the job again.
+    """
+
+    @abc.abstractmethod
+    async def enqueue(self, job: Job, file: BinaryIO) -> Job:
+        """
+        Queues a job, keeping its uploaded file apart, since it may well be larger than a job document can be.
+
+        Args:
+            job (Job): A new job.
+            file (BinaryIO): The uploaded file, read from its current position.
+
+        Returns:
+            Job: The queued job, referencing its file.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def read_upload(self, job: Job, destination: BinaryIO) -> None:
+        """
+        Writes the uploaded file of a job into another file.
+
+        Args:
+            job (Job): A claimed job.
+            destination (BinaryIO): The file to write to.
+
+        Raises:
+            FileNotFoundError: When the job holds no file.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def claim(self, worker: str, lease: datetime.timedelta, max_attempts: int) -> Job | None:
+        """
+        Atomically takes the oldest job that is queued, or whose lease expired.
+
+        Jobs whose lease expired after their last allowed attempt are marked as failed instead, and their files deleted.
+
+        Args:
+            worker (str): The claiming worker.
+            lease (datetime.timedelta): How long the worker holds the job before it must renew the lease.
+            max_attempts (int): How many times a job may be claimed.
+
+        Returns:
+            Job | None: The claimed job, or None when there is nothing to do.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def claim_batch(self, batch_id: UUID, worker: str, lease: datetime.timedelta) -> list[Job]:
+        """
+        Atomically takes the queued jobs of a batch, so that the worker verifies them together.
+
+        Args:
+            batch_id (UUID): The batch ID.
+            worker (str): The claiming worker.
+            lease (datetime.timedelta): How long the worker holds the jobs before it must renew their leases.
+
+        Returns:
+            list[Job]: The claimed jobs, which may be none when other workers took them first.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def renew(self, job_id: UUID, worker: str, lease: datetime.timedelta) -> bool:
+        """
+        Extends the lease of a running job.
+
+        Args:
+            job_id (UUID): The job ID.
+            worker (str): The worker holding the job.
+            lease (datetime.timedelta): How long from now the worker keeps holding the job.
+
+        Returns:
+            bool: False when the worker no longer holds the job.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def report(
+        self,
+        job_id: UUID,
+        worker: str,
+        compared: int,
+        total: int,
+        similarities: list[AssignmentVerification],
+    ) -> None:
+        """
+        Records the progress of a running job.
+
+        Args:
+            job_id (UUID): The job ID.
+            worker (str): The worker holding the job.
+            compared (int): How many stored assignments the verification already settled.
+            total (int): How many stored assignments the verification settles.
+            similarities (list[AssignmentVerification]): The plagiarized assignments found so far.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def find_status(self, job_id: UUID) -> Job | None:
+        """
+        Finds a job, to report its status.
+
+        Args:
+            job_id (UUID): The job ID.
+
+        Returns:
+            Job | None: The job, or None when not found.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def complete(self, job_id: UUID, worker: str) -> None:
+        """
+        Marks a running job as done, and drops its file.
+
+        Args:
+            job_id (UUID): The job ID.
+            worker (str): The worker holding the job.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def fail(self, job_id: UUID, worker: str, error: str, retry: bool) -> None:
+        """
+        Releases a running job that failed, dropping its file when it failed for good.
+
+        Args:
+            job_id (UUID): The job ID.
+            worker (str): The worker holding the job.
+            error (str): What went wrong.
+            retry (bool): Whether to queue the job again, or mark it as failed for good.
+        """
+        raise NotImplementedError
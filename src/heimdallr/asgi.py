@@ -6,8 +6,8 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
-from heimdallr.dependencies import get_nlp, get_topic_predictor
-from heimdallr.router import api_router_v1, root_router
+from heimdallr.entrypoint.middleware import UploadLimitMiddleware
+from heimdallr.router import api_router_v1, api_v1_prefix, root_router
 from heimdallr.settings.api_settings import ApplicationSettings
 
 log = logging.getLogger("uvicorn.error")
@@ -21,9 +21,6 @@ async def on_startup():
         1. https://fastapi.tiangolo.com/advanced/events/#startup-event
     """
     log.debug("Execute FastAPI startup event handler.")
-    nlp = get_nlp()
-    get_topic_predictor(natural_language_processor=nlp)
-    log.debug("Natural Language Processor loaded", extra={"nlp": nlp.meta})
 
 
 async def on_shutdown():
@@ -94,6 +91,13 @@ def get_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if settings.MAX_UPLOAD_SIZE or settings.MAX_BATCH_UPLOAD_SIZE:
+        app.add_middleware(
+            UploadLimitMiddleware,
+            max_size=settings.MAX_UPLOAD_SIZE,
+            limits={f"{api_v1_prefix}/assignments/batch": settings.MAX_BATCH_UPLOAD_SIZE},
+        )
+
     log.debug("Add application routes.")
     app.include_router(root_router)
     app.include_router(api_router_v1)
@@ -17,14 +17,22 @@ from heimdallr.adapters.assignment_reader import (
 from heimdallr.adapters.db import ClientFactory
 from heimdallr.adapters.motor_repositories import (  # type: ignore[attr-defined]
     MotorAssignmentRepository,
+    MotorJobRepository,
 )
-from heimdallr.adapters.repository import AsyncAssignmentRepository
+from heimdallr.adapters.repository import AsyncAssignmentRepository, AsyncJobRepository
+from heimdallr.service_layer.assignment_searcher import AssignmentSearcher
+from heimdallr.service_layer.assignment_vectors import AssignmentVectors
 from heimdallr.service_layer.assignment_verifier import (
     AssignmentVerifier,
     SpacyAssignmentVerifier,
 )
+from heimdallr.service_layer.corpus import CorpusSnapshot
+from heimdallr.service_layer.corpus_index import CorpusIndex
+from heimdallr.service_layer.lexical_gate import LexicalGate
+from heimdallr.service_layer.sentence_comparer import SentenceComparer
 from heimdallr.settings.api_settings import ApplicationSettings
 from heimdallr.settings.mongo_settings import MongoSettings
+from heimdallr.utils.process_pool import ForkedProcessPool
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -68,6 +76,28 @@ def get_nlp() -> spacy.Language:
 
 NLPDependency = Annotated[spacy.Language, Depends(get_nlp)]
 
+########################################################################################################################
+# Process Pool
+########################################################################################################################
+
+process_pool: ForkedProcessPool | None = None
+
+
+def get_process_pool() -> ForkedProcessPool:
+    """
+    Returns the Process Pool shared by the reader and the verifier, which must be started once both are created.
+    """
+    global process_pool
+
+    if process_pool is None:
+        settings = ApplicationSettings()
+        process_pool = ForkedProcessPool(workers=max(settings.READER_WORKERS, settings.VERIFIER_WORKERS))
+
+    return process_pool
+
+
+ProcessPoolDependency = Annotated[ForkedProcessPool, Depends(get_process_pool)]
+
 
 ########################################################################################################################
 # Assignment Reader
@@ -104,6 +134,7 @@ TopicPredictorDependency = Annotated[TopicPredictor | None, Depends(get_topic_pr
 def get_assignment_reader(
     natural_language_processor: NLPDependency,
     predictor: TopicPredictorDependency,
+    pool: ProcessPoolDependency,
 ) -> AssignmentReader:
     """
     Returns the Assignment Reader.
@@ -111,7 +142,13 @@ def get_assignment_reader(
     global pdf_assignment_reader
 
     if pdf_assignment_reader is None:
-        pdf_assignment_reader = SpacyAssignmentReader(nlp=natural_language_processor, topic_predictor=predictor)
+        settings = ApplicationSettings()
+        pdf_assignment_reader = SpacyAssignmentReader(
+            nlp=natural_language_processor,
+            topic_predictor=predictor,
+            workers=settings.READER_WORKERS,
+            pool=pool,
+        )
 
     return pdf_assignment_reader
 
@@ -139,6 +176,50 @@ def get_assignment_repository(client_factory: ClientFactoryDependency) -> AsyncA
 
 AssignmentRepositoryDependency = Annotated[AsyncAssignmentRepository, Depends(get_assignment_repository)]
 
+########################################################################################################################
+# Job Repository
+########################################################################################################################
+
+job_repository: AsyncJobRepository | None = None
+
+
+def get_job_repository(client_factory: ClientFactoryDependency) -> AsyncJobRepository:
+    """
+    Returns the Job Repository.
+    """
+    global job_repository
+
+    if job_repository is None:
+        job_repository = MotorJobRepository(client=client_factory(), db_name=mongo_settings.DATABASE)
+
+    return job_repository
+
+
+JobRepositoryDependency = Annotated[AsyncJobRepository, Depends(get_job_repository)]
+
+########################################################################################################################
+# Corpus Snapshot
+########################################################################################################################
+
+corpus_snapshot: CorpusSnapshot | None = None
+
+
+def get_corpus_snapshot(assignment_repo: AssignmentRepositoryDependency) -> CorpusSnapshot:
+    """
+    Returns the process resident Corpus Snapshot.
+    """
+    global corpus_snapshot
+
+    if corpus_snapshot is None:
+        # the vector store holds the sentence vectors, so they are not worth loading
+        exclude = ["vectors"] if ApplicationSettings().VECTOR_STORE_PATH else None
+        corpus_snapshot = CorpusSnapshot(repository=assignment_repo, exclude=exclude)
+
+    return corpus_snapshot
+
+
+CorpusSnapshotDependency = Annotated[CorpusSnapshot, Depends(get_corpus_snapshot)]
+
 
 ########################################################################################################################
 # Assignment Verifier
@@ -151,6 +232,8 @@ def get_assignment_verifier(
     reader: AssignmentReaderDependency,
     assignment_repo: AssignmentRepositoryDependency,
     natural_language_processor: NLPDependency,
+    corpus: CorpusSnapshotDependency,
+    pool: ProcessPoolDependency,
 ) -> AssignmentVerifier:
     """
     Returns the Assignment Verifier.
@@ -159,12 +242,42 @@ def get_assignment_verifier(
 
     if assignment_verifier is None:
         settings = ApplicationSettings()
+        comparer = SentenceComparer(
+            LexicalGate(settings.MIN_LENGTH_RATIO, settings.MIN_TOKEN_OVERLAP),
+            threshold=settings.SIMILARITY_THRESHOLD,
+        )
+        vectors = AssignmentVectors(
+            nlp=natural_language_processor,
+            comparer=comparer,
+            workers=settings.VERIFIER_WORKERS,
+            batch_size=settings.EMBEDDING_BATCH_SIZE,
+            cache_size=settings.VECTOR_CACHE_SIZE,
+            store_path=settings.VECTOR_STORE_PATH,
+            quantization=settings.VECTOR_STORE_QUANTIZATION,
+            pool=pool,
+        )
+        index = CorpusIndex(
+            vectors=vectors,
+            neighbours=settings.SENTENCE_NEIGHBOURS,
+            boilerplate_cutoff=settings.BOILERPLATE_CUTOFF,
+            min_passage_words=settings.MIN_PASSAGE_WORDS,
+        )
+        searcher = AssignmentSearcher(
+            index=index,
+            comparer=comparer,
+            duplicate_threshold=settings.DUPLICATE_THRESHOLD,
+            verbatim_threshold=settings.VERBATIM_THRESHOLD,
+            max_matches=settings.MAX_MATCHES,
+            topic_fallback=settings.TOPIC_FALLBACK,
+            detect_plagiarism=settings.DETECT_PLAGIARISM,
+        )
         assignment_verifier = SpacyAssignmentVerifier(
             reader=reader,
             repository=assignment_repo,
-            nlp=natural_language_processor,
-            similarity_threshold=settings.SIMILARITY_THRESHOLD,
-            detect_plagiarism=settings.DETECT_PLAGIARISM,
+            searcher=searcher,
+            corpus=corpus,
+            executor_threads=settings.EXECUTOR_THREADS,
+            extraction_cache_path=settings.EXTRACTION_CACHE_PATH,
         )
 
     return assignment_verifier
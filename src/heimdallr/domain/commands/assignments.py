@@ -17,3 +17,4 @@ class VerifyAssignment:
     # pylint: disable=invalid-name
     id: UUID4 = Field(description="UUID", example="123e4567-e89b-12d3-a456-426614174000", default_factory=uuid4)
     file: UploadFile = Field(description="Assignment's File")
+    sha256: str | None = Field(description="SHA-256 hash of the file", default=None)
@@ -30,6 +30,17 @@ class SentenceCompared(CamelCaseModel):
         )
 
 
+class PassageCompared(CamelCaseModel):
+    """
+    Passage compared event.
+    """
+
+    present: str = Field(description="Present passage.", example="the end of a sentence. And the next one")
+    compared: str = Field(description="Compared passage.", example="the end of a sentence. And the next one")
+    position: int = Field(description="Position of the compared sentence where the passage starts.", example=0)
+    words: int = Field(description="Number of words of the passage.", example=9)
+
+
 class AssignmentCompared(CamelCaseModel):
     """
     Assignment compared event.
@@ -39,6 +50,7 @@ class AssignmentCompared(CamelCaseModel):
     author: str | None = Field(description="Assignment's author.", example="John Doe", default=UNKNOWN_AUTHOR)
     plagiarism: float = Field(description="Average Plagiarism percentage.", example=0.0, default=0.0)
     similarities: list[SentenceCompared] = Field(description="Similarities found.", example=[], default_factory=list)
+    passages: list[PassageCompared] = Field(description="Shared passages found.", example=[], default_factory=list)
 
 
 class AssignmentVerified(CamelCaseModel):
@@ -72,3 +84,20 @@ class JobScheduled(CamelCaseModel):
 
     id: UUID4 = Field(description="Job's ID.", example="123e4567-e89b-12d3-a466-426614174000", default_factory=uuid4)
     message: str = Field(description="Job's message.", example="Job scheduled.")
+
+
+class JobReported(CamelCaseModel):
+    """
+    Job reported event.
+    """
+
+    id: UUID4 = Field(description="Job's ID.", example="123e4567-e89b-12d3-a466-426614174000")
+    status: str = Field(description="Job's status: queued, running, done or failed.", example="running")
+    attempts: int = Field(description="Times a worker claimed the job.", example=1, default=0)
+    compared: int = Field(description="Assignments compared so far.", example=120, default=0)
+    total: int = Field(description="Assignments to compare.", example=480, default=0)
+    elapsed: float | None = Field(description="Seconds the last attempt has been running.", example=12.5, default=None)
+    error: str | None = Field(description="Last failure.", example=None, default=None)
+    similarities: list[AssignmentCompared] = Field(
+        description="Plagiarism results found so far.", example=[], default_factory=list
+    )
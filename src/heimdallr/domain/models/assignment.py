@@ -60,6 +60,23 @@ class ComparisonResult(BaseModel):
     plagiarism: float
 
 
+class PassageResult(BaseModel):
+    """
+    A passage shared by two assignments.
+
+    Attributes:
+        present (str): stored passage.
+        compared (str): assignment passage.
+        position (int): position of the assignment sentence where the passage starts.
+        words (int): number of words of the passage.
+    """
+
+    present: str
+    compared: str
+    position: int
+    words: int
+
+
 class AssignmentVerification(BaseModel):
     """
     A comparison result.
@@ -69,12 +86,14 @@ class AssignmentVerification(BaseModel):
         author (str): The compared Assignment Author.
         plagiarism (float): plagiarism percentage.
         similarities (list[ComparisonResult]): The comparison results.
+        passages (list[PassageResult]): The shared passages.
     """
 
     id: UUID4
     author: str | None = UNKNOWN_AUTHOR
     plagiarism: float
     similarities: list[ComparisonResult] = []
+    passages: list[PassageResult] = []
 
 
 class Assignment(BaseDocument):
@@ -86,6 +105,12 @@ class Assignment(BaseDocument):
         author (str): Name of the author of the assignment.
         content (list[Page]): Pages of paragraphs.
         date (datetime.date): Issue date of the assignment.
+        vectors (list[list[float]]): An embedding vector for each sentence in content.
+        document_vector (list[float]): An embedding vector for the whole content.
+        vectors_model (str): The language model that produced the vectors.
+        minhash (list[int]): MinHash signature of the content word shingles.
+        sha256 (str): SHA-256 hash of the file the assignment was read from.
+        revision (UUID): A new ID on every save of the assignment, telling its copies apart from the stored one.
     """
 
     title: str = "Unknown"
@@ -94,6 +119,12 @@ class Assignment(BaseDocument):
     content: list[str]
     date: datetime.date | None = None
     similarities: list[AssignmentVerification] | None = None
+    vectors: list[list[float]] | None = None
+    document_vector: list[float] | None = None
+    vectors_model: str | None = None
+    minhash: list[int] | None = None
+    sha256: str | None = None
+    revision: UUID | None = None
 
     def __eq__(self, other) -> bool:
         """
@@ -0,0 +1,92 @@
+"""
+Job.
+"""
+import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import Field
+
+from heimdallr.domain.models.assignment import AssignmentVerification, BaseDocument
+
+
+def utcnow() -> datetime.datetime:
+    """
+    Returns:
+        datetime.datetime: The current UTC time, naive and to the millisecond as MongoDB stores it.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    return now.replace(tzinfo=None, microsecond=now.microsecond // 1000 * 1000)
+
+
+class JobStatus(str, Enum):
+    """
+    Lifecycle of a verification job.
+
+    See Also:
+        https://www.cosmicpython.com/blog/2020-10-27-i-hate-enums.html
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __str__(self) -> str:
+        return str.__str__(self)
+
+
+class Job(BaseDocument):
+    """
+    A queued assignment verification.
+
+    Its ID is also the ID of the assignment it verifies.
+
+    Attributes:
+        status (JobStatus): Where the job is in its lifecycle.
+        filename (str | None): The uploaded file name.
+        content_type (str | None): The uploaded file content type.
+        upload_id (UUID | None): The ID of the uploaded file, stored apart from the job and dropped once it is done.
+        sha256 (str | None): The SHA-256 hash of the uploaded file.
+        batch_id (UUID | None): The batch of files submitted together, which are verified together.
+        attempts (int): How many times a worker claimed the job.
+        worker (str | None): The worker holding the job.
+        lease_until (datetime.datetime | None): When the worker lease expires, and another worker may claim the job.
+        error (str | None): The last failure.
+        compared (int): How many stored assignments the running verification already settled.
+        total (int): How many stored assignments the running verification settles.
+        similarities (list[AssignmentVerification]): The plagiarized assignments found so far.
+        created_at (datetime.datetime): When the job was queued.
+        updated_at (datetime.datetime): When the job last changed.
+        started_at (datetime.datetime | None): When the last attempt started.
+        finished_at (datetime.datetime | None): When the job was done, or failed for good.
+    """
+
+    status: JobStatus = JobStatus.QUEUED
+    filename: str | None = None
+    content_type: str | None = None
+    upload_id: UUID | None = None
+    sha256: str | None = None
+    batch_id: UUID | None = None
+    attempts: int = 0
+    worker: str | None = None
+    lease_until: datetime.datetime | None = None
+    error: str | None = None
+    compared: int = 0
+    total: int = 0
+    similarities: list[AssignmentVerification] = []
+    created_at: datetime.datetime = Field(default_factory=utcnow)
+    updated_at: datetime.datetime = Field(default_factory=utcnow)
+    started_at: datetime.datetime | None = None
+    finished_at: datetime.datetime | None = None
+
+    @property
+    def elapsed(self) -> datetime.timedelta | None:
+        """
+        How long the last attempt has been running, or took. None until the job is claimed.
+        """
+        if self.started_at is None:
+            return None
+
+        return (self.finished_at or utcnow()) - self.started_at
@@ -10,7 +10,7 @@ making your API more robust and reliable. Schemas can also be used to generate O
 which can help both developers and consumers of your API understand its capabilities.
 """
 
-from typing import Any, Generic, Literal, TypeVar
+from typing import Any, Generic, Literal, Sequence, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -55,7 +55,8 @@ class CamelCaseModel(BaseModel):
         )
 
 
-S = TypeVar("S", bound=CamelCaseModel)
+# a list of models may be declared as is, e.g. ResponseModel[list[Model]]
+S = TypeVar("S", bound=CamelCaseModel | Sequence[CamelCaseModel])
 
 
 class ResponseModel(CamelCaseModel, Generic[S]):
@@ -0,0 +1,63 @@
+"""
+Middleware.
+"""
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class UploadLimitMiddleware:
+    """
+    Rejects the requests whose body is larger than a maximum size, while it streams in, before it is spooled.
+
+    A declared Content-Length over the limit is rejected without reading the body. Otherwise, the body is counted as it
+    is received, and the request fails as soon as it goes over the limit, e.g. when it is sent in chunks.
+
+    Some paths may have a limit of their own, e.g. the batch uploads of a whole class.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int | None, limits: dict[str, int | None] | None = None):
+        """
+        Args:
+            app (ASGIApp): The application.
+            max_size (int | None): The maximum size of a request body, in bytes. None does not limit it.
+            limits (dict[str, int | None] | None): The maximum size of the request bodies of some paths, instead of the
+                default one, by path.
+        """
+        self.app = app
+        self.max_size = max_size
+        self.limits = limits or {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        max_size = self.limits.get(scope["path"], self.max_size) if scope["type"] == "http" else None
+
+        if max_size is None:
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"The upload is larger than {max_size} bytes."
+        length = Headers(scope=scope).get("content-length", "")
+
+        if length.isdigit() and int(length) > max_size:
+            response = JSONResponse({"detail": detail}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received
+
+            message = await receive()
+
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+
+                # handled by the application, as any other HTTP error raised while parsing the body
+                if received > max_size:
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+            return message
+
+        await self.app(scope, receive_limited, send)
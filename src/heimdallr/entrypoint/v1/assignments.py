@@ -1,31 +1,29 @@
 """
 Assignments Entry Point.
 """
+import asyncio
+import hashlib
 import logging
-from typing import Annotated
-
-from fastapi import (
-    APIRouter,
-    BackgroundTasks,
-    File,
-    HTTPException,
-    Path,
-    UploadFile,
-    status,
-)
+import os
+import tempfile
+import zipfile
+from typing import Annotated, BinaryIO, cast
+from uuid import uuid4
+
+from fastapi import APIRouter, File, HTTPException, Path, UploadFile, status
 from pydantic import UUID4
 
 from heimdallr.dependencies import (
     AssignmentRepositoryDependency,
-    AssignmentVerifierDependency,
+    JobRepositoryDependency,
 )
-from heimdallr.domain.commands.assignments import VerifyAssignment
 from heimdallr.domain.events.assignments import (
     AssignmentStored,
     AssignmentVerified,
     JobScheduled,
 )
 from heimdallr.domain.models.assignment import Assignment
+from heimdallr.domain.models.job import Job
 from heimdallr.domain.schemas import ResponseModel
 from heimdallr.utils import content_type
 
@@ -37,12 +35,154 @@ supported_content_types = [
     content_type.APPLICATION_DOCX,
 ]
 
+archive_content_types = [
+    content_type.APPLICATION_ZIP,
+    content_type.APPLICATION_ZIP_COMPRESSED,
+]
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# an archive is inflated in full, so it must not hold more than a class worth of files, nor inflate to much more
+MAX_ARCHIVE_FILES = 500
+MAX_ARCHIVE_SIZE = 512 * 1024 * 1024
+MAX_COMPRESSION_RATIO = 100
+
+
+async def hash_upload(file: UploadFile) -> str:
+    """
+    Hashes an uploaded file chunk by chunk, where it was spooled, and rewinds it to be enqueued as is.
+
+    Args:
+        file (UploadFile): An uploaded file.
+
+    Returns:
+        str: The SHA-256 hash of the file.
+    """
+    digest = hashlib.sha256()
+
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        digest.update(chunk)
+
+    await file.seek(0)
+
+    return digest.hexdigest()
+
+
+def archived_files(archive: zipfile.ZipFile) -> list[tuple[str, str, zipfile.ZipInfo]]:
+    """
+    Lists the supported files of a ZIP archive, skipping folders and any other file, and rejects the archives that
+    would inflate to too many or too large files, e.g. ZIP bombs, before inflating anything.
+
+    Args:
+        archive (zipfile.ZipFile): A ZIP archive.
+
+    Returns:
+        list[tuple[str, str, zipfile.ZipInfo]]: The name, content type and archive entry of each supported file.
+    """
+    files: list[tuple[str, str, zipfile.ZipInfo]] = []
+
+    for info in archive.infolist():
+        name = os.path.basename(info.filename)
+        extension = os.path.splitext(name)[1].lower()
+
+        # skips folders, hidden files and the metadata some archivers add
+        if info.is_dir() or name.startswith(".") or info.filename.startswith("__MACOSX/"):
+            continue
+
+        if extension not in content_type.EXTENSIONS:
+            continue
+
+        # the sizes are those the archive declares, and a member is never inflated past its declared size
+        if info.file_size > MAX_COMPRESSION_RATIO * max(info.compress_size, 1):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"The archived file {name} is compressed more than {MAX_COMPRESSION_RATIO} times.",
+            )
+
+        files.append((name, content_type.EXTENSIONS[extension], info))
+
+    if len(files) > MAX_ARCHIVE_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"The archive holds more than {MAX_ARCHIVE_FILES} files.",
+        )
+
+    if sum(info.file_size for _, _, info in files) > MAX_ARCHIVE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"The archived files are larger than {MAX_ARCHIVE_SIZE} bytes.",
+        )
+
+    return files
+
+
+def extract(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> tuple[BinaryIO, str]:
+    """
+    Inflates an archived file chunk by chunk into a temporary file, spooled to disk once large, hashing it meanwhile.
+
+    Args:
+        archive (zipfile.ZipFile): A ZIP archive.
+        info (zipfile.ZipInfo): The archive entry of the file.
+
+    Returns:
+        tuple[BinaryIO, str]: The rewound content of the file, and its SHA-256 hash.
+    """
+    # the caller owns the file, and closes it once enqueued
+    # pylint: disable=consider-using-with
+    extracted = cast(BinaryIO, tempfile.SpooledTemporaryFile(max_size=UPLOAD_CHUNK_SIZE))
+    digest = hashlib.sha256()
+
+    try:
+        with archive.open(info) as member:
+            while chunk := member.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                extracted.write(chunk)
+    except BaseException:
+        extracted.close()
+        raise
+
+    extracted.seek(0)
+
+    return extracted, digest.hexdigest()
+
+
+def unzip(file: BinaryIO) -> list[tuple[str, str, BinaryIO, str]]:
+    """
+    Extracts the supported files of a ZIP archive.
+
+    Args:
+        file (BinaryIO): A ZIP archive.
+
+    Returns:
+        list[tuple[str, str, BinaryIO, str]]: The name, content type, rewound content and SHA-256 hash of each supported
+            file. The caller must close the files.
+    """
+    try:
+        archive = zipfile.ZipFile(file)
+    except zipfile.BadZipFile as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="The archive is not a valid ZIP file.",
+        ) from error
+
+    files: list[tuple[str, str, BinaryIO, str]] = []
+
+    try:
+        with archive:
+            for name, file_content_type, info in archived_files(archive):
+                files.append((name, file_content_type, *extract(archive, info)))
+    except BaseException:
+        for _, _, extracted, _ in files:
+            extracted.close()
+        raise
+
+    return files
+
 
 @router.post(path="", status_code=status.HTTP_202_ACCEPTED, tags=["Commands"])
 async def verify_assignment(
-    verification_service: AssignmentVerifierDependency,
+    jobs: JobRepositoryDependency,
     file: Annotated[UploadFile, File(description="Assignment's File")],
-    background_tasks: BackgroundTasks,
 ) -> ResponseModel[JobScheduled]:
     """
     Compares an assignment against a set of other assignments to see if there is any plagiarism.
@@ -59,21 +199,74 @@ async def verify_assignment(
             detail=f"Content type {file.content_type} is not supported.",
         )
 
-    # generate job
-    job = JobScheduled(
-        message="Assignment verification scheduled. Once completed, similarities will be shown when retrieved by id.",
-    )
+    # queues the verification - a worker will produce the event
+    sha256 = await hash_upload(file)
+    job = await jobs.enqueue(Job(filename=file.filename, content_type=file.content_type, sha256=sha256), file.file)
 
-    # creates a command to be handled by the service
-    command = VerifyAssignment(
+    event = JobScheduled(
         id=job.id,
-        file=file,
+        message="Assignment verification scheduled. Once completed, similarities will be shown when retrieved by id.",
     )
 
-    # calls the service - which will produce an event
-    background_tasks.add_task(verification_service.verify, command=command)
+    return ResponseModel(data=event)
+
+
+@router.post(path="/batch", status_code=status.HTTP_202_ACCEPTED, tags=["Commands"])
+async def verify_assignments(
+    jobs: JobRepositoryDependency,
+    files: Annotated[list[UploadFile], File(description="Assignments' Files, or ZIP archives of them")],
+) -> ResponseModel[list[JobScheduled]]:
+    """
+    Compares many assignments submitted at once, e.g. by a whole class, against a set of other assignments and against
+    each other, to see if there is any plagiarism.
+
+    Only PDF, DOC and DOCX files are supported, either uploaded or inside ZIP archives. A job is scheduled for each
+    file, and all of them are verified together.
+    """
+
+    logging.info("Verify %d assignments.", len(files))
+
+    uploads: list[tuple[str | None, str | None, BinaryIO, str]] = []
+
+    try:
+        for file in files:
+            if file.content_type in archive_content_types:
+                # inflating archives is CPU bound, and must not stall the event loop
+                uploads += await asyncio.to_thread(unzip, file.file)
+            elif file.content_type in supported_content_types:
+                uploads.append((file.filename, file.content_type, file.file, await hash_upload(file)))
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail=f"Content type {file.content_type} is not supported.",
+                )
+
+        if not uploads:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="No supported files were found.",
+            )
+
+        # queues the verifications as a batch - a worker will verify them together
+        batch_id = uuid4()
+        events: list[JobScheduled] = []
+
+        for filename, file_content_type, upload, sha256 in uploads:
+            job = await jobs.enqueue(
+                Job(filename=filename, content_type=file_content_type, sha256=sha256, batch_id=batch_id), upload
+            )
+            events.append(
+                JobScheduled(
+                    id=job.id,
+                    message=f"Verification of {filename} scheduled. Once completed, similarities will be shown when "
+                    "retrieved by id.",
+                )
+            )
+    finally:
+        for _, _, upload, _ in uploads:
+            upload.close()
 
-    return ResponseModel(data=job)
+    return ResponseModel[list[JobScheduled]](data=events)
 
 
 @router.get(path="", status_code=status.HTTP_200_OK, tags=["Queries"])
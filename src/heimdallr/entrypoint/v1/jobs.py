@@ -0,0 +1,47 @@
+"""
+Jobs Entry Point.
+"""
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Path, status
+from pydantic import UUID4
+
+from heimdallr.dependencies import JobRepositoryDependency
+from heimdallr.domain.events.assignments import AssignmentCompared, JobReported
+from heimdallr.domain.models.job import Job
+from heimdallr.domain.schemas import ResponseModel
+
+router = APIRouter(prefix="/jobs")
+
+
+@router.get(path="/{job_id}", status_code=status.HTTP_200_OK, tags=["Queries"])
+async def get_job_by_id(
+    job_id: Annotated[UUID4, Path(description="Job's ID", examples=["db5f72ab-23ce-4087-ab98-548775184f8e"])],
+    jobs: JobRepositoryDependency,
+) -> ResponseModel[JobReported]:
+    """
+    Returns the status of a verification job, and the plagiarism found so far.
+    """
+    logging.info("Get job.")
+
+    model: Job | None = await jobs.find_status(job_id)
+
+    if not model:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with id {job_id} not found.",
+        )
+
+    event = JobReported(
+        id=model.id,
+        status=str(model.status),
+        attempts=model.attempts,
+        compared=model.compared,
+        total=model.total,
+        elapsed=model.elapsed.total_seconds() if model.elapsed is not None else None,
+        error=model.error,
+        similarities=[AssignmentCompared(**similarity.model_dump()) for similarity in model.similarities],
+    )
+
+    return ResponseModel(data=event)
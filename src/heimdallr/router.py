@@ -8,7 +8,7 @@ Resources:
 from fastapi import APIRouter
 
 from heimdallr.entrypoint import monitor
-from heimdallr.entrypoint.v1 import assignments
+from heimdallr.entrypoint.v1 import assignments, jobs
 
 api_v1_prefix: str = "/api/v1"
 
@@ -20,3 +20,4 @@ root_router.include_router(monitor.router)
 
 # API routers
 api_router_v1.include_router(assignments.router)
+api_router_v1.include_router(jobs.router)
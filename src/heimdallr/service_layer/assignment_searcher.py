@@ -0,0 +1,812 @@
+"""
+Assignment Searcher.
+
+Looks for plagiarism of an entry across the corpus as a cascade, from the cheapest lookups to the comparisons of whole
+assignments: full copies by the file hash, near duplicates by their MinHash signatures, verbatim passages by their
+fingerprints, identical sentences by their hashes, and then the sentences near those of the entry among the assignments
+similar enough as a whole. Each step settles some assignments, so that the next ones look into fewer of them.
+"""
+import datetime
+import itertools
+import logging
+from collections import defaultdict
+from typing import Container
+from uuid import UUID
+
+from heimdallr.domain.events.assignments import (
+    AssignmentCompared,
+    PassageCompared,
+    SentenceCompared,
+)
+from heimdallr.domain.models.assignment import Assignment
+from heimdallr.service_layer.corpus_index import CorpusIndex, sign
+from heimdallr.service_layer.fingerprints import SharedFingerprint, fingerprints
+from heimdallr.service_layer.passages import (
+    SharedPassage,
+    WordSpan,
+    passage_text,
+    words,
+)
+from heimdallr.service_layer.progress import VerificationProgress
+from heimdallr.service_layer.sentence_comparer import (
+    SentenceComparer,
+    SentenceMatches,
+    SentencePair,
+)
+from heimdallr.service_layer.sentence_index import SentenceHit
+from heimdallr.service_layer.similarity import cosine_similarities
+from heimdallr.service_layer.top_matches import TopMatches
+from heimdallr.service_layer.topic_index import TopicFallback
+
+logger = logging.getLogger("uvicorn.error")
+
+MIN_ASSIGNMENT_SIMILARITY = 0.991
+
+
+class AssignmentSearcher:
+    """
+    Looks for the plagiarized assignments of each entry across the corpus, and across the entries verified with it.
+    """
+
+    def __init__(
+        self,
+        index: CorpusIndex,
+        comparer: SentenceComparer,
+        *,
+        duplicate_threshold: float = 0.8,
+        verbatim_threshold: float = 0.1,
+        max_matches: int | None = None,
+        topic_fallback: TopicFallback | str = TopicFallback.EMPTY,
+        detect_plagiarism: bool = True,
+    ):
+        """
+        Args:
+            index (CorpusIndex): The indexes of the corpus, and the vectors of its assignments.
+            comparer (SentenceComparer): Finds the plagiarized sentences of an entry in an assignment.
+            duplicate_threshold (float): The minimum estimated Jaccard similarity to consider an assignment a near
+                duplicate.
+            verbatim_threshold (float): The minimum fraction of the entry fingerprints an assignment must share to look
+                for verbatim passages in it.
+            max_matches (int | None): The maximum number of plagiarized assignments reported, the most plagiarized
+                first. None reports them all.
+            topic_fallback (TopicFallback | str): When the assignments of other topics than the entry one are
+                searched: always after its own topic, only when its own topic holds no plagiarism, or never.
+            detect_plagiarism (bool): Whether to search for plagiarism or not.
+        """
+        self.index = index
+        self.comparer = comparer
+        self.duplicate_threshold = duplicate_threshold
+        self.verbatim_threshold = verbatim_threshold
+        self.max_matches = max_matches
+        self.topic_fallback = TopicFallback(topic_fallback)
+        self.detect_plagiarism = detect_plagiarism
+
+    def search_batch(
+        self,
+        batch: list[Assignment],
+        assignments: list[Assignment],
+        progress: dict[UUID, VerificationProgress],
+    ) -> dict[UUID, list[AssignmentCompared]]:
+        """
+        Looks for plagiarism of each entry of a batch across a corpus, and across the rest of the batch.
+
+        Args:
+            batch (list[Assignment]): The vectorized assignments to check for plagiarism.
+            assignments (list[Assignment]): The corpus of stored assignments.
+            progress (dict[UUID, VerificationProgress]): Records the progress of each entry, by ID.
+
+        Returns:
+            dict[UUID, list[AssignmentCompared]]: The plagiarized assignments of each entry, from the most plagiarized.
+        """
+        if not self.detect_plagiarism:
+            logger.warning("Assignment verification is disabled.")
+            return {entry.id: [] for entry in batch}
+
+        logger.info("Comparing %d against %d assignments. This may take a while...", len(batch), len(assignments))
+
+        peers = self._compare_batch(batch)
+        results: dict[UUID, list[AssignmentCompared]] = {}
+
+        for entry in batch:
+            entry_progress = progress.get(entry.id) or VerificationProgress()
+            top = TopMatches(self.max_matches)
+
+            for comparison in self.search(entry, assignments, entry_progress) + peers[entry.id]:
+                top.push(comparison)
+
+            results[entry.id] = top.results()
+            entry_progress.finish(results[entry.id])
+
+        return results
+
+    def _compare_batch(self, batch: list[Assignment]) -> dict[UUID, list[AssignmentCompared]]:
+        """
+        Compares every pair of entries of a batch in both directions, computing the similarities of each pair once.
+
+        Args:
+            batch (list[Assignment]): The vectorized assignments to check for plagiarism.
+
+        Returns:
+            dict[UUID, list[AssignmentCompared]]: The comparison results of each entry against the rest, by its ID.
+        """
+        peers: dict[UUID, list[AssignmentCompared]] = {entry.id: [] for entry in batch}
+        combinations = list(itertools.combinations(batch, 2))
+        pairs = [self._sentence_pair(first, second) for first, second in combinations]
+        skipped = [sorted(self.index.indexes.boilerplate.positions(first.content)) for first, _ in combinations]
+        starting_time = datetime.datetime.now()
+
+        if self.index.vectors.pool:
+            results = self.index.vectors.pool.compare_mutual_all(pairs, skipped)
+        else:
+            results = [self.comparer.compare_mutual(pair, first) for pair, first in zip(pairs, skipped)]
+
+        for (first, second), (matches, mutual) in zip(combinations, results):
+            peers[second.id].append(self._matches_compared(first, second, matches, starting_time))
+            peers[first.id].append(self._matches_compared(second, first, mutual, starting_time))
+
+        return peers
+
+    def search(
+        self,
+        entry: Assignment,
+        assignments: list[Assignment],
+        progress: VerificationProgress | None = None,
+    ) -> list[AssignmentCompared]:
+        """
+        Looks for plagiarism of an entry across a corpus at once.
+
+        The assignments read from the very same file as the entry are reported first as full copies, without comparing
+        them. Near duplicates of the entry are found next through their MinHash signatures, and compared straight away.
+        The entry sentences identical to a stored one are plagiarized as they are, without comparing their vectors.
+        Then, the assignments sharing enough fingerprints with the entry are looked up in the fingerprint index, and
+        only the sentences holding those fingerprints are compared, regardless of how similar both assignments are as a
+        whole. For the rest, rather than comparing the entry against each assignment, the document index finds the
+        assignments similar enough as a whole, and each entry sentence looks up its nearest stored sentences among them
+        in the sentence index. Only the assignments holding any of those sentences are compared.
+
+        When a maximum number of matches is set, the assignments that could not beat the weakest match kept so far are
+        not compared at all.
+
+        When a passage index is kept, the passages the entry shares with each assignment, across sentences, are looked
+        up last, and reported along the plagiarized sentences.
+
+        The assignments sharing the topic of the entry are searched first, and the rest as the topic fallback allows.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            assignments (list[Assignment]): The corpus of stored assignments.
+            progress (VerificationProgress | None): Records the settled assignments, and the plagiarized ones found so
+                far.
+
+        Returns:
+            list[AssignmentCompared]: The plagiarized assignments, from the most plagiarized.
+        """
+        progress = progress or VerificationProgress()
+        corpus = {assignment.id: assignment for assignment in assignments}
+        progress.start(len(corpus))
+        self.index.sync(corpus)
+
+        top = TopMatches(self.max_matches)
+
+        # the assignments read from the very same file are full copies, reported before comparing anything
+        copies = {key for key, assignment in corpus.items() if entry.sha256 and assignment.sha256 == entry.sha256}
+
+        for key in copies:
+            top.push(self.compare_copy(corpus[key], entry))
+
+        progress.advance(len(copies), top.results())
+
+        for rank, keys in enumerate(self.index.indexes.topics.partitions(entry.topic)):
+            keys = keys - copies
+
+            if rank and (
+                self.topic_fallback == TopicFallback.NEVER or (self.topic_fallback == TopicFallback.EMPTY and len(top))
+            ):
+                logger.info("Skipping %d assignments of other topics than %s.", len(keys), str(entry.topic))
+                progress.advance(len(keys))
+                continue
+
+            self._search_partition(entry, corpus, keys, top, progress)
+
+        results = top.results()
+        progress.finish(results)
+
+        logger.debug(
+            "Lexical gate: %d sentence pairs pruned by length, %d by overlap, %d compared.",
+            self.comparer.lexical_gate.pruned_by_length,
+            self.comparer.lexical_gate.pruned_by_overlap,
+            self.comparer.lexical_gate.passed,
+        )
+
+        return results
+
+    def _search_partition(
+        self,
+        entry: Assignment,
+        corpus: dict[UUID, Assignment],
+        keys: set[UUID],
+        top: TopMatches,
+        progress: VerificationProgress,
+    ) -> None:
+        """
+        Looks for plagiarism of an entry across a partition of a corpus.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            corpus (dict[UUID, Assignment]): The stored assignments, by ID.
+            keys (set[UUID]): The IDs of the assignments in the partition.
+            top (TopMatches): The comparison results kept so far.
+            progress (VerificationProgress): Records the settled assignments.
+        """
+        indexes = self.index.indexes
+        duplicates = {
+            key: similarity
+            for key, similarity in indexes.duplicates.query(sign(entry), self.duplicate_threshold).items()
+            if key in keys
+        }
+
+        for comparison in self.compare_duplicates([corpus[key] for key in duplicates], entry, duplicates):
+            top.push(comparison)
+            progress.advance(1, top.results())
+
+        verbatim = self._search_verbatim(entry, corpus, keys - duplicates.keys(), top)
+        compared = duplicates.keys() | verbatim
+        progress.advance(len(verbatim), top.results())
+
+        # preliminary check to avoid unnecessary comparisons, an entry without token vectors resembles no assignment
+        documents = (
+            indexes.documents.search(entry.document_vector, MIN_ASSIGNMENT_SIMILARITY) if entry.document_vector else {}
+        )
+        similar = {key: similarity for key, similarity in documents.items() if key in keys and key not in compared}
+
+        # identical sentences are plagiarized however different both assignments are as a whole
+        exact = self.index.exact_matches(entry, keys - compared)
+
+        # the assignments not similar enough as a whole, without identical sentences, are settled without comparing them
+        progress.advance(len(keys) - len(compared) - len(similar.keys() | exact.keys()))
+
+        self._search_sentences(entry, corpus, similar, exact, top=top, progress=progress)
+        self._search_passages(entry, corpus, keys, top, progress)
+
+    def compare_assignments(self, assignment: Assignment, entry: Assignment) -> AssignmentCompared:
+        """
+        Given a new entry, looks for plagiarism in an assignment.
+
+        Args:
+            assignment (Assignment): An assignment.
+            entry (Assignment): An assignment to check for plagiarism.
+
+        Returns:
+            None: When the assignment is not plagiarized.
+        """
+        starting_time = datetime.datetime.now()
+
+        self.index.vectors.vectorize(entry)
+        self.index.vectors.vectorize(assignment)
+
+        compared = self._preliminary_check(assignment, entry, self._document_similarity(assignment, entry))
+
+        if compared:
+            return compared
+
+        return self._compare_sentences(assignment, entry, starting_time)
+
+    def compare_duplicates(
+        self,
+        assignments: list[Assignment],
+        entry: Assignment,
+        similarities: dict[UUID, float],
+    ) -> list[AssignmentCompared]:
+        """
+        Given the near duplicates of a new entry, finds their plagiarized sentences, skipping any preliminary check.
+
+        Args:
+            assignments (list[Assignment]): The near duplicate assignments.
+            entry (Assignment): An assignment to check for plagiarism.
+            similarities (dict[UUID, float]): The estimated Jaccard similarity of each assignment and the entry, by ID.
+
+        Returns:
+            list[AssignmentCompared]: The comparison result event of each assignment.
+        """
+        starting_time = datetime.datetime.now()
+
+        for assignment in assignments:
+            logger.info(
+                "Near duplicate(%f) of Assignment(id=%s, author=%s, topic=%s)",
+                similarities[assignment.id],
+                str(assignment.id),
+                assignment.author,
+                str(assignment.topic),
+            )
+
+        self.index.vectors.vectorize_all([entry, *assignments])
+
+        pairs = [self._sentence_pair(assignment, entry) for assignment in assignments]
+
+        if self.index.vectors.pool:
+            results = self.index.vectors.pool.compare_all(pairs)
+        else:
+            results = [self.comparer.compare(pair) for pair in pairs]
+
+        return [
+            self._matches_compared(assignment, entry, matches, starting_time)
+            for assignment, matches in zip(assignments, results)
+        ]
+
+    def compare_copy(self, assignment: Assignment, entry: Assignment) -> AssignmentCompared:
+        """
+        Given an assignment read from the very same file as a new entry, reports every sentence as plagiarized, without
+        comparing them.
+
+        Args:
+            assignment (Assignment): An assignment with the same file hash as the entry.
+            entry (Assignment): An assignment to check for plagiarism.
+
+        Returns:
+            AssignmentCompared: A comparison result event, of a full copy.
+        """
+        logger.info(
+            "Full copy of Assignment(id=%s, author=%s, topic=%s)",
+            str(assignment.id),
+            assignment.author,
+            str(assignment.topic),
+        )
+
+        return AssignmentCompared(
+            id=assignment.id,
+            author=assignment.author,
+            similarities=[
+                SentenceCompared(present=sentence, compared=sentence, plagiarism=1.0)
+                for sentence in dict.fromkeys(entry.content)
+            ],
+            plagiarism=1.0,
+        )
+
+    def compare_matches(
+        self,
+        assignment: Assignment,
+        entry: Assignment,
+        matches: dict[int, SentenceHit],
+    ) -> AssignmentCompared:
+        """
+        Given the sentences of an assignment found by an index, looks for plagiarism in an assignment.
+
+        Args:
+            assignment (Assignment): An assignment.
+            entry (Assignment): An assignment to check for plagiarism.
+            matches (dict[int, SentenceHit]): The first plagiarized match of each entry sentence, by its position.
+
+        Returns:
+            AssignmentCompared: A comparison result event.
+        """
+        starting_time = datetime.datetime.now()
+
+        comparison_results: set[SentenceCompared] = set()
+
+        for row, hit in matches.items():
+            sentence, entry_sentence = assignment.content[hit.position], entry.content[row]
+            plagiarism = 1.0 if sentence == entry_sentence else hit.similarity
+            comparison_results.add(SentenceCompared(present=sentence, compared=entry_sentence, plagiarism=plagiarism))
+
+        return self._assignment_compared(assignment, entry, comparison_results, starting_time)
+
+    def _search_sentences(
+        self,
+        entry: Assignment,
+        corpus: dict[UUID, Assignment],
+        similar: dict[UUID, float],
+        exact: dict[UUID, dict[int, SentenceHit]],
+        *,
+        top: TopMatches,
+        progress: VerificationProgress,
+    ) -> None:
+        """
+        Looks for the plagiarized sentences of an entry across the similar assignments of a corpus, and the assignments
+        holding any of its sentences as they are.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            corpus (dict[UUID, Assignment]): The stored assignments, by ID.
+            similar (dict[UUID, float]): The similarity of the assignments similar enough as a whole, by ID.
+            exact (dict[UUID, dict[int, SentenceHit]]): The identical sentences of each assignment, by ID.
+            top (TopMatches): The comparison results kept so far.
+            progress (VerificationProgress): Records the settled assignments.
+        """
+        if not similar and not exact:
+            return
+
+        # the identical sentences are not worth looking up by their vectors
+        copied = {row for hits in exact.values() for row in hits}
+        matches = (
+            self.index.sentence_matches(entry, similar.keys(), self.comparer.threshold, copied)
+            if similar
+            else defaultdict(dict)
+        )
+
+        for key, hits in exact.items():
+            matches[key].update(hits)
+
+        logger.info("Found similar sentences in %d assignments.", len(matches))
+
+        # the assignments without similar sentences are settled without comparing them
+        progress.advance(len(similar.keys() | exact.keys()) - len(matches))
+
+        # the most promising candidates first, so that the weaker ones are skipped once they cannot make the cut
+        bounds = {key: self._plagiarism_bound(entry, assignment_matches) for key, assignment_matches in matches.items()}
+
+        for key in sorted(bounds, key=bounds.__getitem__, reverse=True):
+            compared = self._preliminary_check(corpus[key], entry, similar[key]) if key in similar else None
+
+            if compared:
+                top.push(compared)
+            elif top.admits(bounds[key]):
+                top.push(self.compare_matches(corpus[key], entry, matches[key]))
+
+            progress.advance(1, top.results())
+
+    def _search_passages(
+        self,
+        entry: Assignment,
+        corpus: dict[UUID, Assignment],
+        keys: Container[UUID],
+        top: TopMatches,
+        progress: VerificationProgress,
+    ) -> None:
+        """
+        Looks for the passages an entry shares with the assignments of a corpus, regardless of sentence boundaries.
+
+        The passages are added to the assignments already plagiarized. Any other assignment sharing passages is
+        plagiarized by the fraction of the entry words they cover.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            corpus (dict[UUID, Assignment]): The stored assignments, by ID.
+            keys (Container[UUID]): The IDs of the assignments to look in.
+            top (TopMatches): The comparison results kept so far.
+            progress (VerificationProgress): Records the plagiarized assignments.
+        """
+        shared = self._shared_passages(entry, keys)
+
+        if not shared:
+            return
+
+        logger.info("Found shared passages in %d assignments.", len(shared))
+
+        entry_words = words(entry.content)
+        found = {result.id: result for result in top.results()}
+
+        for key, passages in shared.items():
+            compared = self._compare_passages(corpus[key], entry, entry_words, passages)
+
+            if key in found:
+                found[key].passages = compared
+                continue
+
+            covered = {
+                position
+                for passage in passages
+                for position in range(passage.entry_start, passage.entry_start + passage.length)
+            }
+            top.push(
+                AssignmentCompared(
+                    id=key,
+                    author=corpus[key].author,
+                    plagiarism=len(covered) / len(entry_words),
+                    passages=compared,
+                )
+            )
+
+        progress.advance(0, top.results())
+
+    def _shared_passages(self, entry: Assignment, keys: Container[UUID]) -> dict[UUID, list[SharedPassage]]:
+        """
+        Looks up the passages an entry shares with the assignments of a corpus, in the suffix arrays of the passage
+        index.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            keys (Container[UUID]): The IDs of the assignments to look in.
+
+        Returns:
+            dict[UUID, list[SharedPassage]]: The passages shared with each assignment, by ID. Empty when passages are
+                not looked up.
+        """
+        shared: dict[UUID, list[SharedPassage]] = defaultdict(list)
+
+        if self.index.indexes.passages is None:
+            return shared
+
+        for passage in self.index.indexes.passages.query(entry.content, keys):
+            shared[passage.key].append(passage)
+
+        return shared
+
+    @staticmethod
+    def _compare_passages(
+        assignment: Assignment,
+        entry: Assignment,
+        entry_words: list[WordSpan],
+        passages: list[SharedPassage],
+    ) -> list[PassageCompared]:
+        """
+        Args:
+            assignment (Assignment): A stored assignment.
+            entry (Assignment): An assignment to check for plagiarism.
+            entry_words (list[WordSpan]): The words of the entry.
+            passages (list[SharedPassage]): The passages the entry shares with the assignment.
+
+        Returns:
+            list[PassageCompared]: The text of each passage on both sides, in the order of the entry.
+        """
+        assignment_words = words(assignment.content)
+
+        return [
+            PassageCompared(
+                present=passage_text(assignment.content, assignment_words, passage.start, passage.length),
+                compared=passage_text(entry.content, entry_words, passage.entry_start, passage.length),
+                position=entry_words[passage.entry_start].sentence,
+                words=passage.length,
+            )
+            for passage in sorted(passages, key=lambda passage: passage.entry_start)
+        ]
+
+    def _search_verbatim(
+        self,
+        entry: Assignment,
+        corpus: dict[UUID, Assignment],
+        keys: Container[UUID],
+        top: TopMatches,
+    ) -> set[UUID]:
+        """
+        Looks for the verbatim passages of an entry across a corpus, through the fingerprints both share.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            corpus (dict[UUID, Assignment]): The stored assignments, by ID.
+            keys (Container[UUID]): The IDs of the assignments to look in.
+            top (TopMatches): The comparison results kept so far.
+
+        Returns:
+            set[UUID]: The IDs of the assignments holding any verbatim passage.
+        """
+        entry_fingerprints = fingerprints(entry.content)
+        values = {fingerprint.value for fingerprint in entry_fingerprints}
+        found: set[UUID] = set()
+
+        for key, shared in self.index.indexes.fingerprints.query(entry_fingerprints).items():
+            if key not in keys:
+                continue
+
+            containment = len({fingerprint.value for fingerprint in shared}) / len(values)
+
+            if containment < self.verbatim_threshold:
+                continue
+
+            matches = self._verbatim_matches(corpus[key], entry, shared)
+
+            if not matches:
+                continue
+
+            found.add(key)
+
+            if top.admits(self._plagiarism_bound(entry, matches)):
+                logger.info("Shares %f of its fingerprints with Assignment(id=%s)", containment, str(key))
+                top.push(self.compare_matches(corpus[key], entry, matches))
+
+        return found
+
+    def _verbatim_matches(
+        self,
+        assignment: Assignment,
+        entry: Assignment,
+        shared: list[SharedFingerprint],
+    ) -> dict[int, SentenceHit]:
+        """
+        Compares only the sentences of two vectorized assignments that share fingerprints.
+
+        Args:
+            assignment (Assignment): An assignment.
+            entry (Assignment): An assignment to check for plagiarism.
+            shared (list[SharedFingerprint]): The fingerprints both assignments share.
+
+        Returns:
+            dict[int, SentenceHit]: The first plagiarized match of each entry sentence, by its position.
+        """
+        boilerplate = self.index.indexes.boilerplate.positions(entry.content)
+        pairs = sorted(
+            {
+                (fingerprint.entry_position, fingerprint.position)
+                for fingerprint in shared
+                if fingerprint.entry_position not in boilerplate
+            }
+        )
+
+        if not pairs:
+            return {}
+
+        rows = {row: index for index, row in enumerate(sorted({row for row, _ in pairs}))}
+        columns = {column: index for index, column in enumerate(sorted({column for _, column in pairs}))}
+
+        similarities = self.comparer.similarities(
+            [assignment.content[column] for column in columns],
+            self.index.vectors.sentence_vectors(assignment, list(columns)),
+            [entry.content[row] for row in rows],
+            self.index.vectors.sentence_vectors(entry, list(rows)),
+        )
+
+        matches: dict[int, SentenceHit] = {}
+
+        for row, column in pairs:
+            similarity = float(similarities[rows[row], columns[column]])
+            if row not in matches and similarity >= self.comparer.threshold:
+                matches[row] = SentenceHit(assignment.id, column, similarity)
+
+        return matches
+
+    def _compare_sentences(
+        self,
+        assignment: Assignment,
+        entry: Assignment,
+        starting_time: datetime.datetime,
+    ) -> AssignmentCompared:
+        """
+        Compares every sentence of two vectorized assignments.
+
+        Args:
+            assignment (Assignment): An assignment.
+            entry (Assignment): An assignment to check for plagiarism.
+            starting_time (datetime.datetime): When the comparison started.
+
+        Returns:
+            AssignmentCompared: A comparison result event.
+        """
+        matches = self.comparer.compare(self._sentence_pair(assignment, entry))
+
+        return self._matches_compared(assignment, entry, matches, starting_time)
+
+    def _sentence_pair(self, assignment: Assignment, entry: Assignment) -> SentencePair:
+        """
+        Args:
+            assignment (Assignment): A vectorized assignment.
+            entry (Assignment): A vectorized assignment to check for plagiarism.
+
+        Returns:
+            SentencePair: The sentences and vectors of both assignments, and the entry boilerplate, never plagiarized.
+        """
+        return SentencePair(
+            assignment.content,
+            self.index.vectors.sentence_vectors(assignment),
+            entry.content,
+            self.index.vectors.sentence_vectors(entry),
+            sorted(self.index.indexes.boilerplate.positions(entry.content)),
+            assignment.id,
+            entry.id,
+        )
+
+    def _matches_compared(
+        self,
+        assignment: Assignment,
+        entry: Assignment,
+        matches: SentenceMatches,
+        starting_time: datetime.datetime,
+    ) -> AssignmentCompared:
+        """
+        Summarizes the plagiarized sentences of an entry found in an assignment.
+
+        Args:
+            assignment (Assignment): An assignment.
+            entry (Assignment): An assignment to check for plagiarism.
+            matches (SentenceMatches): The first plagiarized match of each entry sentence.
+            starting_time (datetime.datetime): When the comparison started.
+
+        Returns:
+            AssignmentCompared: A comparison result event.
+        """
+        comparison_results: set[SentenceCompared] = {
+            SentenceCompared(
+                present=assignment.content[column],
+                compared=entry.content[row],
+                plagiarism=similarity,
+            )
+            for row, column, similarity in zip(*matches)
+        }
+
+        return self._assignment_compared(assignment, entry, comparison_results, starting_time)
+
+    @staticmethod
+    def _plagiarism_bound(entry: Assignment, matches: dict[int, SentenceHit]) -> float:
+        """
+        Computes the highest plagiarism an assignment may reach, given the plagiarized matches of the entry sentences.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            matches (dict[int, SentenceHit]): The first plagiarized match of each entry sentence, by its position.
+
+        Returns:
+            float: The fraction of the entry sentences that are matched.
+        """
+        return len(matches) / len(entry.content) if entry.content else 0.0
+
+    @staticmethod
+    def _preliminary_check(assignment: Assignment, entry: Assignment, similarity: float) -> AssignmentCompared | None:
+        """
+        Checks two whole assignments, to avoid unnecessary sentence comparisons.
+
+        Args:
+            assignment (Assignment): An assignment.
+            entry (Assignment): An assignment to check for plagiarism.
+            similarity (float): The similarity of both assignments as a whole.
+
+        Returns:
+            AssignmentCompared | None: A final comparison result, or None when sentences are worth comparing.
+        """
+        if similarity < MIN_ASSIGNMENT_SIMILARITY:
+            return AssignmentCompared(id=assignment.id, author=assignment.author, plagiarism=0.0)
+
+        if "".join(assignment.content) == "".join(entry.content):
+            logger.info("EXACTLY SAME AS %s Assignment(id=%s).", assignment.author, str(assignment.id))
+            return AssignmentCompared(id=assignment.id, author=assignment.author, plagiarism=1.0)
+
+        logger.info(
+            "Similar(%f) to Assignment(id=%s, author=%s, topic=%s)",
+            similarity,
+            str(assignment.id),
+            assignment.author,
+            str(assignment.topic),
+        )
+
+        return None
+
+    @staticmethod
+    def _document_similarity(assignment: Assignment, entry: Assignment) -> float:
+        """
+        Computes the similarity of two assignments as a whole.
+
+        Args:
+            assignment (Assignment): A vectorized assignment.
+            entry (Assignment): A vectorized assignment to check for plagiarism.
+
+        Returns:
+            float: The cosine similarity of both document vectors.
+        """
+        if not assignment.document_vector or not entry.document_vector:
+            return 0.0
+
+        return float(cosine_similarities([entry.document_vector], [assignment.document_vector])[0, 0])
+
+    @staticmethod
+    def _assignment_compared(
+        assignment: Assignment,
+        entry: Assignment,
+        comparison_results: set[SentenceCompared],
+        starting_time: datetime.datetime,
+    ) -> AssignmentCompared:
+        """
+        Summarizes the plagiarized sentences of an assignment.
+
+        Args:
+            assignment (Assignment): An assignment.
+            entry (Assignment): An assignment to check for plagiarism.
+            comparison_results (set[SentenceCompared]): The plagiarized sentences.
+            starting_time (datetime.datetime): When the comparison started.
+
+        Returns:
+            AssignmentCompared: A comparison result event.
+        """
+        plagiarism = sum(result.plagiarism for result in comparison_results) / len(entry.content)
+
+        seconds = (datetime.datetime.now() - starting_time).total_seconds()
+
+        logger.info(
+            "Finished comparison with Assignment(id=%s, author=%s) in %f seconds.",
+            str(assignment.id),
+            assignment.author,
+            seconds,
+        )
+
+        return AssignmentCompared(
+            id=assignment.id,
+            author=assignment.author,
+            similarities=list(comparison_results),
+            plagiarism=plagiarism,
+        )
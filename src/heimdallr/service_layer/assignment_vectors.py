@@ -0,0 +1,214 @@
+"""
+Assignment Vectors.
+
+Computes the vector of each sentence of an assignment, and the one of its whole content, in as few spaCy batches as
+possible: the sentences already vectorized come from the cache, and the rest of many assignments are vectorized at
+once, across the process pool when there is one. The vectors of the stored assignments may be moved to a vector store,
+so that they are not kept in memory too.
+"""
+import logging
+import os
+
+import numpy as np
+from spacy import Language
+
+from heimdallr.domain.models.assignment import Assignment
+from heimdallr.service_layer.embeddings import SpacyEmbedder
+from heimdallr.service_layer.sentence_comparer import SentenceComparer
+from heimdallr.service_layer.similarity import normalize
+from heimdallr.service_layer.vector_cache import VectorCache
+from heimdallr.service_layer.vector_store import Quantization, VectorStore
+from heimdallr.service_layer.vectorizer_pool import ProcessPoolVectorizer
+from heimdallr.utils.process_pool import ForkedProcessPool
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class AssignmentVectors:
+    """
+    Vectorizes assignments, and reads their sentence vectors, either from memory or from the vector store.
+    """
+
+    def __init__(
+        self,
+        nlp: Language,
+        comparer: SentenceComparer,
+        *,
+        workers: int = 1,
+        batch_size: int = 256,
+        cache_size: int = 50_000,
+        store_path: str | None = None,
+        quantization: Quantization = "int8",
+        pool: ForkedProcessPool | None = None,
+    ):
+        """
+        Args:
+            nlp (Language): The Natural Language Processor.
+            comparer (SentenceComparer): The sentence comparer, inherited by the workers of the process pool.
+            workers (int): Number of processes that vectorize sentences and compare assignments. A single one does both
+                in process. Forked on creation, so the vectors must be created before any other thread starts.
+            batch_size (int): Sentences per spaCy batch when vectorizing.
+            cache_size (int): The maximum number of sentence vectors kept in memory, to avoid vectorizing the same
+                sentences again.
+            store_path (str | None): The directory of the memory mapped store of the corpus sentence vectors, shared by
+                the processes of a node. None keeps the vectors in memory.
+            quantization (Quantization): How the stored vectors are quantized, "int8" or "float16".
+            pool (ForkedProcessPool | None): A process pool shared with the page reader, which forks the workers
+                instead once both registered.
+        """
+        self.nlp = nlp
+        self.embedder = SpacyEmbedder(nlp, batch_size=batch_size)
+        self.store = (
+            VectorStore(os.path.join(store_path, self.model), self.embedder.width, quantization) if store_path else None
+        )
+        self.cache = VectorCache(cache_size)
+        self.pool = ProcessPoolVectorizer(self.embedder, comparer, workers, pool=pool) if workers > 1 else None
+
+    @property
+    def model(self) -> str:
+        """
+        Stamp of the language model that produces the sentence vectors, e.g. "es_core_news_lg-3.7.0".
+        """
+        meta = self.nlp.meta
+        return f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}"
+
+    def vectorize(self, assignment: Assignment) -> Assignment:
+        """
+        Computes a vector for each sentence of an assignment, and one for its whole content, unless it already holds
+        vectors produced by the current language model.
+
+        Args:
+            assignment (Assignment): An assignment.
+
+        Returns:
+            Assignment: The same assignment, with its vectors.
+        """
+        self.vectorize_all([assignment])
+
+        return assignment
+
+    def vectorize_all(self, assignments: list[Assignment]) -> None:
+        """
+        Vectorizes the sentences of many assignments in a single batch, skipping those already vectorized by the
+        current language model.
+
+        Args:
+            assignments (list[Assignment]): The assignments to vectorize.
+        """
+        stale = [
+            assignment
+            for assignment in assignments
+            if assignment.vectors_model != self.model
+            or self.count(assignment) != len(assignment.content)
+            or assignment.document_vector is None
+        ]
+
+        if not stale:
+            return
+
+        matrix, tokens = self.embed([sentence for assignment in stale for sentence in assignment.content])
+        start = 0
+
+        for assignment in stale:
+            end = start + len(assignment.content)
+            vectors, counts = matrix[start:end], tokens[start:end]
+            total = counts.sum()
+
+            # the whole content vector is the average of all its token vectors, as spaCy's Doc.vector
+            assignment.vectors = vectors.tolist()
+            assignment.document_vector = (counts @ vectors / total).tolist() if total else []
+            assignment.vectors_model = self.model
+
+            start = end
+
+    def embed(self, sentences: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the vector of each sentence, only vectorizing the distinct sentences missing from the cache.
+
+        Args:
+            sentences (list[str]): The sentences to vectorize.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (sentences x dimensions) vectors matrix, and the number of tokens of
+                each sentence.
+        """
+        cached = {sentence: self.cache.get(sentence) for sentence in dict.fromkeys(sentences)}
+        found = {sentence: entry for sentence, entry in cached.items() if entry is not None}
+        missing = [sentence for sentence in cached if sentence not in found]
+
+        if missing:
+            if self.pool:
+                matrix, tokens = self.pool.vectorize(missing)
+            else:
+                matrix, tokens = self.embedder.embed(missing)
+
+            # copy each row, so that a cached vector does not keep the whole matrix alive
+            for sentence, vector, count in zip(missing, matrix, tokens.tolist()):
+                found[sentence] = (vector.copy(), count)
+                self.cache.put(sentence, *found[sentence])
+
+        logger.debug(
+            "Vector cache: %d hits, %d misses, %d sentences.",
+            self.cache.hits,
+            self.cache.misses,
+            len(self.cache),
+        )
+
+        matrix = np.zeros((len(sentences), self.embedder.width), dtype=np.float32)
+        tokens = np.zeros(len(sentences), dtype=np.int64)
+
+        for row, sentence in enumerate(sentences):
+            matrix[row], tokens[row] = found[sentence]
+
+        return matrix, tokens
+
+    def offload(self, assignments: list[Assignment]) -> None:
+        """
+        Moves the sentence vectors of stored assignments to the vector store, when there is one, so that they are not
+        kept in memory too.
+
+        Args:
+            assignments (list[Assignment]): Vectorized assignments.
+        """
+        if self.store is None:
+            return
+
+        held = [assignment for assignment in assignments if assignment.vectors is not None]
+        self.store.put_all({assignment.id: normalize(self.sentence_vectors(assignment)) for assignment in held})
+
+        for assignment in held:
+            assignment.vectors = None
+
+    def count(self, assignment: Assignment) -> int:
+        """
+        Args:
+            assignment (Assignment): An assignment.
+
+        Returns:
+            int: The number of sentence vectors the assignment holds, either in memory or in the vector store.
+        """
+        if assignment.vectors is not None or self.store is None:
+            return len(assignment.vectors or [])
+
+        return self.store.count(assignment.id)
+
+    def sentence_vectors(self, assignment: Assignment, positions: list[int] | None = None) -> np.ndarray:
+        """
+        Reads the sentence vectors of a vectorized assignment, either from memory or from the vector store.
+
+        Args:
+            assignment (Assignment): A vectorized assignment.
+            positions (list[int] | None): When given, only the sentences to read.
+
+        Returns:
+            np.ndarray: A (sentences x dimensions) matrix.
+        """
+        if assignment.vectors is None and self.store is not None:
+            return self.store.get(assignment.id, positions)
+
+        vectors = np.asarray(assignment.vectors or [], dtype=np.float32)
+
+        if len(vectors) == 0:
+            vectors = vectors.reshape(0, self.embedder.width)
+
+        return vectors if positions is None else vectors[positions]
@@ -2,11 +2,11 @@
 Assignment Verifier Service
 """
 import abc
+import asyncio
 import concurrent.futures
 import datetime
 import logging
-
-from spacy import Language
+from uuid import UUID
 
 from heimdallr.adapters.assignment_reader import AssignmentReader
 from heimdallr.adapters.repository import AsyncAssignmentRepository
@@ -17,18 +17,17 @@ from heimdallr.domain.events.assignments import (
     SentenceCompared,
 )
 from heimdallr.domain.models.assignment import Assignment, AssignmentVerification
+from heimdallr.service_layer.assignment_searcher import AssignmentSearcher
+from heimdallr.service_layer.assignment_vectors import AssignmentVectors
+from heimdallr.service_layer.corpus import CorpusSnapshot
+from heimdallr.service_layer.corpus_index import sign
+from heimdallr.service_layer.extraction_cache import ExtractionCache
+from heimdallr.service_layer.progress import VerificationProgress
+from heimdallr.service_layer.similarity import cosine_similarities
+from heimdallr.version import __version__
 
 logger = logging.getLogger("uvicorn.error")
 
-"""
-According to https://www.inter-contact.de/en/blog/text-length-languages the AVG letters per word is 5.46 for Spanish
-
-Round it up to 6, and add 1 for the space between words, and we get 7 as the AVG word length.
-"""
-WORD_AVG_LENGTH = 7
-MIN_WORDS = 3
-MIN_ASSIGNMENT_SIMILARITY = 0.991
-
 
 class AssignmentVerifier(abc.ABC):
     """
@@ -38,12 +37,37 @@ class AssignmentVerifier(abc.ABC):
     """
 
     @abc.abstractmethod
-    async def verify(self, command: VerifyAssignment) -> AssignmentVerified:
+    async def verify(
+        self,
+        command: VerifyAssignment,
+        progress: VerificationProgress | None = None,
+    ) -> AssignmentVerified:
         """
         Verifies if an assignment is plagiarized.
 
         Args:
             command (VerifyAssignment): A file reference and its type.
+            progress (VerificationProgress | None): Records the progress of the verification while it runs.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def verify_batch(
+        self,
+        commands: list[VerifyAssignment],
+        progress: list[VerificationProgress] | None = None,
+    ) -> list[AssignmentVerified | Exception]:
+        """
+        Verifies if many assignments submitted at once are plagiarized, from the corpus or from each other. A file that
+        cannot be read does not keep the rest from being verified.
+
+        Args:
+            commands (list[VerifyAssignment]): The file references and their types.
+            progress (list[VerificationProgress] | None): Records the progress of each verification while it runs.
+
+        Returns:
+            list[AssignmentVerified | Exception]: A verification result per command, in the same order, or the error
+                raised while reading its file.
         """
         raise NotImplementedError
 
@@ -81,139 +105,182 @@ class SpacyAssignmentVerifier(AssignmentVerifier):
         self,
         reader: AssignmentReader,
         repository: AsyncAssignmentRepository,
-        nlp: Language,
-        similarity_threshold: float = 0.95,
-        detect_plagiarism: bool = True,
+        searcher: AssignmentSearcher,
+        *,
+        corpus: CorpusSnapshot | None = None,
+        executor_threads: int = 2,
+        extraction_cache_path: str | None = None,
     ):
         """
         Args:
             reader (AssignmentReader): A file reader.
             repository (AsyncAssignmentRepository): An assignment repository.
-            nlp (Language): The Natural Language Processor.
-            similarity_threshold (float): The minimum similarity required to consider a sentence plagiarized.
-            detect_plagiarism (bool): Whether to verify assignments or not.
+            searcher (AssignmentSearcher): Looks for plagiarism across the corpus, and across the entries of a batch.
+            corpus (CorpusSnapshot | None): The resident copy of the stored assignments. Defaults to a new snapshot of
+                the repository.
+            executor_threads (int): The number of threads that read and search the assignments being verified, off
+                the event loop. The files are read one at a time however many there are.
+            extraction_cache_path (str | None): The directory where what is read from each file is kept, by the file
+                hash, so that the same file is never read twice. None reads every file.
         """
         self.reader = reader
-        self.repository = repository
-        self.nlp = nlp
-        self.similarity_threshold = similarity_threshold
-        self.detect_plagiarism = detect_plagiarism
-
-    async def verify(self, command: VerifyAssignment) -> AssignmentVerified:
-        # create an assignment from a file
-        entry = self.reader.read(file=command.file)
-
-        logger.info(
-            "Read Assignment(id=%s, author=%s, topic=%s)",
-            str(command.id),
-            entry.author,
-            str(entry.topic),
+        self.corpus = corpus or CorpusSnapshot(repository)
+        self.searcher = searcher
+        self.executor = concurrent.futures.ThreadPoolExecutor(executor_threads, thread_name_prefix="verifier")
+        self._read_lock = asyncio.Lock()
+        self._search_lock = asyncio.Lock()
+        self.extraction_cache = (
+            ExtractionCache(
+                extraction_cache_path,
+                f"{__version__}-{self.vectors.model}",
+            )
+            if extraction_cache_path
+            else None
         )
 
-        if not entry.content:
-            logger.warning("Assignment %s is empty.", str(command.id))
-            return AssignmentVerified(id=command.id, author=entry.author)
-
-        entry.id = command.id
-        assignments: list[Assignment] = await self.repository.find_all()
-        comparisons: list[AssignmentCompared] = []
-
-        # using concurrent.futures to parallelize the comparisons
-        if self.detect_plagiarism:
-            logger.info("Comparing against %d assignments. This may take a while...", len(assignments))
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = [executor.submit(self.compare_assignments, assignment, entry) for assignment in assignments]
-
-                for future in concurrent.futures.as_completed(futures):
-                    result: AssignmentCompared = future.result()
-                    if result.similarities:
-                        comparisons.append(result)
-        else:
-            logger.warning("Assignment verification is disabled.")
+    @property
+    def vectors(self) -> AssignmentVectors:
+        """
+        Vectorizes the entries, as the corpus index does.
+        """
+        return self.searcher.index.vectors
 
-        # map the comparison results to the AssignmentVerification model
-        verifications = [AssignmentVerification(**comparison.model_dump()) for comparison in comparisons]
-        entry.similarities = verifications
+    async def verify(
+        self,
+        command: VerifyAssignment,
+        progress: VerificationProgress | None = None,
+    ) -> AssignmentVerified:
+        [verified] = await self.verify_batch([command], [progress] if progress else None)
 
-        persisted = await self.repository.save(entry)
+        if isinstance(verified, Exception):
+            raise verified
 
-        logger.info("Assignment(id=%s) verified.", str(persisted.id))
+        return verified
 
-        return AssignmentVerified(
-            id=persisted.id,
-            title=persisted.title,
-            author=persisted.author,
-            similarities=comparisons,
-        )
-
-    def compare_assignments(self, assignment: Assignment, entry: Assignment) -> AssignmentCompared:
+    async def verify_batch(
+        self,
+        commands: list[VerifyAssignment],
+        progress: list[VerificationProgress] | None = None,
+    ) -> list[AssignmentVerified | Exception]:
+        reports = dict(zip((command.id for command in commands), progress or []))
+        loop = asyncio.get_running_loop()
+
+        # parsing and searching are CPU bound, and run on the executor so that the event loop keeps serving requests,
+        # but the reader is not safe to share across threads (PyMuPDF, spaCy), so a single file is read at a time
+        entries: list[Assignment | Exception] = []
+
+        async with self._read_lock:
+            for command in commands:
+                try:
+                    entries.append(await loop.run_in_executor(self.executor, self._read, command))
+                except Exception as error:  # pylint: disable=broad-except
+                    logger.exception("Assignment(id=%s) could not be read.", str(command.id))
+                    entries.append(error)
+
+        batch = [entry for entry in entries if isinstance(entry, Assignment) and entry.content]
+        verified: dict[UUID, AssignmentVerified] = {}
+
+        # the indexes are shared, so a single batch is searched at a time
+        async with self._search_lock:
+            # a single spaCy batch for the sentences of every entry
+            await loop.run_in_executor(self.executor, self.vectors.vectorize_all, batch)
+            await loop.run_in_executor(self.executor, self._cache_extractions, batch)
+
+            # a retried job may have saved some entries already, which must not be compared against themselves
+            keys = {entry.id for entry in batch}
+            assignments = [assignment for assignment in await self.corpus.refresh() if assignment.id not in keys]
+
+            comparisons = await loop.run_in_executor(
+                self.executor, self.searcher.search_batch, batch, assignments, reports
+            )
+
+            # saved before the next batch is searched, so that it is compared against them
+            for entry in batch:
+                # map the comparison results to the AssignmentVerification model
+                entry.similarities = [
+                    AssignmentVerification(**comparison.model_dump()) for comparison in comparisons[entry.id]
+                ]
+
+                persisted = await self.corpus.repository.save(entry)
+                self.vectors.offload([persisted])
+                self.corpus.add(persisted)
+
+                logger.info("Assignment(id=%s) verified.", str(persisted.id))
+
+                verified[entry.id] = AssignmentVerified(
+                    id=persisted.id,
+                    title=persisted.title,
+                    author=persisted.author,
+                    similarities=comparisons[entry.id],
+                )
+
+        return [
+            entry
+            if isinstance(entry, Exception)
+            else verified.get(entry.id) or AssignmentVerified(id=entry.id, author=entry.author)
+            for entry in entries
+        ]
+
+    def _read(self, command: VerifyAssignment) -> Assignment:
         """
-        Given a new entry, looks for plagiarism in an assignment.
+        Creates an assignment from a file.
 
         Args:
-            assignment (Assignment): An assignment.
-            entry (Assignment): An assignment to check for plagiarism.
+            command (VerifyAssignment): A file reference and its type.
 
         Returns:
-            None: When the assignment is not plagiarized.
+            Assignment: The assignment, under the command ID.
         """
-        starting_time = datetime.datetime.now()
+        cached = self.extraction_cache.get(command.sha256) if self.extraction_cache and command.sha256 else None
 
-        # preliminary check to avoid unnecessary comparisons
-        entry_doc = self.nlp("".join(entry.content))
-        assignment_doc = self.nlp("".join(assignment.content))
-        similarity = entry_doc.similarity(assignment_doc)
+        if cached:
+            logger.info("Assignment(id=%s) already read from the same file.", str(command.id))
 
-        if similarity < MIN_ASSIGNMENT_SIMILARITY:
-            return AssignmentCompared(id=assignment.id, author=assignment.author, plagiarism=0.0)
+            cached.title = command.file.filename or cached.title
+            cached.date = datetime.date.today()
 
-        if similarity == 1:
-            logger.info("EXACTLY SAME AS %s Assignment(id=%s).", assignment.author, str(assignment.id))
-            return AssignmentCompared(id=assignment.id, author=assignment.author, plagiarism=1.0)
+        entry = cached or self.reader.read(file=command.file)
+        entry.id = command.id
+        entry.sha256 = command.sha256
 
         logger.info(
-            "Similar(%f) to Assignment(id=%s, author=%s, topic=%s)",
-            similarity,
-            str(assignment.id),
-            assignment.author,
-            str(assignment.topic),
+            "Read Assignment(id=%s, author=%s, topic=%s)",
+            str(command.id),
+            entry.author,
+            str(entry.topic),
         )
 
-        comparison_results: set[SentenceCompared] = set()
+        if entry.content:
+            sign(entry)
+        else:
+            logger.warning("Assignment %s is empty.", str(command.id))
 
-        # find the first plagiarized match for each entry sentence
-        for entry_sentence in entry.content:
-            for sentence in assignment.content:
-                result: SentenceCompared = self.compare_sentence(sentence=sentence, entry_sentence=entry_sentence)
-                if result.plagiarism >= self.similarity_threshold:
-                    comparison_results.add(result)
-                    break
+        return entry
 
-        plagiarism = sum(result.plagiarism for result in comparison_results) / len(entry.content)
+    def _cache_extractions(self, batch: list[Assignment]) -> None:
+        """
+        Keeps what was read from the file of each entry, along with its vectors, unless already kept.
 
-        seconds = (datetime.datetime.now() - starting_time).total_seconds()
+        Args:
+            batch (list[Assignment]): The vectorized assignments to check for plagiarism.
+        """
+        if not self.extraction_cache:
+            return
 
-        logger.info(
-            "Finished comparison with Assignment(id=%s, author=%s) in %f seconds.",
-            str(assignment.id),
-            assignment.author,
-            seconds,
-        )
+        for entry in batch:
+            if entry.sha256:
+                self.extraction_cache.put(entry.sha256, entry)
 
-        return AssignmentCompared(
-            id=assignment.id,
-            author=assignment.author,
-            similarities=list(comparison_results),
-            plagiarism=plagiarism,
-        )
+    def compare_assignments(self, assignment: Assignment, entry: Assignment) -> AssignmentCompared:
+        return self.searcher.compare_assignments(assignment, entry)
 
     def compare_sentence(self, sentence: str, entry_sentence: str) -> SentenceCompared:
-        # assume that the sentence is not plagiarized if it is too short
-        if len(sentence) < MIN_WORDS * WORD_AVG_LENGTH:
-            return SentenceCompared(present=sentence, compared=entry_sentence, plagiarism=0)
+        # sentences too different in their words are not worth vectorizing
+        if not self.searcher.comparer.lexical_gate.mask([sentence], [entry_sentence])[0, 0]:
+            return SentenceCompared(present=sentence, compared=entry_sentence, plagiarism=0.0)
 
-        persisted_sentence_doc = self.nlp(sentence)
-        entry_sentence_doc = self.nlp(entry_sentence)
-        similarity = persisted_sentence_doc.similarity(entry_sentence_doc)
+        [persisted_vector, entry_vector], _ = self.vectors.embed([sentence, entry_sentence])
+        similarities = cosine_similarities([entry_vector], [persisted_vector])
+        self.searcher.comparer.adjust_similarities([sentence], [entry_sentence], similarities)
 
-        return SentenceCompared(present=sentence, compared=entry_sentence, plagiarism=similarity)
+        return SentenceCompared(present=sentence, compared=entry_sentence, plagiarism=float(similarities[0, 0]))
@@ -0,0 +1,109 @@
+"""
+Boilerplate Sentences.
+
+Counts in how many stored assignments each sentence appears, by a hash of its normalized text. Sentences found in many
+assignments, such as cover page lines or the assignment prompts, are boilerplate: they are neither worth comparing nor
+evidence of plagiarism.
+"""
+import hashlib
+import re
+from collections import Counter
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+_NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+def sentence_hash(sentence: str) -> int:
+    """
+    Hashes a sentence regardless of its case, spacing and punctuation.
+
+    Args:
+        sentence (str): A sentence.
+
+    Returns:
+        int: A 64 bits hash of the normalized sentence.
+    """
+    normalized = _NON_WORD_PATTERN.sub(" ", sentence.lower()).strip()
+
+    return int.from_bytes(hashlib.blake2b(normalized.encode(), digest_size=8).digest(), "big")
+
+
+class BoilerplateTable(Generic[K]):
+    """
+    Document frequency table of the stored sentences.
+    """
+
+    def __init__(self, cutoff: int = 20):
+        """
+        Args:
+            cutoff (int): The number of stored assignments a sentence must appear in to be considered boilerplate.
+        """
+        self.cutoff = cutoff
+        self._frequencies: Counter[int] = Counter()
+        self._hashes: dict[K, set[int]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def keys(self) -> set[K]:
+        """
+        Returns:
+            set[K]: The keys of the counted documents.
+        """
+        return set(self._hashes)
+
+    def add(self, key: K, content: list[str]) -> None:
+        """
+        Counts the distinct sentences of a document, replacing any previous count under the same key.
+
+        Args:
+            key (K): The document key.
+            content (list[str]): The document sentences.
+        """
+        self.remove(key)
+
+        hashes = {sentence_hash(sentence) for sentence in content}
+        self._frequencies.update(hashes)
+        self._hashes[key] = hashes
+
+    def remove(self, key: K) -> None:
+        """
+        Discounts the sentences of a document, if present.
+
+        Args:
+            key (K): The document key.
+        """
+        hashes = self._hashes.pop(key, set())
+
+        self._frequencies.subtract(hashes)
+
+        for value in hashes:
+            if self._frequencies[value] <= 0:
+                del self._frequencies[value]
+
+    def frequency(self, sentence: str) -> int:
+        """
+        Args:
+            sentence (str): A sentence.
+
+        Returns:
+            int: The number of stored documents holding the sentence.
+        """
+        return self._frequencies.get(sentence_hash(sentence), 0)
+
+    def positions(self, content: list[str]) -> set[int]:
+        """
+        Finds the boilerplate sentences of a document.
+
+        Args:
+            content (list[str]): The document sentences.
+
+        Returns:
+            set[int]: The positions of the sentences that reach the cutoff.
+        """
+        return {position for position, sentence in enumerate(content) if self.frequency(sentence) >= self.cutoff}
@@ -0,0 +1,119 @@
+"""
+Corpus Snapshot.
+
+Keeps the stored assignments resident in the process, so that a verification does not load the whole corpus from the
+database. The snapshot only asks the repository for its version on every refresh. When only this process changed the
+corpus since, there is nothing to load. Otherwise, it diffs the revision of every stored assignment, and only loads the
+new assignments and those saved again.
+"""
+import asyncio
+import logging
+from uuid import UUID
+
+from heimdallr.adapters.repository import AsyncAssignmentRepository
+from heimdallr.domain.models.assignment import Assignment
+
+logger = logging.getLogger("uvicorn.error")
+
+"""
+Previous similarity reports are never compared, so they are not worth loading.
+"""
+EXCLUDED_FIELDS = ["similarities"]
+
+
+class CorpusSnapshot:
+    """
+    Process resident copy of the stored assignments.
+    """
+
+    def __init__(self, repository: AsyncAssignmentRepository, exclude: list[str] | None = None):
+        """
+        Args:
+            repository (AsyncAssignmentRepository): An assignment repository.
+            exclude (list[str] | None): More fields not worth loading, e.g. the sentence vectors when a vector store
+                holds them.
+        """
+        self.repository = repository
+        self.exclude = EXCLUDED_FIELDS + (exclude or [])
+        self.version: int | None = None
+        self._assignments: dict[UUID, Assignment] = {}
+        self._changes = 0
+        self._lock = asyncio.Lock()
+
+    def __contains__(self, key: UUID) -> bool:
+        return key in self._assignments
+
+    def __len__(self) -> int:
+        return len(self._assignments)
+
+    def assignments(self) -> list[Assignment]:
+        """
+        Returns:
+            list[Assignment]: The assignments in the snapshot.
+        """
+        return list(self._assignments.values())
+
+    async def refresh(self) -> list[Assignment]:
+        """
+        Brings the snapshot up to date with the repository, when its version changed.
+
+        Returns:
+            list[Assignment]: The stored assignments.
+        """
+        async with self._lock:
+            # read the version first, so that any later change is caught by the next refresh
+            version = await self.repository.version()
+
+            # every change in between was made by this process, and is already in the snapshot
+            if self.version is not None and version - self.version == self._changes:
+                self.version = version
+
+            if version != self.version:
+                revisions = await self.repository.find_revisions()
+
+                for key in self._assignments.keys() - revisions.keys():
+                    del self._assignments[key]
+
+                changed = [
+                    key
+                    for key, revision in revisions.items()
+                    if key not in self._assignments or self._assignments[key].revision != revision
+                ]
+
+                if changed:
+                    for assignment in await self.repository.find_by_ids(changed, exclude=self.exclude):
+                        self._assignments[assignment.id] = assignment
+
+                logger.info(
+                    "Corpus snapshot updated from version %s to %d: %d assignments, %d loaded.",
+                    self.version,
+                    version,
+                    len(self._assignments),
+                    len(changed),
+                )
+
+                self.version = version
+
+            self._changes = 0
+
+        return self.assignments()
+
+    def add(self, assignment: Assignment) -> None:
+        """
+        Adds an assignment this process just saved, with a single change of the repository version.
+
+        Args:
+            assignment (Assignment): A stored assignment.
+        """
+        self._changes += 1
+        self._assignments[assignment.id] = assignment.model_copy(update=dict.fromkeys(self.exclude))
+
+    def remove(self, key: UUID) -> None:
+        """
+        Removes an assignment this process just deleted, with a single change of the repository version.
+
+        Args:
+            key (UUID): The assignment ID.
+        """
+        self._changes += 1
+        self._assignments.pop(key, None)
@@ -0,0 +1,260 @@
+"""
+Corpus Index.
+
+Every index of the corpus shares the same interface: the keys of the indexed assignments, and adding and removing
+each of them by key. The corpus index keeps them all in a single tuple, in sync with the stored assignments, and looks
+up the stored sentences near or identical to those of an entry.
+"""
+from collections import defaultdict
+from typing import AbstractSet, Any, Container, Hashable, NamedTuple, Protocol, TypeVar
+from uuid import UUID
+
+from heimdallr.domain.models.assignment import Assignment
+from heimdallr.service_layer.assignment_vectors import AssignmentVectors
+from heimdallr.service_layer.boilerplate import BoilerplateTable
+from heimdallr.service_layer.document_index import DocumentIndex
+from heimdallr.service_layer.exact_copies import ExactCopyIndex
+from heimdallr.service_layer.fingerprints import FingerprintIndex, fingerprints
+from heimdallr.service_layer.near_duplicates import (
+    PERMUTATIONS,
+    NearDuplicateIndex,
+    minhash,
+)
+from heimdallr.service_layer.passages import PassageIndex
+from heimdallr.service_layer.sentence_comparer import MIN_SENTENCE_LENGTH
+from heimdallr.service_layer.sentence_index import SentenceHit, SentenceIndex
+from heimdallr.service_layer.topic_index import TopicIndex
+
+K = TypeVar("K", bound=Hashable)
+
+
+class Index(Protocol[K]):
+    """
+    An index of the corpus, holding whatever it needs of each assignment under its key.
+    """
+
+    def keys(self) -> AbstractSet[K]:
+        """
+        Returns:
+            AbstractSet[K]: The keys of the indexed assignments.
+        """
+
+    def add(self, key: K, *args: Any, **kwargs: Any) -> None:
+        """
+        Indexes an assignment, replacing any previous entry under the same key.
+        """
+
+    def remove(self, key: K) -> None:
+        """
+        Removes an assignment from the index, if present.
+        """
+
+
+class CorpusIndexes(NamedTuple):
+    """
+    The indexes of the corpus.
+
+    Attributes:
+        sentences (SentenceIndex): The vectors of the sentences long enough to be plagiarized.
+        documents (DocumentIndex): The vectors of the whole assignments.
+        duplicates (NearDuplicateIndex): The MinHash signatures of the assignments.
+        fingerprints (FingerprintIndex): The fingerprints of the assignments, to find verbatim passages.
+        exact_copies (ExactCopyIndex): The hashes of the sentences, to find the identical ones.
+        boilerplate (BoilerplateTable): The number of assignments holding each sentence.
+        topics (TopicIndex): The topic of each assignment.
+        passages (PassageIndex | None): The words of the assignments, to find the passages shared across sentences.
+    """
+
+    sentences: SentenceIndex[UUID]
+    documents: DocumentIndex[UUID]
+    duplicates: NearDuplicateIndex[UUID]
+    fingerprints: FingerprintIndex[UUID]
+    exact_copies: ExactCopyIndex[UUID]
+    boilerplate: BoilerplateTable[UUID]
+    topics: TopicIndex
+    passages: PassageIndex[UUID] | None
+
+
+def sign(assignment: Assignment) -> list[int]:
+    """
+    Computes the MinHash signature of an assignment, unless it already holds one.
+
+    Args:
+        assignment (Assignment): An assignment.
+
+    Returns:
+        list[int]: The assignment signature.
+    """
+    if not assignment.minhash or len(assignment.minhash) != PERMUTATIONS:
+        assignment.minhash = minhash(assignment.content)
+
+    return assignment.minhash
+
+
+class CorpusIndex:
+    """
+    Keeps the indexes of the corpus in sync with the stored assignments, and looks up their sentences.
+    """
+
+    def __init__(
+        self,
+        vectors: AssignmentVectors,
+        *,
+        neighbours: int = 50,
+        boilerplate_cutoff: int = 20,
+        min_passage_words: int = 0,
+    ):
+        """
+        Args:
+            vectors (AssignmentVectors): Vectorizes the assignments to index, and keeps their vectors.
+            neighbours (int): The maximum number of similar stored sentences looked up per entry sentence.
+            boilerplate_cutoff (int): The number of stored assignments a sentence must appear in to be considered
+                boilerplate, and never plagiarized.
+            min_passage_words (int): The minimum number of words of the passages looked up across sentences. Zero does
+                not look them up, nor keep their index in memory.
+        """
+        self.vectors = vectors
+        self.neighbours = neighbours
+        self.indexes = CorpusIndexes(
+            sentences=SentenceIndex(store=vectors.store),
+            documents=DocumentIndex(),
+            duplicates=NearDuplicateIndex(),
+            fingerprints=FingerprintIndex(),
+            exact_copies=ExactCopyIndex(),
+            boilerplate=BoilerplateTable(boilerplate_cutoff),
+            topics=TopicIndex(),
+            passages=PassageIndex(min_passage_words) if min_passage_words > 0 else None,
+        )
+        self._revisions: dict[UUID, UUID | None] = {}
+
+    def sync(self, corpus: dict[UUID, Assignment]) -> None:
+        """
+        Keeps every index in sync with the stored assignments, indexing the new ones, dropping the deleted, and
+        indexing again those saved since.
+
+        Args:
+            corpus (dict[UUID, Assignment]): The stored assignments, by ID.
+        """
+        kept = {
+            key
+            for key, assignment in corpus.items()
+            if key not in self._revisions or self._revisions[key] == assignment.revision
+        }
+        indexes: list[Index[UUID]] = [index for index in self.indexes if index is not None]
+
+        if self.vectors.store is not None:
+            for key in self.indexes.sentences.keys() - kept:
+                self.vectors.store.remove(key)
+
+        for index in indexes:
+            for key in index.keys() - kept:
+                index.remove(key)
+
+        for key in self._revisions.keys() - kept:
+            del self._revisions[key]
+
+        new_assignments = {key: assignment for key, assignment in corpus.items() if key not in self.indexes.sentences}
+        self.vectors.vectorize_all(list(new_assignments.values()))
+        self.vectors.offload(list(new_assignments.values()))
+
+        for key, assignment in new_assignments.items():
+            self._revisions[key] = assignment.revision
+
+            for index, features in self._features(assignment):
+                index.add(key, *features)
+
+    def _features(self, assignment: Assignment) -> list[tuple[Index[UUID], tuple[Any, ...]]]:
+        """
+        Args:
+            assignment (Assignment): A vectorized assignment.
+
+        Returns:
+            list[tuple[Index[UUID], tuple[Any, ...]]]: The indexes worth adding the assignment to, and what each one
+                holds of it.
+        """
+        indexes = self.indexes
+        # sentences too short are never considered plagiarized, so they are not worth indexing
+        positions = [
+            position for position, sentence in enumerate(assignment.content) if len(sentence) >= MIN_SENTENCE_LENGTH
+        ]
+        features: list[tuple[Index[UUID], tuple[Any, ...]]] = [
+            (indexes.sentences, (self.vectors.sentence_vectors(assignment, positions), positions)),
+            (indexes.duplicates, (sign(assignment),)),
+            (indexes.fingerprints, (fingerprints(assignment.content),)),
+            (indexes.exact_copies, (assignment.content,)),
+            (indexes.boilerplate, (assignment.content,)),
+            (indexes.topics, (assignment.topic,)),
+        ]
+
+        if assignment.document_vector:
+            features.append((indexes.documents, (assignment.document_vector,)))
+
+        if indexes.passages is not None:
+            features.append((indexes.passages, (assignment.content,)))
+
+        return features
+
+    def sentence_matches(
+        self,
+        entry: Assignment,
+        keys: Container[UUID],
+        threshold: float,
+        skipped: Container[int] = (),
+    ) -> dict[UUID, dict[int, SentenceHit]]:
+        """
+        Looks up the nearest stored sentences of each entry sentence in the sentence index.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            keys (Container[UUID]): The IDs of the assignments to look in.
+            threshold (float): The minimum similarity required to consider a sentence plagiarized.
+            skipped (Container[int]): The positions of the entry sentences not to look up.
+
+        Returns:
+            dict[UUID, dict[int, SentenceHit]]: The first plagiarized match of each entry sentence, by assignment ID.
+        """
+        # boilerplate sentences are found in too many assignments to be worth looking up
+        boilerplate = self.indexes.boilerplate.positions(entry.content)
+        rows = [row for row in range(len(entry.content)) if row not in boilerplate and row not in skipped]
+
+        hits = self.indexes.sentences.query(
+            self.vectors.sentence_vectors(entry, rows),
+            threshold=threshold,
+            neighbours=self.neighbours,
+            keys=keys,
+        )
+
+        # keep the first plagiarized match of each entry sentence, per assignment
+        matches: dict[UUID, dict[int, SentenceHit]] = defaultdict(dict)
+
+        for row, entry_hits in zip(rows, hits):
+            for hit in entry_hits:
+                match = matches[hit.key].get(row)
+                if match is None or hit.position < match.position:
+                    matches[hit.key][row] = hit
+
+        return matches
+
+    def exact_matches(self, entry: Assignment, keys: Container[UUID]) -> dict[UUID, dict[int, SentenceHit]]:
+        """
+        Looks up the stored sentences identical to each entry sentence.
+
+        Args:
+            entry (Assignment): An assignment to check for plagiarism.
+            keys (Container[UUID]): The IDs of the assignments to look in.
+
+        Returns:
+            dict[UUID, dict[int, SentenceHit]]: The first identical sentence of each entry sentence, by assignment ID.
+        """
+        # neither boilerplate sentences nor those too short are ever plagiarized
+        boilerplate = self.indexes.boilerplate.positions(entry.content)
+        rows = [
+            row
+            for row, sentence in enumerate(entry.content)
+            if row not in boilerplate and len(sentence) >= MIN_SENTENCE_LENGTH
+        ]
+
+        return {
+            key: {rows[index]: SentenceHit(key, position, 1.0) for index, position in copies.items()}
+            for key, copies in self.indexes.exact_copies.query([entry.content[row] for row in rows], keys).items()
+        }
@@ -0,0 +1,111 @@
+"""
+Document Vectors Index.
+
+Keeps the document vector of every stored assignment in one resident matrix, so that an entry is compared against the
+whole corpus with a single matrix-vector product.
+"""
+from typing import Generic, Hashable, TypeVar
+
+import numpy as np
+
+from heimdallr.service_layer.similarity import normalize
+
+K = TypeVar("K", bound=Hashable)
+
+
+class DocumentIndex(Generic[K]):
+    """
+    Resident matrix of unit-normalized document vectors, keyed by document.
+
+    Rows are appended as documents are added, and a removed row is filled with the last one, so the matrix stays dense.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity (int): Initial number of rows to allocate. The matrix doubles its size when full.
+        """
+        self.capacity = capacity
+        self._matrix: np.ndarray | None = None
+        self._keys: list[K] = []
+        self._rows: dict[K, int] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._rows
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def keys(self) -> set[K]:
+        """
+        Returns:
+            set[K]: The keys of the indexed documents.
+        """
+        return set(self._rows)
+
+    def add(self, key: K, vector: np.ndarray | list[float]) -> None:
+        """
+        Indexes the vector of a document, replacing any previous vector under the same key.
+
+        Args:
+            key (K): The document key.
+            vector (np.ndarray | list[float]): The document vector.
+        """
+        [unit] = normalize(np.atleast_2d(vector))
+
+        if self._matrix is None:
+            self._matrix = np.zeros((self.capacity, len(unit)), dtype=np.float32)
+
+        row = self._rows.get(key)
+
+        if row is None:
+            row = len(self._keys)
+
+            if row == len(self._matrix):
+                self._matrix = np.concatenate([self._matrix, np.zeros_like(self._matrix)])
+
+            self._keys.append(key)
+            self._rows[key] = row
+
+        self._matrix[row] = unit
+
+    def remove(self, key: K) -> None:
+        """
+        Removes a document from the index, if present.
+
+        Args:
+            key (K): The document key.
+        """
+        row = self._rows.pop(key, None)
+
+        if row is None or self._matrix is None:
+            return
+
+        last = len(self._keys) - 1
+
+        if row != last:
+            self._matrix[row] = self._matrix[last]
+            self._keys[row] = self._keys[last]
+            self._rows[self._keys[row]] = row
+
+        self._keys.pop()
+
+    def search(self, vector: np.ndarray | list[float], threshold: float) -> dict[K, float]:
+        """
+        Looks for the documents whose similarity against a vector reaches a threshold.
+
+        Args:
+            vector (np.ndarray | list[float]): A document vector.
+            threshold (float): The minimum cosine similarity.
+
+        Returns:
+            dict[K, float]: The cosine similarity of each document found, by key.
+        """
+        if self._matrix is None or not self._keys:
+            return {}
+
+        [unit] = normalize(np.atleast_2d(vector))
+        similarities = self._matrix[: len(self._keys)] @ unit
+        rows = np.flatnonzero(similarities >= threshold)
+
+        return {self._keys[row]: min(float(similarities[row]), 1.0) for row in rows}
@@ -0,0 +1,60 @@
+"""
+Sentence Embeddings.
+
+A Doc vector is the average of the static vectors of its tokens, which only needs the tokenizer. Running the tagger,
+parser, named entity recognizer and lemmatizer over every sentence is wasted work, so the embedder disables every
+pipeline component and streams sentences through nlp.pipe in batches.
+"""
+import numpy as np
+from spacy import Language
+
+
+class SpacyEmbedder:
+    """
+    Turns sentences into a matrix of spaCy vectors.
+    """
+
+    def __init__(self, nlp: Language, batch_size: int = 256, n_process: int = 1):
+        """
+        Args:
+            nlp (Language): The Natural Language Processor. It must hold static word vectors.
+            batch_size (int): Sentences per nlp.pipe batch.
+            n_process (int): Processes spaCy spreads the batches over.
+        """
+        self.nlp = nlp
+        self.batch_size = batch_size
+        self.n_process = n_process
+
+    @property
+    def width(self) -> int:
+        """
+        Dimensions of the sentence vectors.
+        """
+        return self.nlp.vocab.vectors_length
+
+    def embed(self, sentences: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the vector of each sentence.
+
+        Args:
+            sentences (list[str]): The sentences to vectorize.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (sentences x dimensions) vectors matrix, and the number of tokens of each
+                sentence.
+        """
+        matrix = np.zeros((len(sentences), self.width), dtype=np.float32)
+        tokens = np.zeros(len(sentences), dtype=np.int64)
+
+        docs = self.nlp.pipe(
+            sentences,
+            batch_size=self.batch_size,
+            n_process=self.n_process,
+            disable=self.nlp.pipe_names,
+        )
+
+        for row, doc in enumerate(docs):
+            matrix[row] = doc.vector
+            tokens[row] = len(doc)
+
+        return matrix, tokens
@@ -0,0 +1,103 @@
+"""
+Exact Copies.
+
+A large share of the plagiarized sentences are byte-identical to a stored one, once the reader normalized them. Those
+are resolved without any vector: each stored sentence is hashed into a postings map, from the hash to the sentences
+holding it, so that looking up an entry sentence costs a single dictionary lookup.
+"""
+import hashlib
+from collections import defaultdict
+from typing import Container, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+def exact_hash(sentence: str) -> int:
+    """
+    Hashes a sentence as it is.
+
+    Args:
+        sentence (str): A normalized sentence.
+
+    Returns:
+        int: A 64 bits hash of the sentence.
+    """
+    return int.from_bytes(hashlib.blake2b(sentence.encode(), digest_size=8).digest(), "big")
+
+
+class ExactCopyIndex(Generic[K]):
+    """
+    Inverted index from the hash of each stored sentence to the sentences holding it.
+    """
+
+    def __init__(self):
+        self._postings: dict[int, set[tuple[K, int]]] = defaultdict(set)
+        self._hashes: dict[K, list[int]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def keys(self) -> set[K]:
+        """
+        Returns:
+            set[K]: The keys of the indexed documents.
+        """
+        return set(self._hashes)
+
+    def add(self, key: K, content: list[str]) -> None:
+        """
+        Indexes the sentences of a document, replacing any previous entry under the same key.
+
+        Args:
+            key (K): The document key.
+            content (list[str]): The document sentences.
+        """
+        self.remove(key)
+
+        hashes = [exact_hash(sentence) for sentence in content]
+
+        for position, value in enumerate(hashes):
+            self._postings[value].add((key, position))
+
+        self._hashes[key] = hashes
+
+    def remove(self, key: K) -> None:
+        """
+        Removes a document from the index, if present.
+
+        Args:
+            key (K): The document key.
+        """
+        for position, value in enumerate(self._hashes.pop(key, [])):
+            postings = self._postings[value]
+            postings.discard((key, position))
+
+            if not postings:
+                del self._postings[value]
+
+    def query(self, content: list[str], keys: Container[K] | None = None) -> dict[K, dict[int, int]]:
+        """
+        Looks for the stored sentences identical to each given sentence.
+
+        Args:
+            content (list[str]): The entry sentences.
+            keys (Container[K] | None): When given, only the documents to look into.
+
+        Returns:
+            dict[K, dict[int, int]]: For each document, the position of its first sentence identical to each
+                entry sentence, by the entry sentence position.
+        """
+        copies: dict[K, dict[int, int]] = defaultdict(dict)
+
+        for row, sentence in enumerate(content):
+            for key, position in self._postings.get(exact_hash(sentence), ()):
+                if keys is not None and key not in keys:
+                    continue
+
+                if position < copies[key].get(row, position + 1):
+                    copies[key][row] = position
+
+        return copies
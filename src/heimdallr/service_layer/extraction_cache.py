@@ -0,0 +1,79 @@
+"""
+Extraction Cache.
+
+Students and teachers upload the very same files again and again, and reading one, i.e. extracting its text, splitting
+it into sentences, finding out its author and topic, and vectorizing its sentences, takes seconds. This cache keeps the
+result of reading each file on disk, by the SHA-256 hash of the file, under a directory for the version of the reading
+pipeline, so that a file already read is never read again, and a new pipeline never gets stale results.
+"""
+import os
+
+from heimdallr.domain.models.assignment import Assignment
+
+# the fields that depend on the file contents only, not on the upload
+CACHED_FIELDS = {"author", "topic", "content", "vectors", "document_vector", "vectors_model", "minhash"}
+
+
+class ExtractionCache:
+    """
+    On-disk store of read assignments, by the SHA-256 hash of their file.
+
+    Entries are written atomically, so the directory may be shared by the processes of a node.
+    """
+
+    def __init__(self, path: str, version: str):
+        """
+        Args:
+            path (str): The directory of the cache.
+            version (str): The version of the reading pipeline, e.g. the application and language model versions.
+        """
+        self.path = os.path.join(path, version)
+        self.version = version
+
+        os.makedirs(self.path, exist_ok=True)
+
+    def __contains__(self, sha256: str) -> bool:
+        return os.path.exists(self._entry_path(sha256))
+
+    def get(self, sha256: str) -> Assignment | None:
+        """
+        Args:
+            sha256 (str): The hash of a file.
+
+        Returns:
+            Assignment | None: What reading the file produced, or None when it was not read yet.
+        """
+        try:
+            with open(self._entry_path(sha256), encoding="utf-8") as file:
+                return Assignment.model_validate_json(file.read())
+        except FileNotFoundError:
+            return None
+
+    def put(self, sha256: str, assignment: Assignment) -> None:
+        """
+        Keeps what reading a file produced, unless it is already kept.
+
+        Args:
+            sha256 (str): The hash of the file.
+            assignment (Assignment): The assignment read from the file.
+        """
+        if sha256 in self:
+            return
+
+        path = self._entry_path(sha256)
+        temporary = f"{path}.{os.getpid()}"
+
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(assignment.model_dump_json(include=CACHED_FIELDS))
+
+        os.replace(temporary, path)
+
+    def _entry_path(self, sha256: str) -> str:
+        """
+        Args:
+            sha256 (str): The hash of a file.
+
+        Returns:
+            str: The path of its entry.
+        """
+        return os.path.join(self.path, f"{sha256}.json")
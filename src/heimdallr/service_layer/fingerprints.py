@@ -0,0 +1,161 @@
+"""
+Winnowing Fingerprints.
+
+Selects a few hashes of the character k-grams of a normalized text, as MOSS does, so that any passage shared by two
+texts, long enough, shares at least one fingerprint. An inverted index from fingerprints to sentences then finds the
+verbatim passages of an entry with one dictionary lookup per fingerprint.
+
+See Also:
+    https://theory.stanford.edu/~aiken/publications/papers/sigmod03.pdf
+"""
+import re
+from collections import defaultdict
+from typing import Generic, Hashable, NamedTuple, TypeVar
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+K = TypeVar("K", bound=Hashable)
+
+K_GRAM_SIZE = 25
+WINDOW_SIZE = 10
+
+_NON_WORD_PATTERN = re.compile(r"[\W_]+")
+_BASE = np.uint64(1_000_003)
+
+
+class Fingerprint(NamedTuple):
+    """
+    A selected k-gram hash.
+
+    Attributes:
+        value (int): The k-gram hash.
+        position (int): The position of the sentence where the k-gram starts.
+    """
+
+    value: int
+    position: int
+
+
+class SharedFingerprint(NamedTuple):
+    """
+    A fingerprint found both in an entry and in a stored document.
+
+    Attributes:
+        value (int): The k-gram hash.
+        entry_position (int): The position of the entry sentence holding it.
+        position (int): The position of the stored sentence holding it.
+    """
+
+    value: int
+    entry_position: int
+    position: int
+
+
+def fingerprints(content: list[str], k: int = K_GRAM_SIZE, window: int = WINDOW_SIZE) -> list[Fingerprint]:
+    """
+    Computes the winnowing fingerprints of a text.
+
+    The text is lowercased and stripped of whitespaces and punctuation, so that layout changes do not hide a copy.
+    Then, for every window of consecutive k-gram hashes, the minimum one is selected.
+
+    Args:
+        content (list[str]): The sentences of an assignment.
+        k (int): Characters per k-gram.
+        window (int): k-gram hashes per window.
+
+    Returns:
+        list[Fingerprint]: The selected fingerprints, in text order.
+    """
+    sentences = [_NON_WORD_PATTERN.sub("", sentence.lower()) for sentence in content]
+    text = "".join(sentences)
+
+    if len(text) < k:
+        return []
+
+    owners = np.repeat(np.arange(len(sentences)), [len(sentence) for sentence in sentences])
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+    # polynomial hash of every k-gram, wrapping around 2^64
+    powers = _BASE ** np.arange(k - 1, -1, -1, dtype=np.uint64)
+    hashes = sliding_window_view(codes, k) @ powers
+
+    if len(hashes) <= window:
+        selected = np.array([len(hashes) - 1 - np.argmin(hashes[::-1])])
+    else:
+        # the rightmost minimum of each window
+        windows = sliding_window_view(hashes, window)
+        selected = np.unique(np.arange(len(windows)) + window - 1 - np.argmin(windows[:, ::-1], axis=1))
+
+    return [Fingerprint(int(hashes[i]), int(owners[i])) for i in selected]
+
+
+class FingerprintIndex(Generic[K]):
+    """
+    Inverted index from fingerprints to the stored sentences holding them.
+    """
+
+    def __init__(self):
+        self._postings: dict[int, set[tuple[K, int]]] = defaultdict(set)
+        self._fingerprints: dict[K, list[Fingerprint]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._fingerprints
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def keys(self) -> set[K]:
+        """
+        Returns:
+            set[K]: The keys of the indexed documents.
+        """
+        return set(self._fingerprints)
+
+    def add(self, key: K, document_fingerprints: list[Fingerprint]) -> None:
+        """
+        Indexes the fingerprints of a document, replacing any previous entry under the same key.
+
+        Args:
+            key (K): The document key.
+            document_fingerprints (list[Fingerprint]): The document fingerprints.
+        """
+        self.remove(key)
+
+        for fingerprint in document_fingerprints:
+            self._postings[fingerprint.value].add((key, fingerprint.position))
+
+        self._fingerprints[key] = document_fingerprints
+
+    def remove(self, key: K) -> None:
+        """
+        Removes a document from the index, if present.
+
+        Args:
+            key (K): The document key.
+        """
+        for fingerprint in self._fingerprints.pop(key, []):
+            postings = self._postings.get(fingerprint.value)
+
+            if postings is not None:
+                postings.discard((key, fingerprint.position))
+                if not postings:
+                    del self._postings[fingerprint.value]
+
+    def query(self, entry_fingerprints: list[Fingerprint]) -> dict[K, list[SharedFingerprint]]:
+        """
+        Looks for the stored documents sharing fingerprints with an entry.
+
+        Args:
+            entry_fingerprints (list[Fingerprint]): The entry fingerprints.
+
+        Returns:
+            dict[K, list[SharedFingerprint]]: The shared fingerprints, by document key.
+        """
+        shared: dict[K, list[SharedFingerprint]] = defaultdict(list)
+
+        for fingerprint in entry_fingerprints:
+            for key, position in self._postings.get(fingerprint.value, ()):
+                shared[key].append(SharedFingerprint(fingerprint.value, fingerprint.position, position))
+
+        return dict(shared)
@@ -0,0 +1,268 @@
+"""
+Job Worker.
+
+Pulls queued verifications from the job repository and runs them, so that verifying happens outside the API process.
+A claimed job is leased to the worker, which renews the lease while verifying. When a worker dies, its lease expires and
+another worker claims the job again, until it runs out of attempts. A worker that loses a lease stops verifying, so that
+it saves nothing the worker claiming the job again saves too.
+
+While verifying, the worker also reports the progress of the job, and the plagiarized assignments found so far, every
+few seconds. The files submitted together share a batch, whose jobs are claimed and verified together.
+"""
+import asyncio
+import datetime
+import logging
+import os
+import socket
+import tempfile
+from uuid import UUID
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from heimdallr.adapters.repository import AsyncJobRepository
+from heimdallr.domain.commands.assignments import VerifyAssignment
+from heimdallr.domain.models.assignment import AssignmentVerification
+from heimdallr.domain.models.job import Job
+from heimdallr.service_layer.assignment_verifier import AssignmentVerifier
+from heimdallr.service_layer.progress import VerificationProgress
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class JobWorker:
+    """
+    Runs queued assignment verifications.
+    """
+
+    def __init__(
+        self,
+        jobs: AsyncJobRepository,
+        verifier: AssignmentVerifier,
+        *,
+        name: str | None = None,
+        lease_seconds: int = 300,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        progress_interval: float = 2.0,
+    ):
+        """
+        Args:
+            jobs (AsyncJobRepository): The job queue.
+            verifier (AssignmentVerifier): The assignment verifier service.
+            name (str | None): The worker name, defaults to its host name and process ID.
+            lease_seconds (int): How long the worker holds a job before renewing its lease.
+            max_attempts (int): How many times a job is tried before it is failed.
+            poll_interval (float): Seconds to wait for new jobs when the queue is empty.
+            progress_interval (float): Seconds between progress reports of the running job.
+        """
+        self.jobs = jobs
+        self.verifier = verifier
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease = datetime.timedelta(seconds=lease_seconds)
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.progress_interval = progress_interval
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """
+        Runs jobs until asked to stop. The running job is finished before stopping.
+
+        Args:
+            stop (asyncio.Event): Set to stop the worker.
+        """
+        logger.info("Worker %s started.", self.name)
+
+        while not stop.is_set():
+            if await self.run_once():
+                continue
+
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.info("Worker %s stopped.", self.name)
+
+    async def run_once(self) -> bool:
+        """
+        Claims and runs the oldest available job, together with the rest of its batch.
+
+        Returns:
+            bool: Whether a job was run.
+        """
+        job = await self.jobs.claim(worker=self.name, lease=self.lease, max_attempts=self.max_attempts)
+
+        if job is None:
+            return False
+
+        batch = [job]
+
+        if job.batch_id:
+            batch += await self.jobs.claim_batch(job.batch_id, worker=self.name, lease=self.lease)
+
+        logger.info("Worker %s running %d jobs from job %s, attempt %d.", self.name, len(batch), job.id, job.attempts)
+        progress = {job.id: VerificationProgress() for job in batch}
+        monitor = asyncio.create_task(self._report_every(batch, progress))
+        lost: set[UUID] = set()
+
+        try:
+            errors, lost = await self._verify_leased(batch, progress)
+        except Exception as error:  # pylint: disable=broad-except
+            logger.exception("Job %s failed.", job.id)
+            errors = {failed.id: error for failed in batch}
+        else:
+            await self._report(batch, progress)
+        finally:
+            monitor.cancel()
+
+        # only the jobs whose files could not be read fail, the rest of their batch is done
+        for ran in batch:
+            if ran.id in lost:
+                # left to the worker claiming it again
+                continue
+
+            if ran.id in errors:
+                retry = ran.attempts < self.max_attempts
+                await self.jobs.fail(ran.id, worker=self.name, error=repr(errors[ran.id]), retry=retry)
+            else:
+                await self.jobs.complete(ran.id, worker=self.name)
+
+        return True
+
+    async def _verify_leased(
+        self,
+        batch: list[Job],
+        progress: dict[UUID, VerificationProgress],
+    ) -> tuple[dict[UUID, Exception], set[UUID]]:
+        """
+        Verifies the jobs while renewing their leases. Once a lease is lost, another worker may claim that job again, so
+        the verification is cancelled before it saves anything else, and the rest of the batch fails.
+
+        Args:
+            batch (list[Job]): The running jobs.
+            progress (dict[UUID, VerificationProgress]): The progress of each verification, by job ID.
+
+        Returns:
+            tuple[dict[UUID, Exception], set[UUID]]: The error of each job that failed, by job ID, and the IDs of the
+                jobs whose lease was lost.
+        """
+        verification = asyncio.create_task(self._verify(batch, progress))
+        heartbeat = asyncio.create_task(self._heartbeat(batch))
+
+        try:
+            await asyncio.wait([verification, heartbeat], return_when=asyncio.FIRST_COMPLETED)
+
+            if verification.done():
+                return verification.result(), set()
+
+            lost = heartbeat.result()
+            verification.cancel()
+            # lets the verification close the files
+            await asyncio.wait([verification])
+
+            return {job.id: RuntimeError("A lease of the batch was lost.") for job in batch}, lost
+        finally:
+            verification.cancel()
+            heartbeat.cancel()
+
+    async def _verify(self, batch: list[Job], progress: dict[UUID, VerificationProgress]) -> dict[UUID, Exception]:
+        """
+        Verifies a single job on its own, and the jobs of a batch together.
+
+        Args:
+            batch (list[Job]): The running jobs.
+            progress (dict[UUID, VerificationProgress]): The progress of each verification, by job ID.
+
+        Returns:
+            dict[UUID, Exception]: The error of each job of a batch whose file could not be read, by job ID. The rest
+                were verified.
+        """
+        commands: list[VerifyAssignment] = []
+
+        try:
+            for job in batch:
+                commands.append(await self._command(job))
+
+            if len(commands) == 1:
+                await self.verifier.verify(command=commands[0], progress=progress[batch[0].id])
+                return {}
+
+            results = await self.verifier.verify_batch(commands=commands, progress=[progress[job.id] for job in batch])
+
+            return {job.id: result for job, result in zip(batch, results) if isinstance(result, Exception)}
+        finally:
+            for command in commands:
+                await command.file.close()
+
+    async def _heartbeat(self, batch: list[Job]) -> set[UUID]:
+        """
+        Renews the job leases every third of them, until cancelled or a lease is lost.
+
+        Args:
+            batch (list[Job]): The running jobs.
+
+        Returns:
+            set[UUID]: The IDs of the jobs whose lease was lost.
+        """
+        while True:
+            await asyncio.sleep(self.lease.total_seconds() / 3)
+
+            lost = {job.id for job in batch if not await self.jobs.renew(job.id, worker=self.name, lease=self.lease)}
+
+            for job_id in lost:
+                logger.warning("Worker %s lost the lease of job %s.", self.name, job_id)
+
+            if lost:
+                return lost
+
+    async def _report_every(self, batch: list[Job], progress: dict[UUID, VerificationProgress]) -> None:
+        """
+        Reports the progress of the jobs every progress interval, until cancelled.
+
+        Args:
+            batch (list[Job]): The running jobs.
+            progress (dict[UUID, VerificationProgress]): The progress of each verification, by job ID.
+        """
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            await self._report(batch, progress)
+
+    async def _report(self, batch: list[Job], progress: dict[UUID, VerificationProgress]) -> None:
+        """
+        Args:
+            batch (list[Job]): The running jobs.
+            progress (dict[UUID, VerificationProgress]): The progress of each verification, by job ID.
+        """
+        for job in batch:
+            compared, total, results = progress[job.id].snapshot()
+            similarities = [AssignmentVerification(**result.model_dump()) for result in results]
+
+            await self.jobs.report(job.id, worker=self.name, compared=compared, total=total, similarities=similarities)
+
+    async def _command(self, job: Job) -> VerifyAssignment:
+        """
+        Args:
+            job (Job): A claimed job.
+
+        Returns:
+            VerifyAssignment: The command that verifies the uploaded file under the job ID.
+        """
+        # a file on disk, rather than in memory, so that the readers open it by path, and the page pool shares it
+        data = tempfile.TemporaryFile(prefix="temp_upload_")
+
+        try:
+            await self.jobs.read_upload(job, data)
+        except BaseException:
+            data.close()
+            raise
+
+        data.seek(0)
+
+        file = UploadFile(
+            file=data,
+            filename=job.filename,
+            headers=Headers({"content-type": job.content_type or ""}),
+        )
+
+        return VerifyAssignment(id=job.id, file=file, sha256=job.sha256)
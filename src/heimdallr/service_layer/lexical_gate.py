@@ -0,0 +1,151 @@
+"""
+Lexical Gate.
+
+Almost every pair of sentences of two assignments shares nearly no vocabulary, and a plagiarized sentence shares most of
+its words with its source. Before comparing their vectors, the gate rules out the pairs whose lengths are too far apart,
+and then those that share too few distinct words, using integer token IDs rather than spaCy. The IDs are given per
+comparison, so the gate keeps no vocabulary that grows with every sentence it sees.
+
+Both checks may rule out a pair whose vectors are similar enough, e.g. a sentence padded with a few words, so the gate
+is disabled unless its minimums are set.
+"""
+import re
+import threading
+
+import numpy as np
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class LexicalGate:
+    """
+    Thread safe cascade of lexical checks over sentence pairs, counting how many pairs each check prunes.
+    """
+
+    def __init__(self, min_length_ratio: float = 0.0, min_overlap: float = 0.0):
+        """
+        Args:
+            min_length_ratio (float): The minimum ratio of the shortest to the longest sentence of a pair, in words.
+                Zero disables the check.
+            min_overlap (float): The minimum fraction of the distinct words of the shortest sentence of a pair found
+                in the other one. Zero disables the check.
+        """
+        self.min_length_ratio = min_length_ratio
+        self.min_overlap = min_overlap
+        self.pruned_by_length = 0
+        self.pruned_by_overlap = 0
+        self.passed = 0
+        self._lock = threading.Lock()
+
+    def mask(self, sentences: list[str], entry_sentences: list[str]) -> np.ndarray:
+        """
+        Finds the sentence pairs worth comparing by their vectors.
+
+        Args:
+            sentences (list[str]): Sentences from an assignment already persisted.
+            entry_sentences (list[str]): Sentences from a new entry to be checked for plagiarism.
+
+        Returns:
+            np.ndarray: A (entry sentences x sentences) boolean matrix, true for the pairs that pass every check.
+        """
+        vocabulary: dict[str, int] = {}
+        tokens = [self._tokens(sentence, vocabulary) for sentence in sentences]
+        entry_tokens = [self._tokens(sentence, vocabulary) for sentence in entry_sentences]
+        passed = np.ones((len(entry_tokens), len(tokens)), dtype=bool)
+
+        if not passed.size:
+            return passed
+
+        if self.min_length_ratio > 0:
+            passed &= self._length_ratios(tokens, entry_tokens) >= self.min_length_ratio
+
+        pruned_by_length = passed.size - int(passed.sum())
+
+        if self.min_overlap > 0 and passed.any():
+            passed &= self._overlaps(tokens, entry_tokens) >= self.min_overlap
+
+        with self._lock:
+            self.pruned_by_length += pruned_by_length
+            self.pruned_by_overlap += passed.size - int(passed.sum()) - pruned_by_length
+            self.passed += int(passed.sum())
+
+        return passed
+
+    @staticmethod
+    def _tokens(sentence: str, vocabulary: dict[str, int]) -> list[int]:
+        """
+        Args:
+            sentence (str): A sentence.
+            vocabulary (dict[str, int]): The ID of each word of the compared sentences, extended with the new ones.
+
+        Returns:
+            list[int]: The ID of each lowercase word of the sentence.
+        """
+        return [vocabulary.setdefault(word, len(vocabulary)) for word in _WORD_PATTERN.findall(sentence.lower())]
+
+    @staticmethod
+    def _length_ratios(tokens: list[list[int]], entry_tokens: list[list[int]]) -> np.ndarray:
+        """
+        Args:
+            tokens (list[list[int]]): The token IDs of each persisted sentence.
+            entry_tokens (list[list[int]]): The token IDs of each entry sentence.
+
+        Returns:
+            np.ndarray: A (entry sentences x sentences) matrix, the shorter length of each pair over the longer one.
+        """
+        lengths = np.array([len(sentence_tokens) for sentence_tokens in tokens], dtype=np.float32)
+        entry_lengths = np.array([len(sentence_tokens) for sentence_tokens in entry_tokens], dtype=np.float32)
+
+        return LexicalGate._ratio(np.minimum.outer(entry_lengths, lengths), np.maximum.outer(entry_lengths, lengths))
+
+    @staticmethod
+    def _overlaps(tokens: list[list[int]], entry_tokens: list[list[int]]) -> np.ndarray:
+        """
+        Args:
+            tokens (list[list[int]]): The token IDs of each persisted sentence.
+            entry_tokens (list[list[int]]): The token IDs of each entry sentence.
+
+        Returns:
+            np.ndarray: A (entry sentences x sentences) matrix, the distinct words each pair shares over those of its
+                sentence with fewer.
+        """
+        incidence, entry_incidence = LexicalGate._incidence(tokens, entry_tokens)
+        distinct, entry_distinct = incidence.sum(axis=1), entry_incidence.sum(axis=1)
+
+        return LexicalGate._ratio(entry_incidence @ incidence.T, np.minimum.outer(entry_distinct, distinct))
+
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """
+        Divides two matrices, where a pair without words has nothing to rule it out.
+
+        Args:
+            numerator (np.ndarray): A matrix.
+            denominator (np.ndarray): A matrix of the same shape.
+
+        Returns:
+            np.ndarray: The element-wise ratio, one where the denominator is zero.
+        """
+        return np.divide(numerator, denominator, out=np.ones_like(numerator, dtype=np.float32), where=denominator > 0)
+
+    @staticmethod
+    def _incidence(tokens: list[list[int]], entry_tokens: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Builds the (sentences x words) incidence matrices of both sides, over the words any of them holds.
+
+        Args:
+            tokens (list[list[int]]): The token IDs of each persisted sentence.
+            entry_tokens (list[list[int]]): The token IDs of each entry sentence.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The incidence matrices of the persisted and the entry sentences.
+        """
+        rows = tokens + entry_tokens
+        ids = np.fromiter((token for sentence_tokens in rows for token in sentence_tokens), dtype=np.int64)
+        words, columns = np.unique(ids, return_inverse=True)
+        lines = np.repeat(np.arange(len(rows)), [len(sentence_tokens) for sentence_tokens in rows])
+
+        incidence = np.zeros((len(rows), len(words)), dtype=np.float32)
+        incidence[lines, columns] = 1.0
+
+        return incidence[: len(tokens)], incidence[len(tokens) :]
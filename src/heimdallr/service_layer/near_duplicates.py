@@ -0,0 +1,177 @@
+"""
+Near Duplicates Detection.
+
+Summarizes an assignment with a MinHash signature over the word shingles of its content, and indexes signatures with
+LSH banding, so that whole-document copies are found with one dictionary lookup per band.
+
+See Also:
+    http://infolab.stanford.edu/~ullman/mmds/ch3.pdf
+"""
+import zlib
+from collections import defaultdict
+from typing import Generic, Hashable, TypeVar
+
+import numpy as np
+
+K = TypeVar("K", bound=Hashable)
+
+MERSENNE_PRIME = (1 << 31) - 1
+PERMUTATIONS = 128
+SHINGLE_SIZE = 5
+
+_generator = np.random.default_rng(31)
+_A = _generator.integers(1, MERSENNE_PRIME, size=(PERMUTATIONS, 1), dtype=np.uint64)
+_B = _generator.integers(0, MERSENNE_PRIME, size=(PERMUTATIONS, 1), dtype=np.uint64)
+
+
+def shingles(content: list[str], size: int = SHINGLE_SIZE) -> set[str]:
+    """
+    Splits a text into overlapping sequences of words.
+
+    Args:
+        content (list[str]): The sentences of an assignment.
+        size (int): Words per shingle.
+
+    Returns:
+        set[str]: The distinct shingles.
+    """
+    words = " ".join(content).lower().split()
+
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(content: list[str]) -> list[int]:
+    """
+    Computes the MinHash signature of a text.
+
+    Each signature entry is the minimum of a random hash permutation over the shingles, so the fraction of entries two
+    signatures share estimates the Jaccard similarity of their shingle sets.
+
+    Args:
+        content (list[str]): The sentences of an assignment.
+
+    Returns:
+        list[int]: The signature, or an empty list when there is no text.
+    """
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode()) for shingle in shingles(content)),
+        dtype=np.uint64,
+    )
+
+    if not hashes.size:
+        return []
+
+    permutations = (_A * hashes + _B) % MERSENNE_PRIME
+
+    return permutations.min(axis=1).tolist()
+
+
+class NearDuplicateIndex(Generic[K]):
+    """
+    LSH banding index over MinHash signatures.
+
+    Signatures are split into bands, and two documents become candidates when any of their bands is identical, which
+    is very likely for near duplicates and very unlikely otherwise. Candidates are confirmed with their estimated
+    Jaccard similarity.
+    """
+
+    def __init__(self, bands: int = 16):
+        """
+        Args:
+            bands (int): Number of bands a signature is split into. It must divide the signature length.
+        """
+        self.bands = bands
+        self._buckets: list[dict[bytes, set[K]]] = [defaultdict(set) for _ in range(bands)]
+        self._signatures: dict[K, np.ndarray] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def keys(self) -> set[K]:
+        """
+        Returns:
+            set[K]: The keys of the indexed documents.
+        """
+        return set(self._signatures)
+
+    def add(self, key: K, signature: list[int]) -> None:
+        """
+        Indexes the signature of a document, replacing any previous signature under the same key.
+
+        Args:
+            key (K): The document key.
+            signature (list[int]): A MinHash signature.
+        """
+        self.remove(key)
+
+        array = np.asarray(signature, dtype=np.uint64)
+
+        for band, bucket in enumerate(self._split(array)):
+            self._buckets[band][bucket].add(key)
+
+        self._signatures[key] = array
+
+    def remove(self, key: K) -> None:
+        """
+        Removes a document from the index, if present.
+
+        Args:
+            key (K): The document key.
+        """
+        array = self._signatures.pop(key, None)
+
+        if array is None:
+            return
+
+        for band, bucket in enumerate(self._split(array)):
+            keys = self._buckets[band][bucket]
+            keys.discard(key)
+            if not keys:
+                del self._buckets[band][bucket]
+
+    def query(self, signature: list[int], threshold: float) -> dict[K, float]:
+        """
+        Looks for the near duplicates of a document.
+
+        Args:
+            signature (list[int]): A MinHash signature.
+            threshold (float): The minimum estimated Jaccard similarity.
+
+        Returns:
+            dict[K, float]: The estimated Jaccard similarity of each near duplicate, by key.
+        """
+        array = np.asarray(signature, dtype=np.uint64)
+        candidates: set[K] = set()
+
+        for band, bucket in enumerate(self._split(array)):
+            candidates.update(self._buckets[band].get(bucket, ()))
+
+        duplicates: dict[K, float] = {}
+
+        for key in candidates:
+            similarity = float(np.mean(self._signatures[key] == array))
+            if similarity >= threshold:
+                duplicates[key] = similarity
+
+        return duplicates
+
+    def _split(self, signature: np.ndarray) -> list[bytes]:
+        """
+        Splits a signature into its bands.
+
+        Args:
+            signature (np.ndarray): A MinHash signature.
+
+        Returns:
+            list[bytes]: The bands, as hashable buckets.
+        """
+        if not signature.size:
+            return []
+
+        return [band.tobytes() for band in np.split(signature, self.bands)]
@@ -0,0 +1,394 @@
+"""
+Shared Passages.
+
+Comparing sentence by sentence misses the copies that cross sentence boundaries, and does not tell where a copied
+passage starts and ends. This index keeps a suffix array, and its LCP array, over the lowercase word stream of the
+stored assignments, each one ended by its own separator, so that every passage of an entry at least as long as a
+minimum number of words, shared with any stored assignment, is found with a binary search per entry word.
+
+The stream is split in segments, as a log-structured merge tree: new assignments are sealed into a small segment when
+the index is queried, and segments of similar sizes are merged, so that adding an assignment never rebuilds the arrays
+of the whole corpus. Removed, or replaced, assignments are skipped until their segment is merged.
+
+See Also:
+    https://en.wikipedia.org/wiki/Suffix_array
+    https://en.wikipedia.org/wiki/LCP_array
+"""
+import re
+from typing import Any, Container, Generic, Hashable, NamedTuple, TypeVar
+
+import numpy as np
+
+K = TypeVar("K", bound=Hashable)
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class SharedPassage(NamedTuple):
+    """
+    A passage of an entry found in a stored document.
+
+    Attributes:
+        key (Any): The key of the document holding the passage.
+        entry_start (int): The position of the first passage word within the entry words.
+        start (int): The position of the first passage word within the document words.
+        length (int): The number of words of the passage.
+    """
+
+    # Any, as generic named tuples need Python 3.11
+    key: Any
+    entry_start: int
+    start: int
+    length: int
+
+
+class WordSpan(NamedTuple):
+    """
+    Where a word is within a document.
+
+    Attributes:
+        sentence (int): The position of the sentence holding the word.
+        start (int): The position of the first character of the word within its sentence.
+        end (int): The position past the last character of the word within its sentence.
+    """
+
+    sentence: int
+    start: int
+    end: int
+
+
+def words(content: list[str]) -> list[WordSpan]:
+    """
+    Splits the sentences of a document into words.
+
+    Args:
+        content (list[str]): The document sentences.
+
+    Returns:
+        list[WordSpan]: The location of each word, in order.
+    """
+    return [
+        WordSpan(position, match.start(), match.end())
+        for position, sentence in enumerate(content)
+        for match in _WORD_PATTERN.finditer(sentence)
+    ]
+
+
+def passage_text(content: list[str], spans: list[WordSpan], start: int, length: int) -> str:
+    """
+    Args:
+        content (list[str]): The document sentences.
+        spans (list[WordSpan]): The location of each word of the document.
+        start (int): The position of the first passage word.
+        length (int): The number of words of the passage.
+
+    Returns:
+        str: The passage, as written in the document, with its sentences joined by a space.
+    """
+    first, last = spans[start], spans[start + length - 1]
+
+    if first.sentence == last.sentence:
+        return content[first.sentence][first.start : last.end]
+
+    return " ".join(
+        [content[first.sentence][first.start :]]
+        + content[first.sentence + 1 : last.sentence]
+        + [content[last.sentence][: last.end]]
+    )
+
+
+def suffix_array(tokens: np.ndarray) -> np.ndarray:
+    """
+    Sorts the suffixes of a token stream by prefix doubling.
+
+    Args:
+        tokens (np.ndarray): The token IDs.
+
+    Returns:
+        np.ndarray: The start of each suffix, in lexicographic order.
+    """
+    size = len(tokens)
+    rank = np.unique(tokens, return_inverse=True)[1].astype(np.int64)
+    order = np.argsort(rank, kind="stable")
+    step = 1
+
+    while step < size:
+        # the rank of the suffix half way, or -1 past the end, so that shorter suffixes go first
+        second = np.full(size, -1, dtype=np.int64)
+        second[: size - step] = rank[step:]
+        order = np.lexsort((second, rank))
+
+        changed = np.ones(size, dtype=bool)
+        changed[1:] = (rank[order][1:] != rank[order][:-1]) | (second[order][1:] != second[order][:-1])
+        rank[order] = np.cumsum(changed) - 1
+
+        if rank[order[-1]] == size - 1:
+            break
+
+        step *= 2
+
+    return order
+
+
+def lcp_array(tokens: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    Computes the longest common prefix of every pair of consecutive suffixes, with Kasai's algorithm.
+
+    Args:
+        tokens (np.ndarray): The token IDs.
+        order (np.ndarray): The suffix array of the tokens.
+
+    Returns:
+        np.ndarray: The common prefix length of each suffix and the previous one in the suffix array, zero for the
+            first one.
+    """
+    size = len(tokens)
+    values = tokens.tolist()
+    rank = np.empty(size, dtype=np.int64)
+    rank[order] = np.arange(size)
+    ranks, suffixes = rank.tolist(), order.tolist()
+    lcp = [0] * size
+    common = 0
+
+    for position in range(size):
+        if ranks[position] == 0:
+            common = 0
+            continue
+
+        previous = suffixes[ranks[position] - 1]
+
+        while (
+            position + common < size
+            and previous + common < size
+            and values[position + common] == values[previous + common]
+        ):
+            common += 1
+
+        lcp[ranks[position]] = common
+        common = max(common - 1, 0)
+
+    return np.array(lcp, dtype=np.int64)
+
+
+class _Segment(Generic[K]):
+    """
+    The suffix and LCP arrays of the word streams of some documents.
+    """
+
+    def __init__(self, documents: dict[K, np.ndarray]):
+        """
+        Args:
+            documents (dict[K, np.ndarray]): The word IDs of each document, by key.
+        """
+        self.keys = list(documents)
+        self.starts = np.zeros(len(self.keys) + 1, dtype=np.int64)
+        np.cumsum([len(tokens) + 1 for tokens in documents.values()], out=self.starts[1:])
+
+        # every document ends with its own negative separator, which no passage crosses
+        self.tokens = np.concatenate(
+            [np.append(tokens, -(index + 1)) for index, tokens in enumerate(documents.values())]
+            or [np.zeros(0, dtype=np.int64)]
+        ).astype(np.int64)
+        self.order = suffix_array(self.tokens)
+        self.lcp = lcp_array(self.tokens, self.order)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def find(self, pattern: list[int]) -> range:
+        """
+        Args:
+            pattern (list[int]): Word IDs.
+
+        Returns:
+            range: The positions, within the suffix array, of the suffixes that start with the pattern.
+        """
+        low, high = 0, len(self.order)
+
+        while low < high:
+            middle = (low + high) // 2
+            start = int(self.order[middle])
+
+            if self.tokens[start : start + len(pattern)].tolist() < pattern:
+                low = middle + 1
+            else:
+                high = middle
+
+        start = int(self.order[low]) if low < len(self.order) else 0
+
+        if low == len(self.order) or self.tokens[start : start + len(pattern)].tolist() != pattern:
+            return range(low, low)
+
+        # the following suffixes share the pattern as long as their common prefix covers it
+        end = low + 1
+
+        while end < len(self.order) and self.lcp[end] >= len(pattern):
+            end += 1
+
+        return range(low, end)
+
+    def document(self, position: int) -> tuple[int, int]:
+        """
+        Args:
+            position (int): A position within the segment stream.
+
+        Returns:
+            tuple[int, int]: The index of the document holding the position, and the position within the document.
+        """
+        index = int(np.searchsorted(self.starts, position, side="right")) - 1
+
+        return index, position - int(self.starts[index])
+
+
+class PassageIndex(Generic[K]):
+    """
+    Segmented suffix array over the word streams of the stored documents.
+    """
+
+    def __init__(self, min_words: int = 12):
+        """
+        Args:
+            min_words (int): The minimum number of words of a shared passage.
+        """
+        self.min_words = min_words
+        self._vocabulary: dict[str, int] = {}
+        self._documents: dict[K, np.ndarray] = {}
+        self._segments: list[_Segment[K]] = []
+        self._pending: list[K] = []
+        self._owners: dict[K, _Segment[K]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def keys(self) -> set[K]:
+        """
+        Returns:
+            set[K]: The keys of the indexed documents.
+        """
+        return set(self._documents)
+
+    def tokens(self, content: list[str]) -> np.ndarray:
+        """
+        Args:
+            content (list[str]): The document sentences.
+
+        Returns:
+            np.ndarray: The ID of each lowercase word of the document.
+        """
+        return np.array(
+            [
+                self._vocabulary.setdefault(word.lower(), len(self._vocabulary))
+                for sentence in content
+                for word in _WORD_PATTERN.findall(sentence)
+            ],
+            dtype=np.int64,
+        )
+
+    def add(self, key: K, content: list[str]) -> None:
+        """
+        Indexes the words of a document, replacing any previous entry under the same key. The document is sealed into
+        a segment on the next query.
+
+        Args:
+            key (K): The document key.
+            content (list[str]): The document sentences.
+        """
+        self.remove(key)
+
+        self._documents[key] = self.tokens(content)
+        self._pending.append(key)
+
+    def remove(self, key: K) -> None:
+        """
+        Removes a document from the index, if present.
+
+        Args:
+            key (K): The document key.
+        """
+        if self._documents.pop(key, None) is None:
+            return
+
+        # any copy in a segment is skipped, as it no longer has an owner
+        self._owners.pop(key, None)
+
+        if key in self._pending:
+            self._pending.remove(key)
+
+    def query(self, content: list[str], keys: Container[K] | None = None) -> list[SharedPassage]:
+        """
+        Looks for the longest passages an entry shares with each stored document.
+
+        Args:
+            content (list[str]): The entry sentences.
+            keys (Container[K] | None): When given, only the documents to look into.
+
+        Returns:
+            list[SharedPassage]: Every maximal shared passage of at least the minimum number of words.
+        """
+        self._seal()
+
+        entry = self.tokens(content).tolist()
+        passages: list[SharedPassage] = []
+
+        for segment in self._segments:
+            stream = segment.tokens
+
+            for entry_start in range(len(entry) - self.min_words + 1):
+                for rank in segment.find(entry[entry_start : entry_start + self.min_words]):
+                    start = int(segment.order[rank])
+
+                    # the passage was found from the previous entry word already
+                    if entry_start and start and entry[entry_start - 1] == stream[start - 1]:
+                        continue
+
+                    index, position = segment.document(start)
+                    key = segment.keys[index]
+
+                    if self._owners.get(key) is not segment or (keys is not None and key not in keys):
+                        continue
+
+                    length = self.min_words
+
+                    while (
+                        entry_start + length < len(entry)
+                        and start + length < len(stream)
+                        and entry[entry_start + length] == stream[start + length]
+                    ):
+                        length += 1
+
+                    passages.append(SharedPassage(key, entry_start, position, length))
+
+        return passages
+
+    def _seal(self) -> None:
+        """
+        Builds a segment of the pending documents, and merges the last segments while they are of similar sizes.
+        """
+        if not self._pending:
+            return
+
+        self._segments.append(self._build(self._pending))
+        self._pending = []
+
+        while len(self._segments) > 1 and 2 * len(self._segments[-1]) >= len(self._segments[-2]):
+            last, previous = self._segments.pop(), self._segments.pop()
+            keys = [key for key in previous.keys + last.keys if self._owners.get(key) in (previous, last)]
+            self._segments.append(self._build(keys))
+
+    def _build(self, keys: list[K]) -> _Segment[K]:
+        """
+        Args:
+            keys (list[K]): The keys of the documents of the segment.
+
+        Returns:
+            _Segment[K]: A new segment, that owns the documents.
+        """
+        segment = _Segment({key: self._documents[key] for key in keys})
+
+        for key in keys:
+            self._owners[key] = segment
+
+        return segment
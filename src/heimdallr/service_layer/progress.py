@@ -0,0 +1,60 @@
+"""
+Verification Progress.
+
+A verification may take a while on a large corpus. The verifier records how many stored assignments it already settled,
+and the plagiarized ones found so far, so that another task can report them while it works.
+"""
+import threading
+
+from heimdallr.domain.events.assignments import AssignmentCompared
+
+
+class VerificationProgress:
+    """
+    Thread safe progress of a single verification.
+    """
+
+    def __init__(self):
+        self.compared = 0
+        self.total = 0
+        self._results: list[AssignmentCompared] = []
+        self._lock = threading.Lock()
+
+    def start(self, total: int) -> None:
+        """
+        Args:
+            total (int): The number of stored assignments to settle.
+        """
+        with self._lock:
+            self.compared, self.total, self._results = 0, total, []
+
+    def advance(self, count: int, results: list[AssignmentCompared] | None = None) -> None:
+        """
+        Records settled assignments, either compared or ruled out.
+
+        Args:
+            count (int): The number of assignments settled since the last call.
+            results (list[AssignmentCompared] | None): The plagiarized assignments found so far, when they changed.
+        """
+        with self._lock:
+            self.compared = min(self.compared + count, self.total)
+
+            if results is not None:
+                self._results = results
+
+    def finish(self, results: list[AssignmentCompared]) -> None:
+        """
+        Args:
+            results (list[AssignmentCompared]): The plagiarized assignments.
+        """
+        with self._lock:
+            self.compared, self._results = self.total, results
+
+    def snapshot(self) -> tuple[int, int, list[AssignmentCompared]]:
+        """
+        Returns:
+            tuple[int, int, list[AssignmentCompared]]: The settled assignments, the total, and the plagiarized
+                assignments found so far.
+        """
+        with self._lock:
+            return self.compared, self.total, list(self._results)
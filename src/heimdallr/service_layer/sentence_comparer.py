@@ -0,0 +1,208 @@
+"""
+Sentence Comparer.
+
+Compares every sentence of an entry against every sentence of an assignment at once: the lexical gate rules out the
+pairs not worth comparing, a single matrix product computes the cosine similarity of the rest, and the first sentence
+similar enough to each entry sentence is its plagiarized match.
+
+The comparer keeps nothing about the corpus, so the forked workers of a process pool inherit it, and compare whatever
+assignments they are handed.
+"""
+from typing import Hashable, Iterable, NamedTuple
+
+import numpy as np
+
+from heimdallr.service_layer.lexical_gate import LexicalGate
+from heimdallr.service_layer.similarity import cosine_similarities, first_matches
+
+# According to https://www.inter-contact.de/en/blog/text-length-languages the AVG letters per word is 5.46 for Spanish
+#
+# Round it up to 6, and add 1 for the space between words, and we get 7 as the AVG word length.
+WORD_AVG_LENGTH = 7
+MIN_WORDS = 3
+MIN_SENTENCE_LENGTH = MIN_WORDS * WORD_AVG_LENGTH
+
+
+class SentenceMatches(NamedTuple):
+    """
+    The plagiarized sentences of an entry found in an assignment.
+
+    Attributes:
+        rows (list[int]): The positions of the plagiarized entry sentences.
+        columns (list[int]): The position of the first match of each one within the assignment.
+        similarities (list[float]): The similarity of each match.
+    """
+
+    rows: list[int]
+    columns: list[int]
+    similarities: list[float]
+
+
+class SentencePair(NamedTuple):
+    """
+    An assignment, and an entry to compare against it.
+
+    Attributes:
+        sentences (list[str]): The assignment sentences.
+        vectors (np.ndarray): The (sentences x dimensions) assignment vectors.
+        entry_sentences (list[str]): The entry sentences.
+        entry_vectors (np.ndarray): The (entry sentences x dimensions) entry vectors.
+        skipped (list[int]): The positions of the entry sentences that are never plagiarized, e.g. boilerplate.
+        key (Hashable | None): The assignment ID, so that its vectors are shared by every pair holding it.
+        entry_key (Hashable | None): The entry ID, so that its vectors are shared by every pair holding it.
+    """
+
+    sentences: list[str]
+    vectors: np.ndarray
+    entry_sentences: list[str]
+    entry_vectors: np.ndarray
+    skipped: list[int]
+    key: Hashable | None = None
+    entry_key: Hashable | None = None
+
+
+class SentenceComparer:
+    """
+    Finds the plagiarized sentences of an entry in an assignment, by the similarity of every pair of their sentences.
+    """
+
+    def __init__(self, lexical_gate: LexicalGate, threshold: float = 0.95, min_length: int = MIN_SENTENCE_LENGTH):
+        """
+        Args:
+            lexical_gate (LexicalGate): Rules out the sentence pairs not worth comparing by their vectors.
+            threshold (float): The minimum similarity required to consider a sentence plagiarized.
+            min_length (int): The minimum number of characters of a sentence to consider it plagiarized.
+        """
+        self.lexical_gate = lexical_gate
+        self.threshold = threshold
+        self.min_length = min_length
+
+    def compare(self, pair: SentencePair) -> SentenceMatches:
+        """
+        Args:
+            pair (SentencePair): An assignment and an entry.
+
+        Returns:
+            SentenceMatches: The plagiarized entry sentences, and their first match in the assignment.
+        """
+        similarities = self.similarities(pair.sentences, pair.vectors, pair.entry_sentences, pair.entry_vectors)
+
+        return self.matches(similarities, pair.skipped)
+
+    def compare_mutual(self, pair: SentencePair, skipped: list[int]) -> tuple[SentenceMatches, SentenceMatches]:
+        """
+        Compares two entries in both directions, computing the similarity of each pair of sentences once.
+
+        Args:
+            pair (SentencePair): An entry, and another entry to compare against it.
+            skipped (list[int]): The positions of the sentences of the first entry that are never plagiarized.
+
+        Returns:
+            tuple[SentenceMatches, SentenceMatches]: The plagiarized sentences of the second entry found in the first
+                one, and those of the first entry found in the second one.
+        """
+        block = self.cosine_similarities(pair.sentences, pair.vectors, pair.entry_sentences, pair.entry_vectors)
+        # the transposed block compares the other way around
+        transposed = block.T.copy()
+
+        self.adjust_similarities(pair.sentences, pair.entry_sentences, block)
+        self.adjust_similarities(pair.entry_sentences, pair.sentences, transposed)
+
+        return self.matches(block, pair.skipped), self.matches(transposed, skipped)
+
+    def similarities(
+        self,
+        sentences: list[str],
+        vectors: np.ndarray | list,
+        entry_sentences: list[str],
+        entry_vectors: np.ndarray | list,
+    ) -> np.ndarray:
+        """
+        Computes the similarity of every entry sentence against every persisted sentence at once, as spaCy's
+        Doc.similarity would for each pair.
+
+        Args:
+            sentences (list[str]): Sentences from an assignment already persisted.
+            vectors (np.ndarray | list): The persisted sentences vectors.
+            entry_sentences (list[str]): Sentences from a new entry to be checked for plagiarism.
+            entry_vectors (np.ndarray | list): The entry sentences vectors.
+
+        Returns:
+            np.ndarray: A (entry sentences x sentences) similarity matrix.
+        """
+        similarities = self.cosine_similarities(sentences, vectors, entry_sentences, entry_vectors)
+        self.adjust_similarities(sentences, entry_sentences, similarities)
+
+        return similarities
+
+    def cosine_similarities(
+        self,
+        sentences: list[str],
+        vectors: np.ndarray | list,
+        entry_sentences: list[str],
+        entry_vectors: np.ndarray | list,
+    ) -> np.ndarray:
+        """
+        Computes the cosine similarity of the sentence pairs that pass the lexical gate. The rest have no similarity.
+
+        Args:
+            sentences (list[str]): Sentences from an assignment already persisted.
+            vectors (np.ndarray | list): The persisted sentences vectors.
+            entry_sentences (list[str]): Sentences from a new entry to be checked for plagiarism.
+            entry_vectors (np.ndarray | list): The entry sentences vectors.
+
+        Returns:
+            np.ndarray: A (entry sentences x sentences) similarity matrix.
+        """
+        similarities = np.zeros((len(entry_sentences), len(sentences)), dtype=np.float32)
+        passed = self.lexical_gate.mask(sentences, entry_sentences)
+        rows, columns = passed.any(axis=1), passed.any(axis=0)
+
+        # only the rows and columns holding a pair that passed are worth multiplying
+        if rows.any():
+            similarities[np.ix_(rows, columns)] = cosine_similarities(
+                np.asarray(entry_vectors, dtype=np.float32)[rows],
+                np.asarray(vectors, dtype=np.float32)[columns],
+            )
+            similarities[~passed] = 0.0
+
+        return similarities
+
+    def adjust_similarities(self, sentences: list[str], entry_sentences: list[str], similarities: np.ndarray) -> None:
+        """
+        Fixes, in place, the similarities of the sentence pairs whose vectors are not to be trusted.
+
+        Args:
+            sentences (list[str]): Sentences from an assignment already persisted.
+            entry_sentences (list[str]): Sentences from a new entry to be checked for plagiarism.
+            similarities (np.ndarray): A (entry sentences x sentences) similarity matrix.
+        """
+        # identical sentences are fully similar, even when they have no vector
+        columns: dict[str, int] = {}
+
+        for column, sentence in enumerate(sentences):
+            columns.setdefault(sentence, column)
+
+        for row, entry_sentence in enumerate(entry_sentences):
+            if entry_sentence in columns:
+                similarities[row, columns[entry_sentence]] = 1.0
+
+        # assume that the sentence is not plagiarized if it is too short
+        too_short = [len(sentence) < self.min_length for sentence in sentences]
+        similarities[:, too_short] = 0.0
+
+    def matches(self, similarities: np.ndarray, skipped: Iterable[int] = ()) -> SentenceMatches:
+        """
+        Args:
+            similarities (np.ndarray): A (entry sentences x sentences) similarity matrix, zeroed in place for the
+                skipped entry sentences.
+            skipped (Iterable[int]): The positions of the entry sentences that are never plagiarized.
+
+        Returns:
+            SentenceMatches: The first plagiarized match of each entry sentence.
+        """
+        similarities[sorted(skipped)] = 0.0
+
+        rows, columns = first_matches(similarities, self.threshold)
+
+        return SentenceMatches(rows.tolist(), columns.tolist(), similarities[rows, columns].tolist())
@@ -0,0 +1,238 @@
+"""
+Approximate Nearest Neighbours Sentence Index.
+
+Indexes the sentence vectors of every stored assignment with random-hyperplane Locality Sensitive Hashing, so that an
+entry sentence is only compared against the few stored sentences that share one of its hash buckets, instead of against
+the whole corpus.
+
+When given a vector store, the index only keeps the bucket codes, and re-ranks candidates on the stored vectors.
+
+See Also:
+    https://en.wikipedia.org/wiki/Locality-sensitive_hashing#Random_projection
+"""
+from collections import defaultdict
+from typing import Any, Container, Generic, Hashable, Iterable, NamedTuple, TypeVar
+
+import numpy as np
+
+from heimdallr.service_layer.similarity import normalize
+from heimdallr.service_layer.vector_store import VectorStore
+
+K = TypeVar("K", bound=Hashable)
+
+
+class SentenceHit(NamedTuple):
+    """
+    A stored sentence found near an entry sentence.
+
+    Attributes:
+        key (Any): The key of the document holding the sentence.
+        position (int): The sentence position within its document.
+        similarity (float): The cosine similarity against the entry sentence.
+    """
+
+    # Any, as generic named tuples need Python 3.11
+    key: Any
+    position: int
+    similarity: float
+
+
+class _Hyperplanes:
+    """
+    The random hyperplanes of every hash table, drawn on the first hash, once the vector dimensions are known.
+    """
+
+    def __init__(self, bits: int, tables: int, seed: int):
+        """
+        Args:
+            bits (int): Hyperplanes per table.
+            tables (int): Number of hash tables.
+            seed (int): Random seed for the hyperplanes.
+        """
+        self.bits = bits
+        self.tables = tables
+        self.seed = seed
+        self._planes: np.ndarray | None = None
+        self._weights = 1 << np.arange(bits, dtype=np.int64)
+
+    def hash(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Hashes each row into one bucket code per table.
+
+        Args:
+            matrix (np.ndarray): A (n x dimensions) matrix.
+
+        Returns:
+            np.ndarray: A (n x tables) matrix of bucket codes.
+        """
+        if self._planes is None:
+            generator = np.random.default_rng(self.seed)
+            self._planes = generator.standard_normal((self.tables * self.bits, matrix.shape[1]), dtype=np.float32)
+
+        signs = (matrix @ self._planes.T > 0).reshape(len(matrix), self.tables, self.bits)
+
+        return signs @ self._weights
+
+
+class SentenceIndex(Generic[K]):
+    """
+    Random-hyperplane LSH index over sentence vectors.
+
+    Every table hashes a vector into one bucket, made of the signs of its projections over a set of random hyperplanes.
+    Two vectors land in the same bucket with a probability that grows with their cosine similarity, so near sentences
+    are found by looking up a handful of buckets, and candidates are re-ranked with their exact cosine similarity.
+    """
+
+    def __init__(self, bits: int = 12, tables: int = 16, seed: int = 0, store: VectorStore | None = None):
+        """
+        Args:
+            bits (int): Hyperplanes per table. More bits mean smaller buckets.
+            tables (int): Number of hash tables. More tables mean a better recall.
+            seed (int): Random seed for the hyperplanes.
+            store (VectorStore | None): When given, the store that holds the vectors of every indexed document, by
+                sentence position, instead of the index.
+        """
+        self.hyperplanes = _Hyperplanes(bits, tables, seed)
+        self.store = store
+        self._buckets: list[dict[int, set[tuple[K, int]]]] = [defaultdict(set) for _ in range(tables)]
+        self._vectors: dict[K, np.ndarray] = {}
+        self._positions: dict[K, np.ndarray] = {}
+        self._codes: dict[K, np.ndarray] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def keys(self) -> set[K]:
+        """
+        Returns:
+            set[K]: The keys of the indexed documents.
+        """
+        return set(self._positions)
+
+    def add(self, key: K, vectors: np.ndarray | list, positions: Iterable[int] | None = None) -> None:
+        """
+        Indexes the sentence vectors of a document, replacing any previous entry under the same key.
+
+        Args:
+            key (K): The document key.
+            vectors (np.ndarray | list): A (sentences x dimensions) matrix.
+            positions (Iterable[int] | None): The sentence position of each row, defaults to the row number. With a
+                vector store, the store must already hold the document vectors at those positions.
+        """
+        self.remove(key)
+
+        rows = np.arange(len(vectors)) if positions is None else np.fromiter(positions, dtype=np.int64)
+
+        if len(rows):
+            matrix = normalize(vectors)
+            codes = self.hyperplanes.hash(matrix)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+            codes = np.zeros((0, self.hyperplanes.tables), dtype=np.int64)
+
+        for table, table_codes in enumerate(codes.T):
+            for row, code in enumerate(table_codes.tolist()):
+                self._buckets[table][code].add((key, row))
+
+        if self.store is None:
+            self._vectors[key] = matrix
+
+        self._positions[key] = rows
+        self._codes[key] = codes
+
+    def remove(self, key: K) -> None:
+        """
+        Removes a document from the index, if present.
+
+        Args:
+            key (K): The document key.
+        """
+        codes = self._codes.pop(key, None)
+
+        if codes is None:
+            return
+
+        for table, table_codes in enumerate(codes.T):
+            for row, code in enumerate(table_codes.tolist()):
+                bucket = self._buckets[table][code]
+                bucket.discard((key, row))
+                if not bucket:
+                    del self._buckets[table][code]
+
+        self._vectors.pop(key, None)
+        del self._positions[key]
+
+    def query(
+        self,
+        vectors: np.ndarray | list,
+        threshold: float,
+        neighbours: int = 50,
+        keys: Container[K] | None = None,
+    ) -> list[list[SentenceHit]]:
+        """
+        Looks for the nearest stored sentences of each given vector.
+
+        Args:
+            vectors (np.ndarray | list): A (sentences x dimensions) matrix of entry sentences.
+            threshold (float): The minimum cosine similarity of a hit.
+            neighbours (int): The maximum number of hits per entry sentence.
+            keys (Container[K] | None): When given, only the documents to look into.
+
+        Returns:
+            list[list[SentenceHit]]: For each entry sentence, its hits sorted by descending similarity.
+        """
+        hits: list[list[SentenceHit]] = [[] for _ in range(len(vectors))]
+
+        if not hits or not self._positions:
+            return hits
+
+        matrix = normalize(vectors)
+
+        for key, (entry_rows, rows) in self._candidates(self.hyperplanes.hash(matrix), keys).items():
+            if self.store is None:
+                similarities = np.einsum("ij,ij->i", matrix[entry_rows], self._vectors[key][rows])
+            else:
+                similarities = self.store.similarities(key, self._positions[key][rows], matrix[entry_rows])
+
+            found = similarities >= threshold
+
+            for entry_row, row, similarity in zip(
+                entry_rows[found].tolist(), rows[found].tolist(), similarities[found].tolist()
+            ):
+                hits[entry_row].append(SentenceHit(key, int(self._positions[key][row]), min(similarity, 1.0)))
+
+        return [sorted(entry_hits, key=lambda hit: -hit.similarity)[:neighbours] for entry_hits in hits]
+
+    def _candidates(
+        self,
+        codes: np.ndarray,
+        keys: Container[K] | None = None,
+    ) -> dict[K, tuple[np.ndarray, np.ndarray]]:
+        """
+        Collects the stored sentences sharing at least one bucket with each entry sentence.
+
+        Args:
+            codes (np.ndarray): A (entry sentences x tables) matrix of bucket codes.
+            keys (Container[K] | None): When given, only the documents to look into.
+
+        Returns:
+            dict[K, tuple[np.ndarray, np.ndarray]]: For each document, the pairs of entry rows and stored rows.
+        """
+        pairs: dict[K, set[tuple[int, int]]] = defaultdict(set)
+
+        for entry_row, entry_codes in enumerate(codes.tolist()):
+            for table, code in enumerate(entry_codes):
+                for key, row in self._buckets[table].get(code, ()):
+                    if keys is None or key in keys:
+                        pairs[key].add((entry_row, row))
+
+        candidates: dict[K, tuple[np.ndarray, np.ndarray]] = {}
+
+        for key, key_pairs in pairs.items():
+            entry_rows, rows = np.array(sorted(key_pairs), dtype=np.int64).T
+            candidates[key] = (entry_rows, rows)
+
+        return candidates
@@ -0,0 +1,60 @@
+"""
+Vectorized Sentence Similarity.
+
+Computes the cosine similarity of every pair of sentences of two assignments at once, with a single matrix product over
+unit-normalized sentence vectors, instead of one spaCy similarity call per pair.
+"""
+import numpy as np
+
+
+def normalize(vectors: np.ndarray | list[list[float]]) -> np.ndarray:
+    """
+    Scales each row vector to unit length.
+
+    Args:
+        vectors (np.ndarray | list[list[float]]): A (sentences x dimensions) matrix.
+
+    Returns:
+        np.ndarray: The unit-normalized matrix. Rows with no vector (zero norm) remain zero.
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def cosine_similarities(
+    vectors: np.ndarray | list[list[float]],
+    other_vectors: np.ndarray | list[list[float]],
+) -> np.ndarray:
+    """
+    Computes the cosine similarity between every pair of rows of two matrices.
+
+    Args:
+        vectors (np.ndarray | list[list[float]]): A (n x dimensions) matrix.
+        other_vectors (np.ndarray | list[list[float]]): A (m x dimensions) matrix.
+
+    Returns:
+        np.ndarray: A (n x m) similarity matrix. Pairs involving a zero vector have no similarity.
+    """
+    similarities = normalize(vectors) @ normalize(other_vectors).T
+    return np.clip(similarities, -1.0, 1.0, out=similarities)
+
+
+def first_matches(similarities: np.ndarray, threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds, for each row, the first column whose similarity reaches the threshold.
+
+    Args:
+        similarities (np.ndarray): A (n x m) similarity matrix.
+        threshold (float): The minimum similarity of a match.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The rows with a match, and the column of their first match.
+    """
+    matches = similarities >= threshold
+
+    rows = np.flatnonzero(matches.any(axis=1))
+    columns = matches[rows].argmax(axis=1) if rows.size else rows
+
+    return rows, columns
@@ -0,0 +1,75 @@
+"""
+Top Matches Selection.
+
+Keeps only the most plagiarized assignments of a verification in a bounded min-heap, as comparison results stream in,
+so that candidates that cannot beat the weakest kept match are not even compared.
+"""
+import heapq
+import itertools
+
+from heimdallr.domain.events.assignments import AssignmentCompared
+
+
+class TopMatches:
+    """
+    Bounded selection of the comparison results with the highest plagiarism.
+    """
+
+    def __init__(self, limit: int | None = None):
+        """
+        Args:
+            limit (int | None): The maximum number of results kept. None keeps them all.
+        """
+        self.limit = limit
+        self._heap: list[tuple[float, int, AssignmentCompared]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def full(self) -> bool:
+        """
+        Whether the limit of results has been reached.
+        """
+        return self.limit is not None and len(self._heap) >= self.limit
+
+    def admits(self, bound: float) -> bool:
+        """
+        Checks whether a result could still be kept.
+
+        Args:
+            bound (float): The highest plagiarism the result may reach.
+
+        Returns:
+            bool: False when the result cannot beat the weakest kept result.
+        """
+        if self.limit is not None and self.limit <= 0:
+            return False
+
+        return not self.full or bound > self._heap[0][0]
+
+    def push(self, comparison: AssignmentCompared) -> None:
+        """
+        Keeps a comparison result when it holds plagiarized sentences, or passages, and it is among the strongest seen
+        so far.
+
+        Args:
+            comparison (AssignmentCompared): A comparison result.
+        """
+        if not (comparison.similarities or comparison.passages) or not self.admits(comparison.plagiarism):
+            return
+
+        item = (comparison.plagiarism, next(self._counter), comparison)
+
+        if self.full:
+            heapq.heapreplace(self._heap, item)
+        else:
+            heapq.heappush(self._heap, item)
+
+    def results(self) -> list[AssignmentCompared]:
+        """
+        Returns:
+            list[AssignmentCompared]: The kept results, from the most plagiarized.
+        """
+        return [comparison for _, _, comparison in sorted(self._heap, key=lambda item: (-item[0], item[1]))]
@@ -0,0 +1,91 @@
+"""
+Topic Index.
+
+Most copying happens between assignments of the same practical work, so a verification searches the assignments sharing
+the predicted topic of the entry first, and the rest only as the fallback policy allows. Assignments without a topic,
+e.g. stored before a topic predictor was trained, cannot be ruled out, so they always belong to the first partition.
+"""
+from enum import Enum
+from uuid import UUID
+
+from heimdallr.domain.models.assignment import Topic
+
+
+class TopicFallback(str, Enum):
+    """
+    When the assignments of other topics are searched.
+
+    See Also:
+        https://www.cosmicpython.com/blog/2020-10-27-i-hate-enums.html
+    """
+
+    ALWAYS = "always"
+    EMPTY = "empty"
+    NEVER = "never"
+
+    def __str__(self) -> str:
+        return str.__str__(self)
+
+
+class TopicIndex:
+    """
+    Partitions the stored assignments by topic.
+    """
+
+    def __init__(self):
+        self._topics: dict[UUID, Topic] = {}
+        self._partitions: dict[Topic, set[UUID]] = {}
+
+    def __contains__(self, key: UUID) -> bool:
+        return key in self._topics
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def keys(self) -> set[UUID]:
+        """
+        Returns:
+            set[UUID]: The IDs of the indexed assignments.
+        """
+        return set(self._topics)
+
+    def add(self, key: UUID, topic: Topic) -> None:
+        """
+        Args:
+            key (UUID): The assignment ID.
+            topic (Topic): The assignment topic.
+        """
+        self.remove(key)
+        self._topics[key] = topic
+        self._partitions.setdefault(topic, set()).add(key)
+
+    def remove(self, key: UUID) -> None:
+        """
+        Removes an assignment, if present.
+
+        Args:
+            key (UUID): The assignment ID.
+        """
+        topic = self._topics.pop(key, None)
+
+        if topic is not None:
+            self._partitions[topic].discard(key)
+
+    def partitions(self, topic: Topic) -> list[set[UUID]]:
+        """
+        Splits the indexed assignments in the order they are searched.
+
+        Args:
+            topic (Topic): The topic of the entry.
+
+        Returns:
+            list[set[UUID]]: The assignments of the same topic, or without one, followed by the rest when there are
+                any. A single partition when the entry has no topic.
+        """
+        if topic == Topic.UNDEFINED:
+            return [self.keys()]
+
+        own = self._partitions.get(topic, set()) | self._partitions.get(Topic.UNDEFINED, set())
+        others = self.keys() - own
+
+        return [own, others] if others else [own]
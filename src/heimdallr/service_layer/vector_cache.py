@@ -0,0 +1,100 @@
+"""
+Sentence Vectors Cache.
+
+The same sentences, e.g. the ones of the stored assignments, are vectorized again and again. This cache keeps the
+vector and token count of the most recently vectorized sentences, keyed by a hash of their text, so that spaCy only
+processes each of them once while they stay in the cache.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def text_hash(text: str) -> bytes:
+    """
+    Args:
+        text (str): A sentence.
+
+    Returns:
+        bytes: A 128 bits hash of the exact text.
+    """
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class VectorCache:
+    """
+    Thread safe Least Recently Used cache of sentence vectors.
+
+    Each entry holds a hash, a vector and a token count, so its memory is bounded by the number of entries times the
+    vector size, e.g. about 1.2 KB per entry for 300 dimensions vectors.
+    """
+
+    def __init__(self, maxsize: int = 50_000):
+        """
+        Args:
+            maxsize (int): The maximum number of sentences kept. Zero disables the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[np.ndarray, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, text: str) -> tuple[np.ndarray, int] | None:
+        """
+        Looks up the vector of a sentence, marking it as the most recently used.
+
+        Args:
+            text (str): A sentence.
+
+        Returns:
+            tuple[np.ndarray, int] | None: The sentence vector and its number of tokens, or None when not cached.
+        """
+        key = text_hash(text)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry
+
+    def put(self, text: str, vector: np.ndarray, tokens: int) -> None:
+        """
+        Keeps the vector of a sentence, evicting the least recently used ones beyond the maximum size.
+
+        Args:
+            text (str): A sentence.
+            vector (np.ndarray): The sentence vector.
+            tokens (int): The number of tokens of the sentence.
+        """
+        if self.maxsize <= 0:
+            return
+
+        key = text_hash(text)
+
+        with self._lock:
+            self._entries[key] = (vector, tokens)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,282 @@
+"""
+Memory Mapped Vector Store.
+
+Keeping a 300 dimensions float vector per corpus sentence in the memory of every worker is expensive. This store keeps
+the unit-normalized sentence vectors of each assignment in a single append-only file, quantized to 8 bits integers
+with a scale per row, or to 16 bits floats, next to a table of the rows each assignment holds. The file is opened with
+numpy.memmap, so that every worker process on a node shares the same pages through the operating system cache, and a
+worker that starts finds the vectors already there.
+
+Similarities are computed straight on the quantized rows. Removed assignments only leave the table, their rows remain
+in the file until it is deleted, and rebuilt from the stored assignments.
+"""
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from typing import Hashable, Iterator, Literal
+
+import numpy as np
+
+Quantization = Literal["int8", "float16"]
+
+INT8_MAX = 127
+
+
+class VectorStore:
+    """
+    Append-only, memory mapped and quantized store of unit sentence vectors, by document key.
+
+    The file is safe to share across processes: appends are serialized with a file lock, and each process reloads the
+    table when another one changed it.
+    """
+
+    def __init__(self, path: str, width: int, quantization: Quantization = "int8"):
+        """
+        Args:
+            path (str): The path of the store, without extension. The rows, scales and table files are created next to
+                it, named after the quantization, so that stores of either quantization never read the files of the
+                other one.
+            width (int): Dimensions of the vectors.
+            quantization (Quantization): Either "int8", a quarter of the float32 size, or "float16", a half.
+        """
+        self.path = path
+        self.width = width
+        self.quantization = quantization
+        self._table: dict[str, tuple[int, int]] = {}
+        self._table_mtime: int | None = None
+        self._rows: np.ndarray = np.zeros((0, width), dtype=self.dtype)
+        self._scales: np.ndarray = np.zeros(0, dtype=np.float32)
+
+        directory = os.path.dirname(path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.refresh()
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Type of the stored vector components.
+        """
+        return np.dtype(np.int8 if self.quantization == "int8" else np.float16)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return str(key) in self._table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def keys(self) -> set[str]:
+        """
+        Returns:
+            set[str]: The keys of the stored documents, as strings.
+        """
+        return set(self._table)
+
+    def count(self, key: Hashable) -> int:
+        """
+        Args:
+            key (Hashable): The document key.
+
+        Returns:
+            int: The number of vectors stored for the document, zero when missing.
+        """
+        return self._table.get(str(key), (0, 0))[1]
+
+    def refresh(self) -> None:
+        """
+        Reloads the table, when another process changed it, and maps any new rows.
+        """
+        try:
+            mtime = os.stat(self._table_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+
+        if mtime == self._table_mtime:
+            return
+
+        with open(self._table_path, encoding="utf-8") as file:
+            table = json.load(file)
+
+        self._table = {key: (offset, count) for key, (offset, count) in table["keys"].items()}
+        self._table_mtime = mtime
+        self._map(table["rows"])
+
+    def put(self, key: Hashable, vectors: np.ndarray) -> None:
+        """
+        Stores the vectors of a document, unless it already holds as many.
+
+        Args:
+            key (Hashable): The document key.
+            vectors (np.ndarray): A (sentences x dimensions) matrix of unit vectors.
+        """
+        self.put_all({key: vectors})
+
+    def put_all(self, documents: dict[Hashable, np.ndarray]) -> None:
+        """
+        Stores the vectors of many documents with a single append, skipping those it already holds as many of.
+
+        Args:
+            documents (dict[Hashable, np.ndarray]): A (sentences x dimensions) matrix of unit vectors, by document key.
+        """
+        with self._locked():
+            self.refresh()
+
+            matrices = {
+                str(key): np.asarray(vectors, dtype=np.float32).reshape(-1, self.width)
+                for key, vectors in documents.items()
+            }
+            matrices = {
+                key: matrix
+                for key, matrix in matrices.items()
+                if key not in self._table or self.count(key) != len(matrix)
+            }
+
+            if not matrices:
+                return
+
+            offset = len(self._rows)
+
+            with open(self._rows_path, "ab") as rows_file, open(self._scales_path, "ab") as scales_file:
+                for key, matrix in matrices.items():
+                    rows, scales = self._quantize(matrix)
+                    rows_file.write(rows.tobytes())
+                    scales_file.write(scales.tobytes())
+
+                    self._table[key] = (offset, len(matrix))
+                    offset += len(matrix)
+
+            self._write_table(offset)
+            self._map(offset)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Removes a document from the table, if present.
+
+        Args:
+            key (Hashable): The document key.
+        """
+        with self._locked():
+            self.refresh()
+
+            if self._table.pop(str(key), None) is not None:
+                self._write_table(len(self._rows))
+
+    def get(self, key: Hashable, rows: np.ndarray | list[int] | None = None) -> np.ndarray:
+        """
+        Dequantizes the vectors of a document.
+
+        Args:
+            key (Hashable): The document key.
+            rows (np.ndarray | list[int] | None): When given, only the rows to read.
+
+        Returns:
+            np.ndarray: A (rows x dimensions) float32 matrix.
+        """
+        indices = self._indices(key, rows)
+
+        return self._rows[indices].astype(np.float32) * self._scales[indices, np.newaxis]
+
+    def similarities(self, key: Hashable, rows: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        """
+        Computes the dot product of each given vector against a stored row, on the quantized data.
+
+        Args:
+            key (Hashable): The document key.
+            rows (np.ndarray): The stored row paired with each vector.
+            vectors (np.ndarray): A (rows x dimensions) float32 matrix.
+
+        Returns:
+            np.ndarray: The similarity of each pair.
+        """
+        indices = self._indices(key, rows)
+
+        return np.einsum("ij,ij->i", vectors, self._rows[indices], dtype=np.float32) * self._scales[indices]
+
+    def _indices(self, key: Hashable, rows: np.ndarray | list[int] | None) -> np.ndarray:
+        """
+        Args:
+            key (Hashable): The document key.
+            rows (np.ndarray | list[int] | None): Rows of the document, or None for all of them.
+
+        Returns:
+            np.ndarray: The positions of the rows within the file.
+        """
+        offset, count = self._table[str(key)]
+
+        if rows is None:
+            return np.arange(offset, offset + count)
+
+        return offset + np.asarray(rows, dtype=np.int64)
+
+    def _quantize(self, matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Args:
+            matrix (np.ndarray): A (rows x dimensions) float32 matrix.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The quantized rows, and the scale that restores each one.
+        """
+        if self.quantization != "int8":
+            return matrix.astype(self.dtype), np.ones(len(matrix), dtype=np.float32)
+
+        peaks = np.abs(matrix).max(axis=1) if matrix.size else np.zeros(len(matrix), dtype=np.float32)
+        scales = np.where(peaks > 0, peaks / INT8_MAX, 1.0).astype(np.float32)
+        rows = np.rint(matrix / scales[:, np.newaxis]).astype(np.int8)
+
+        return rows, scales
+
+    def _map(self, total: int) -> None:
+        """
+        Maps the rows and scales files, up to a number of rows.
+
+        Args:
+            total (int): The number of rows written.
+        """
+        if total == len(self._rows):
+            return
+
+        self._rows = np.memmap(self._rows_path, dtype=self.dtype, mode="r", shape=(total, self.width))
+        self._scales = np.memmap(self._scales_path, dtype=np.float32, mode="r", shape=(total,))
+
+    def _write_table(self, total: int) -> None:
+        """
+        Atomically replaces the table file.
+
+        Args:
+            total (int): The number of rows written.
+        """
+        temporary = f"{self._table_path}.{os.getpid()}"
+
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({"rows": total, "keys": self._table}, file)
+
+        os.replace(temporary, self._table_path)
+        self._table_mtime = os.stat(self._table_path).st_mtime_ns
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Serializes writes across processes.
+        """
+        with open(f"{self._rows_path}.lock", "w", encoding="utf-8") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @property
+    def _rows_path(self) -> str:
+        return f"{self.path}.{self.quantization}"
+
+    @property
+    def _scales_path(self) -> str:
+        return f"{self._rows_path}.scales"
+
+    @property
+    def _table_path(self) -> str:
+        return f"{self._rows_path}.json"
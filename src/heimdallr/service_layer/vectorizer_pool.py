@@ -0,0 +1,375 @@
+"""
+Process Pool Vectorizer.
+
+spaCy holds the GIL while it processes a text, and so does most of comparing two assignments, so threads barely help to
+vectorize a large corpus, or to compare an entry against many assignments. This pool forks worker processes that
+inherit the already loaded language model and the sentence comparer.
+
+To vectorize, each worker writes the vectors of its chunk of sentences straight into a shared memory matrix, so only the
+sentences and their token counts are pickled, rather than whole Docs as nlp.pipe does with several processes.
+
+To compare, the vectors of every assignment of the compared pairs are published into a shared memory matrix, once per
+assignment ID however many pairs hold it, e.g. the entry, and each worker compares a pair of assignments over their
+rows, so only the sentences and the plagiarized matches are pickled. The lexical gate
+of each worker counts the pairs it prunes on its own.
+
+The workers are forked as soon as the pool is created, unless it shares the process pool of the page reader, which forks
+them once both registered. Either must happen before the process starts any other thread, e.g. before the database
+client connects: a thread holding a lock while the process forks leaves it held forever in the child.
+
+See Also:
+    https://docs.python.org/3/library/multiprocessing.shared_memory.html
+"""
+from multiprocessing.shared_memory import SharedMemory
+from typing import Hashable, NamedTuple
+
+import numpy as np
+
+from heimdallr.service_layer.embeddings import SpacyEmbedder
+from heimdallr.service_layer.sentence_comparer import (
+    SentenceComparer,
+    SentenceMatches,
+    SentencePair,
+)
+from heimdallr.utils.process_pool import ForkedProcessPool
+
+_embedder: SpacyEmbedder | None = None
+_comparer: SentenceComparer | None = None
+
+
+class _Comparison(NamedTuple):
+    """
+    A pair of assignments to compare, whose vectors are rows of the shared matrix.
+
+    Attributes:
+        rows (tuple[int, int]): The start and end rows of the assignment vectors.
+        entry_rows (tuple[int, int]): The start and end rows of the entry vectors.
+        sentences (list[str]): The assignment sentences.
+        entry_sentences (list[str]): The entry sentences.
+        skipped (list[int]): The positions of the entry sentences that are never plagiarized.
+        mutual_skipped (list[int] | None): When comparing both ways, the positions of the assignment sentences that
+            are never plagiarized.
+    """
+
+    rows: tuple[int, int]
+    entry_rows: tuple[int, int]
+    sentences: list[str]
+    entry_sentences: list[str]
+    skipped: list[int]
+    mutual_skipped: list[int] | None
+
+
+def _init_worker(embedder: SpacyEmbedder, comparer: SentenceComparer) -> None:
+    """
+    Keeps the embedder and the comparer inherited by a forked worker.
+
+    Args:
+        embedder (SpacyEmbedder): The sentence embedder, with the language model already loaded.
+        comparer (SentenceComparer): The sentence comparer.
+    """
+    global _embedder, _comparer
+    _embedder, _comparer = embedder, comparer
+
+
+def _vectorize_chunk(name: str, shape: tuple[int, int], start: int, sentences: list[str]) -> list[int]:
+    """
+    Writes the vectors of a chunk of sentences into the shared matrix.
+
+    Args:
+        name (str): The name of the shared memory block.
+        shape (tuple[int, int]): The shape of the whole (sentences x dimensions) matrix.
+        start (int): The matrix row of the first sentence of the chunk.
+        sentences (list[str]): The chunk of sentences.
+
+    Returns:
+        list[int]: The number of tokens of each sentence.
+    """
+    if _embedder is None:
+        raise RuntimeError("The worker was not initialized.")
+
+    memory = SharedMemory(name=name)
+
+    try:
+        matrix: np.ndarray = np.ndarray(shape, dtype=np.float32, buffer=memory.buf)
+        vectors, tokens = _embedder.embed(sentences)
+        matrix[start : start + len(sentences)] = vectors
+
+        del matrix
+
+        return tokens.tolist()
+    finally:
+        memory.close()
+
+
+def _compare(name: str, shape: tuple[int, int], comparison: _Comparison) -> tuple[SentenceMatches, ...]:
+    """
+    Compares a pair of assignments, whose vectors are rows of the shared matrix.
+
+    Args:
+        name (str): The name of the shared memory block.
+        shape (tuple[int, int]): The shape of the whole (rows x dimensions) matrix.
+        comparison (_Comparison): The pair of assignments.
+
+    Returns:
+        tuple[SentenceMatches, ...]: The plagiarized entry sentences found in the assignment, followed by those of the
+            assignment found in the entry, when comparing both ways.
+    """
+    if _comparer is None:
+        raise RuntimeError("The worker was not initialized.")
+
+    memory = SharedMemory(name=name)
+
+    try:
+        matrix: np.ndarray = np.ndarray(shape, dtype=np.float32, buffer=memory.buf)
+        pair = SentencePair(
+            comparison.sentences,
+            matrix[slice(*comparison.rows)],
+            comparison.entry_sentences,
+            matrix[slice(*comparison.entry_rows)],
+            comparison.skipped,
+        )
+
+        if comparison.mutual_skipped is None:
+            matches: tuple[SentenceMatches, ...] = (_comparer.compare(pair),)
+        else:
+            matches = _comparer.compare_mutual(pair, comparison.mutual_skipped)
+
+        del matrix, pair
+
+        return matches
+    finally:
+        memory.close()
+
+
+class ProcessPoolVectorizer:
+    """
+    Vectorizes sentences, and compares assignments, across forked worker processes.
+    """
+
+    def __init__(
+        self,
+        embedder: SpacyEmbedder,
+        comparer: SentenceComparer,
+        workers: int,
+        chunk_size: int = 256,
+        pool: ForkedProcessPool | None = None,
+    ):
+        """
+        Args:
+            embedder (SpacyEmbedder): The sentence embedder, inherited by every worker.
+            comparer (SentenceComparer): The sentence comparer, inherited by every worker.
+            workers (int): Number of worker processes, unless the pool is shared.
+            chunk_size (int): Sentences per task. Fewer sentences than this are vectorized in the calling process.
+            pool (ForkedProcessPool | None): A process pool shared with the page reader, whose workers are forked once
+                every user registered. None forks a pool of its own on creation.
+        """
+        self.embedder = embedder
+        self.comparer = comparer
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool = pool or ForkedProcessPool(workers)
+        # workers are daemons, so they cannot spread their batches over more processes
+        self._pool.register(_init_worker, SpacyEmbedder(embedder.nlp, batch_size=embedder.batch_size), comparer)
+
+        if pool is None:
+            self._pool.start()
+
+    def vectorize(self, sentences: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the vector of each sentence.
+
+        Args:
+            sentences (list[str]): The sentences to vectorize.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (sentences x dimensions) vectors matrix, and the number of tokens of
+                each sentence.
+        """
+        if len(sentences) <= self.chunk_size:
+            return self.embedder.embed(sentences)
+
+        shape = (len(sentences), self.embedder.width)
+        memory = SharedMemory(create=True, size=shape[0] * shape[1] * np.dtype(np.float32).itemsize or 1)
+
+        try:
+            futures = [
+                self._pool.submit(_vectorize_chunk, memory.name, shape, start, sentences[start:end])
+                for start, end in self._chunks(len(sentences))
+            ]
+            tokens = [count for future in futures for count in future.result()]
+            matrix: np.ndarray = np.ndarray(shape, dtype=np.float32, buffer=memory.buf).copy()
+
+            return matrix, np.array(tokens, dtype=np.int64)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def compare_all(self, pairs: list[SentencePair]) -> list[SentenceMatches]:
+        """
+        Finds the plagiarized sentences of each pair of assignments, a pair per worker at a time.
+
+        Args:
+            pairs (list[SentencePair]): The assignments, and the entries to compare against them.
+
+        Returns:
+            list[SentenceMatches]: The plagiarized entry sentences of each pair.
+        """
+        if len(pairs) < 2:
+            return [self.comparer.compare(pair) for pair in pairs]
+
+        return [matches[0] for matches in self._compare_all(pairs, [None] * len(pairs))]
+
+    def compare_mutual_all(
+        self,
+        pairs: list[SentencePair],
+        skipped: list[list[int]],
+    ) -> list[tuple[SentenceMatches, SentenceMatches]]:
+        """
+        Finds the plagiarized sentences of each pair of entries, in both directions.
+
+        Args:
+            pairs (list[SentencePair]): The pairs of entries.
+            skipped (list[list[int]]): The positions of the sentences of the first entry of each pair that are never
+                plagiarized.
+
+        Returns:
+            list[tuple[SentenceMatches, SentenceMatches]]: The plagiarized sentences of each entry of every pair found
+                in the other one, the second entry ones first.
+        """
+        if len(pairs) < 2:
+            return [self.comparer.compare_mutual(pair, pair_skipped) for pair, pair_skipped in zip(pairs, skipped)]
+
+        return [(matches[0], matches[1]) for matches in self._compare_all(pairs, skipped)]
+
+    def _compare_all(
+        self,
+        pairs: list[SentencePair],
+        skipped: list[list[int]] | list[None],
+    ) -> list[tuple[SentenceMatches, ...]]:
+        """
+        Publishes the vectors of every assignment of the pairs once into a shared matrix, and compares the pairs across
+        the workers.
+
+        Args:
+            pairs (list[SentencePair]): The pairs of assignments.
+            skipped (list[list[int]] | list[None]): When comparing both ways, the positions of the sentences of the
+                first assignment of each pair that are never plagiarized.
+
+        Returns:
+            list[tuple[SentenceMatches, ...]]: The plagiarized sentences of each pair.
+        """
+        published, rows = self._layout(pairs)
+        shape = (rows, self.embedder.width)
+        memory = SharedMemory(create=True, size=shape[0] * shape[1] * np.dtype(np.float32).itemsize or 1)
+
+        try:
+            self._publish(memory, shape, published)
+            futures = []
+
+            for pair, pair_skipped in zip(pairs, skipped):
+                (key, _), (entry_key, _) = self._sides(pair)
+                comparison = _Comparison(
+                    self._rows(published, key),
+                    self._rows(published, entry_key),
+                    pair.sentences,
+                    pair.entry_sentences,
+                    pair.skipped,
+                    pair_skipped,
+                )
+                futures.append(self._pool.submit(_compare, memory.name, shape, comparison))
+
+            return [future.result() for future in futures]
+        finally:
+            memory.close()
+            memory.unlink()
+
+    @classmethod
+    def _layout(cls, pairs: list[SentencePair]) -> tuple[dict[Hashable, tuple[int, np.ndarray]], int]:
+        """
+        Args:
+            pairs (list[SentencePair]): The pairs of assignments.
+
+        Returns:
+            tuple[dict[Hashable, tuple[int, np.ndarray]], int]: The first row and the vectors of each assignment, by
+                the key it is published under, and the number of rows of the shared matrix.
+        """
+        # the vectors of the same assignment, e.g. the entry, are published once however many pairs hold them
+        published: dict[Hashable, tuple[int, np.ndarray]] = {}
+        rows = 0
+
+        for pair in pairs:
+            for key, vectors in cls._sides(pair):
+                if key not in published:
+                    published[key] = (rows, vectors)
+                    rows += len(vectors)
+
+        return published, rows
+
+    @staticmethod
+    def _publish(
+        memory: SharedMemory,
+        shape: tuple[int, int],
+        published: dict[Hashable, tuple[int, np.ndarray]],
+    ) -> None:
+        """
+        Writes the vectors of every assignment into the shared matrix.
+
+        Args:
+            memory (SharedMemory): The shared memory block.
+            shape (tuple[int, int]): The shape of the whole (rows x dimensions) matrix.
+            published (dict[Hashable, tuple[int, np.ndarray]]): The first row and the vectors of each assignment.
+        """
+        matrix: np.ndarray = np.ndarray(shape, dtype=np.float32, buffer=memory.buf)
+
+        for start, vectors in published.values():
+            matrix[start : start + len(vectors)] = np.asarray(vectors, dtype=np.float32).reshape(-1, shape[1])
+
+        del matrix
+
+    @staticmethod
+    def _sides(pair: SentencePair) -> tuple[tuple[Hashable, np.ndarray], tuple[Hashable, np.ndarray]]:
+        """
+        Args:
+            pair (SentencePair): A pair of assignments.
+
+        Returns:
+            tuple[tuple[Hashable, np.ndarray], tuple[Hashable, np.ndarray]]: The key each assignment of the pair is
+                published under, its ID or else the identity of its vectors, along with its vectors.
+        """
+        return (
+            (id(pair.vectors) if pair.key is None else pair.key, pair.vectors),
+            (id(pair.entry_vectors) if pair.entry_key is None else pair.entry_key, pair.entry_vectors),
+        )
+
+    @staticmethod
+    def _rows(published: dict[Hashable, tuple[int, np.ndarray]], key: Hashable) -> tuple[int, int]:
+        """
+        Args:
+            published (dict[Hashable, tuple[int, np.ndarray]]): The first row of each published matrix, and the
+                matrix, by the key of its assignment.
+            key (Hashable): The key of a published assignment.
+
+        Returns:
+            tuple[int, int]: The start and end rows of the assignment vectors within the shared matrix.
+        """
+        start, vectors = published[key]
+
+        return start, start + len(vectors)
+
+    def _chunks(self, size: int) -> list[tuple[int, int]]:
+        """
+        Splits a number of sentences into chunks.
+
+        Args:
+            size (int): The number of sentences.
+
+        Returns:
+            list[tuple[int, int]]: The start and end rows of each chunk.
+        """
+        return [(start, min(start + self.chunk_size, size)) for start in range(0, size, self.chunk_size)]
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        self._pool.shutdown()
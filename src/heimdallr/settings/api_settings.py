@@ -1,6 +1,8 @@
 """
 API Settings
 """
+from typing import Literal
+
 from pydantic import BaseModel, EmailStr, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -49,6 +51,25 @@ class ApplicationSettings(BaseSettings):
         * FASTAPI_MODEL_PATH
         * FASTAPI_DETECT_PLAGIARISM
         * FASTAPI_SIMILARITY_THRESHOLD
+        * FASTAPI_SENTENCE_NEIGHBOURS
+        * FASTAPI_DUPLICATE_THRESHOLD
+        * FASTAPI_VERBATIM_THRESHOLD
+        * FASTAPI_VERIFIER_WORKERS
+        * FASTAPI_MAX_MATCHES
+        * FASTAPI_BOILERPLATE_CUTOFF
+        * FASTAPI_VECTOR_CACHE_SIZE
+        * FASTAPI_EMBEDDING_BATCH_SIZE
+        * FASTAPI_TOPIC_FALLBACK
+        * FASTAPI_VECTOR_STORE_PATH
+        * FASTAPI_VECTOR_STORE_QUANTIZATION
+        * FASTAPI_MIN_LENGTH_RATIO
+        * FASTAPI_MIN_TOKEN_OVERLAP
+        * FASTAPI_MIN_PASSAGE_WORDS
+        * FASTAPI_EXECUTOR_THREADS
+        * FASTAPI_READER_WORKERS
+        * FASTAPI_MAX_UPLOAD_SIZE
+        * FASTAPI_MAX_BATCH_UPLOAD_SIZE
+        * FASTAPI_EXTRACTION_CACHE_PATH
         * FASTAPI_VERSION
         * FASTAPI_DOCS_URL
 
@@ -62,6 +83,33 @@ class ApplicationSettings(BaseSettings):
         MODEL_PATH (str): Path to the model file.
         DETECT_PLAGIARISM (bool): Whether to detect plagiarism or not.
         SIMILARITY_THRESHOLD (float): Similarity threshold.
+        SENTENCE_NEIGHBOURS (int): Maximum similar stored sentences looked up per sentence.
+        DUPLICATE_THRESHOLD (float): Minimum estimated Jaccard similarity of near duplicate assignments.
+        VERBATIM_THRESHOLD (float): Minimum fraction of shared fingerprints to look for verbatim passages.
+        VERIFIER_WORKERS (int): Number of processes that vectorize sentences and compare assignments.
+        MAX_MATCHES (int | None): Maximum plagiarized assignments reported per verification. None reports all.
+        BOILERPLATE_CUTOFF (int): Number of stored assignments a sentence must appear in to be boilerplate.
+        VECTOR_CACHE_SIZE (int): Maximum number of sentence vectors cached in memory. Zero disables the cache.
+        EMBEDDING_BATCH_SIZE (int): Sentences per spaCy batch when vectorizing.
+        TOPIC_FALLBACK (str): When assignments of other topics are searched: "always", "empty" when the own topic
+            holds no plagiarism, or "never".
+        VECTOR_STORE_PATH (str | None): Directory of the memory mapped sentence vectors store. None keeps the vectors
+            in memory.
+        VECTOR_STORE_QUANTIZATION (str): How the stored sentence vectors are quantized: "int8" or "float16".
+        MIN_LENGTH_RATIO (float): Minimum words ratio of two sentences to compare their vectors. Zero disables it.
+        MIN_TOKEN_OVERLAP (float): Minimum fraction of shared words of two sentences to compare their vectors. Zero
+            disables it.
+        MIN_PASSAGE_WORDS (int): Minimum words of the shared passages looked up across sentences. Zero disables it.
+        EXECUTOR_THREADS (int): Threads that read and search the assignments off the event loop. Files are read one at
+            a time.
+        READER_WORKERS (int): Number of processes that read the pages of a PDF. The reader and the verifier share the
+            same processes, as many as the larger of both numbers.
+        MAX_UPLOAD_SIZE (int | None): Maximum size of a request body, in bytes, enforced while it is uploaded. None
+            does not limit it.
+        MAX_BATCH_UPLOAD_SIZE (int | None): Maximum size of the body of a batch of assignments, in bytes, instead of
+            MAX_UPLOAD_SIZE. As large as the files a class archive may inflate to by default. None does not limit it.
+        EXTRACTION_CACHE_PATH (str | None): Directory where what is read from each file is kept, by the file hash.
+            None reads every file.
         VERSION (str): Application version.
         DOCS_URL (str): Path where swagger ui will be served at.
 
@@ -82,6 +130,25 @@ class ApplicationSettings(BaseSettings):
     MODEL_PATH: str = "F:\\dev\\heimdallr\\models\\topic_predictor.joblib"
     DETECT_PLAGIARISM: bool = True
     SIMILARITY_THRESHOLD: float = 0.95
+    SENTENCE_NEIGHBOURS: int = 50
+    DUPLICATE_THRESHOLD: float = 0.8
+    VERBATIM_THRESHOLD: float = 0.1
+    VERIFIER_WORKERS: int = 1
+    MAX_MATCHES: int | None = None
+    BOILERPLATE_CUTOFF: int = 20
+    VECTOR_CACHE_SIZE: int = 50_000
+    EMBEDDING_BATCH_SIZE: int = 256
+    TOPIC_FALLBACK: Literal["always", "empty", "never"] = "empty"
+    VECTOR_STORE_PATH: str | None = None
+    VECTOR_STORE_QUANTIZATION: Literal["int8", "float16"] = "int8"
+    MIN_LENGTH_RATIO: float = 0.0
+    MIN_TOKEN_OVERLAP: float = 0.0
+    MIN_PASSAGE_WORDS: int = 0
+    EXECUTOR_THREADS: int = 2
+    READER_WORKERS: int = 1
+    MAX_UPLOAD_SIZE: int | None = 25 * 1024 * 1024
+    MAX_BATCH_UPLOAD_SIZE: int | None = 512 * 1024 * 1024
+    EXTRACTION_CACHE_PATH: str | None = None
     VERSION: str = __version__
     DOCS_URL: str = "/docs"
 
@@ -0,0 +1,39 @@
+"""Worker Settings module.
+
+Defines environment variables configuration
+"""
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class WorkerSettings(BaseSettings):
+    """Define verification worker configuration model.
+
+    Constructor will attempt to determine the values of any fields not passed
+    as keyword arguments by reading from the environment. Default values will
+    still be used if the matching environment variable is not set.
+
+    Environment variables:
+        * WORKER_NAME
+        * WORKER_LEASE_SECONDS
+        * WORKER_MAX_ATTEMPTS
+        * WORKER_POLL_INTERVAL
+        * WORKER_PROGRESS_INTERVAL
+
+    Attributes:
+        NAME (str | None): Worker name, defaults to its host name and process ID.
+        LEASE_SECONDS (int): How long a worker holds a job before renewing its lease.
+        MAX_ATTEMPTS (int): How many times a job is tried before it is failed.
+        POLL_INTERVAL (float): Seconds to wait for new jobs when the queue is empty.
+        PROGRESS_INTERVAL (float): Seconds between progress reports of the running job.
+    """
+
+    NAME: str | None = None
+    LEASE_SECONDS: int = 300
+    MAX_ATTEMPTS: int = 3
+    POLL_INTERVAL: float = 1.0
+    PROGRESS_INTERVAL: float = 2.0
+
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_prefix="WORKER_",
+    )
@@ -5,3 +5,14 @@ Content type constants.
 APPLICATION_PDF = "application/pdf"
 APPLICATION_WORD = "application/msword"
 APPLICATION_DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+APPLICATION_ZIP = "application/zip"
+APPLICATION_ZIP_COMPRESSED = "application/x-zip-compressed"
+
+"""
+Content types of the supported assignment files, by their extension.
+"""
+EXTENSIONS = {
+    ".pdf": APPLICATION_PDF,
+    ".doc": APPLICATION_WORD,
+    ".docx": APPLICATION_DOCX,
+}
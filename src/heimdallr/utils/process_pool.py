@@ -0,0 +1,101 @@
+"""
+Forked process pool.
+
+The page reader and the vectorizer hand their CPU bound work to worker processes forked with the already loaded language
+model. A pool starts a thread to manage its workers once it forks them, and a thread holding a lock while the process
+forks leaves it held forever in the child, so a second pool must never fork after the first one. Both hand their work
+to a single pool instead: each registers what its workers inherit, and the pool forks every worker at once, afterwards.
+"""
+import concurrent.futures
+import multiprocessing
+import os
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+Initializer = tuple[Callable[..., None], tuple[Any, ...]]
+
+
+def _init_worker(initializers: list[Initializer]) -> None:
+    """
+    Runs every registered initializer in a forked worker.
+
+    Args:
+        initializers (list[Initializer]): The initializers, and their arguments.
+    """
+    for initializer, args in initializers:
+        initializer(*args)
+
+
+class ForkedProcessPool:
+    """
+    Runs the tasks of every process pool of the process across the same forked worker processes.
+    """
+
+    def __init__(self, workers: int):
+        """
+        Args:
+            workers (int): Number of worker processes.
+        """
+        self.workers = workers
+        self._initializers: list[Initializer] = []
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+
+    def register(self, initializer: Callable[..., None], *args: Any) -> None:
+        """
+        Adds what the workers inherit, before they are forked.
+
+        Args:
+            initializer (Callable[..., None]): Keeps the arguments in a forked worker.
+            *args (Any): The arguments, inherited rather than pickled.
+
+        Raises:
+            RuntimeError: The workers were already forked.
+        """
+        if self._executor is not None:
+            raise RuntimeError("The workers were already forked.")
+
+        self._initializers.append((initializer, args))
+
+    def start(self) -> None:
+        """
+        Forks every worker, which must happen before the process starts any other thread. Nothing is forked when
+        nothing was registered.
+        """
+        if self._executor is not None or not self._initializers:
+            return
+
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self._initializers,),
+        )
+
+        # the first task forks every worker, from the thread starting the pool rather than a later one
+        self._executor.submit(os.getpid).result()
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> concurrent.futures.Future[T]:
+        """
+        Args:
+            fn (Callable[..., T]): The task, run by a worker.
+            *args (Any): The arguments of the task, pickled.
+
+        Returns:
+            concurrent.futures.Future[T]: The result of the task.
+
+        Raises:
+            RuntimeError: The workers were not forked yet.
+        """
+        if self._executor is None:
+            raise RuntimeError("The workers were not forked yet.")
+
+        return self._executor.submit(fn, *args)
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
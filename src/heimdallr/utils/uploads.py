@@ -0,0 +1,46 @@
+"""
+Upload utilities.
+
+The worker streams each upload into a temporary file on disk, and the API spools them, kept in memory while small and
+rolled over to disk once large. These helpers let the readers hand the file on disk straight to the parsing libraries,
+and to the processes reading its pages, by path, rather than copying it into new bytes, buffers or temporary files.
+"""
+import io
+import os
+import tempfile
+from typing import BinaryIO
+
+
+def unspool(file: BinaryIO) -> BinaryIO:
+    """
+    Args:
+        file (BinaryIO): An uploaded file.
+
+    Returns:
+        BinaryIO: The file, rolled over to disk when it is a spooled file still in memory, rewound.
+    """
+    if isinstance(file, tempfile.SpooledTemporaryFile):
+        file.rollover()
+
+    file.seek(0)
+
+    return file
+
+
+def descriptor_path(file: BinaryIO) -> str | None:
+    """
+    Args:
+        file (BinaryIO): A file, as returned by unspool.
+
+    Returns:
+        str | None: A path other libraries and processes may open the file at, even an unnamed temporary one, or
+            None when the file is only in memory.
+    """
+    if isinstance(file, io.BytesIO):
+        return None
+
+    try:
+        # unlike /dev/fd, which differs in every process, the pool workers may open this path too
+        return f"/proc/{os.getpid()}/fd/{file.fileno()}"
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
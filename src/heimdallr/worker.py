@@ -0,0 +1,77 @@
+"""
+Verification Worker.
+
+Runs the queued assignment verifications, outside the API process. Run it with:
+
+    python -m heimdallr.worker
+"""
+import asyncio
+import logging
+import signal
+
+from heimdallr.dependencies import (
+    get_assignment_reader,
+    get_assignment_repository,
+    get_assignment_verifier,
+    get_client_factory,
+    get_corpus_snapshot,
+    get_job_repository,
+    get_nlp,
+    get_process_pool,
+    get_topic_predictor,
+)
+from heimdallr.service_layer.job_worker import JobWorker
+from heimdallr.settings.worker_settings import WorkerSettings
+
+log = logging.getLogger("uvicorn.error")
+
+
+async def main() -> None:
+    """
+    Builds the verifier, loads the stored assignments, and runs jobs until the process is interrupted.
+    """
+    settings = WorkerSettings()
+    client_factory = get_client_factory()
+
+    # the reader and the verifier share a process pool, which forks every worker at once once both registered what the
+    # workers inherit, before the first database operation starts any thread
+    nlp = get_nlp()
+    pool = get_process_pool()
+    reader = get_assignment_reader(natural_language_processor=nlp, predictor=get_topic_predictor(nlp), pool=pool)
+    repository = get_assignment_repository(client_factory)
+    corpus = get_corpus_snapshot(repository)
+    verifier = get_assignment_verifier(
+        reader=reader,
+        assignment_repo=repository,
+        natural_language_processor=nlp,
+        corpus=corpus,
+        pool=pool,
+    )
+    pool.start()
+
+    # load the stored assignments once, verifications only load the changes
+    await corpus.refresh()
+
+    worker = JobWorker(
+        jobs=get_job_repository(client_factory),
+        verifier=verifier,
+        name=settings.NAME,
+        lease_seconds=settings.LEASE_SECONDS,
+        max_attempts=settings.MAX_ATTEMPTS,
+        poll_interval=settings.POLL_INTERVAL,
+        progress_interval=settings.PROGRESS_INTERVAL,
+    )
+
+    # finishes the running job before stopping, e.g. during a deployment
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    await worker.run(stop)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -6,14 +6,19 @@ from spacy import Language
 from starlette.testclient import TestClient
 
 from heimdallr.adapters.assignment_reader import AssignmentReader, SpacyAssignmentReader
-from heimdallr.adapters.repository import AsyncAssignmentRepository
-from heimdallr.dependencies import get_nlp
+from heimdallr.adapters.repository import AsyncAssignmentRepository, AsyncJobRepository
+from heimdallr.dependencies import get_job_repository, get_nlp
 from heimdallr.main import app
+from heimdallr.service_layer.assignment_searcher import AssignmentSearcher
+from heimdallr.service_layer.assignment_vectors import AssignmentVectors
 from heimdallr.service_layer.assignment_verifier import (
     AssignmentVerifier,
     SpacyAssignmentVerifier,
 )
-from tests.mocks import AsyncInMemAssignmentRepository
+from heimdallr.service_layer.corpus_index import CorpusIndex
+from heimdallr.service_layer.lexical_gate import LexicalGate
+from heimdallr.service_layer.sentence_comparer import SentenceComparer
+from tests.mocks import AsyncInMemAssignmentRepository, AsyncInMemJobRepository
 
 
 @pytest.fixture(name="test_client")
@@ -35,6 +40,17 @@ def fixture_assignment_repository() -> AsyncAssignmentRepository:
     return AsyncInMemAssignmentRepository()
 
 
+@pytest.fixture(name="job_repository")
+def fixture_job_repository() -> AsyncJobRepository:
+    """
+    Create a job repository, injected into the application.
+    """
+    job_repository = AsyncInMemJobRepository()
+    app.dependency_overrides[get_job_repository] = lambda: job_repository
+    yield job_repository
+    app.dependency_overrides.pop(get_job_repository)
+
+
 @pytest.fixture(name="nlp")
 def fixture_nlp() -> Language:
     """
@@ -56,4 +72,7 @@ def fixture_assignment_service(nlp, assignment_reader, assignment_repository) ->
     """
     Injects an assignment service.
     """
-    return SpacyAssignmentVerifier(nlp=nlp, reader=assignment_reader, repository=assignment_repository)
+    comparer = SentenceComparer(LexicalGate())
+    searcher = AssignmentSearcher(CorpusIndex(AssignmentVectors(nlp, comparer)), comparer)
+
+    return SpacyAssignmentVerifier(reader=assignment_reader, repository=assignment_repository, searcher=searcher)
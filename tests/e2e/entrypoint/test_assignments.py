@@ -0,0 +1,176 @@
+"""
+Test Cases for Assignments Entrypoint.
+"""
+import hashlib
+import zipfile
+from io import BytesIO
+
+from fastapi import status
+
+from heimdallr.domain.events.assignments import JobScheduled
+from heimdallr.domain.schemas import ResponseModel
+from heimdallr.entrypoint.v1 import assignments
+from heimdallr.utils import content_type
+
+
+class TestAssignmentsEntryPoint:
+    def test_verify_assignment_queues_job(self, test_client, job_repository):
+        """
+        GIVEN a FastAPI application configured with the Assignments Entrypoint
+        WHEN an assignment is uploaded "POST /api/v1/assignments"
+        THEN it should return 202, and queue a job holding the file and its hash
+        """
+        # when
+        response = test_client.post(
+            "/api/v1/assignments",
+            files={"file": ("a.pdf", b"%PDF", content_type.APPLICATION_PDF)},
+        )
+
+        # then
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        [job] = job_repository._data.values()  # pylint: disable=protected-access
+        assert ResponseModel[JobScheduled].model_validate_json(response.content).data.id == job.id
+        assert (job.filename, job_repository.uploads[job.upload_id], job.batch_id) == ("a.pdf", b"%PDF", None)
+        assert job.sha256 == hashlib.sha256(b"%PDF").hexdigest()
+
+    def test_verify_assignments_batch(self, test_client, job_repository):
+        """
+        GIVEN a file, and a ZIP archive holding two more files and an unsupported one
+        WHEN they are uploaded as a batch "POST /api/v1/assignments/batch"
+        THEN it should return 202, and queue a job per supported file in the same batch
+        """
+        # given
+        archive = BytesIO()
+
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("class/b.docx", b"docx")
+            zip_file.writestr("class/c.doc", b"doc")
+            zip_file.writestr("class/notes.txt", b"txt")
+
+        # when
+        response = test_client.post(
+            "/api/v1/assignments/batch",
+            files=[
+                ("files", ("a.pdf", b"%PDF", content_type.APPLICATION_PDF)),
+                ("files", ("class.zip", archive.getvalue(), content_type.APPLICATION_ZIP)),
+            ],
+        )
+
+        # then
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        events = ResponseModel[list[JobScheduled]].model_validate_json(response.content).data
+        jobs = job_repository._data  # pylint: disable=protected-access
+        assert sorted(jobs[event.id].filename for event in events) == ["a.pdf", "b.docx", "c.doc"]
+        assert jobs[events[1].id].content_type == content_type.APPLICATION_DOCX
+        assert len({job.batch_id for job in jobs.values()}) == 1
+        assert {job.upload_id for job in jobs.values()} == job_repository.uploads.keys()
+
+    def test_verify_assignments_batch_larger_than_upload(self, test_client, job_repository):
+        """
+        GIVEN a class whose files are larger together than a single upload may be
+        WHEN they are uploaded as a batch "POST /api/v1/assignments/batch"
+        THEN it should return 202, and queue a job per file
+        """
+        # given
+        document = b"%PDF" + bytes(13 * 1024 * 1024)
+
+        # when
+        response = test_client.post(
+            "/api/v1/assignments/batch",
+            files=[
+                ("files", ("a.pdf", document, content_type.APPLICATION_PDF)),
+                ("files", ("b.pdf", document, content_type.APPLICATION_PDF)),
+            ],
+        )
+
+        # then
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert len(job_repository._data) == 2  # pylint: disable=protected-access
+
+    def test_verify_assignments_batch_unsupported(self, test_client, job_repository):
+        """
+        GIVEN an unsupported file
+        WHEN it is uploaded as a batch "POST /api/v1/assignments/batch"
+        THEN it should return 415, and queue nothing
+        """
+        # when
+        response = test_client.post(
+            "/api/v1/assignments/batch",
+            files=[("files", ("notes.txt", b"txt", "text/plain"))],
+        )
+
+        # then
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        assert not job_repository._data  # pylint: disable=protected-access
+
+    @staticmethod
+    def zip_archive(files: dict[str, bytes]) -> bytes:
+        """
+        Compresses files into a ZIP archive.
+        """
+        archive = BytesIO()
+
+        with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            for name, data in files.items():
+                zip_file.writestr(name, data)
+
+        return archive.getvalue()
+
+    def test_verify_assignments_batch_too_many_files(self, test_client, job_repository, monkeypatch):
+        """
+        GIVEN a ZIP archive holding more files than allowed
+        WHEN it is uploaded as a batch "POST /api/v1/assignments/batch"
+        THEN it should return 413, and queue nothing
+        """
+        # given
+        monkeypatch.setattr(assignments, "MAX_ARCHIVE_FILES", 1)
+        archive = self.zip_archive({"a.pdf": b"%PDF-a", "b.pdf": b"%PDF-b"})
+
+        # when
+        response = test_client.post(
+            "/api/v1/assignments/batch",
+            files=[("files", ("class.zip", archive, content_type.APPLICATION_ZIP))],
+        )
+
+        # then
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert not job_repository._data  # pylint: disable=protected-access
+
+    def test_verify_assignments_batch_too_large(self, test_client, job_repository, monkeypatch):
+        """
+        GIVEN a ZIP archive whose files inflate to more than allowed
+        WHEN it is uploaded as a batch "POST /api/v1/assignments/batch"
+        THEN it should return 413, and queue nothing
+        """
+        # given
+        monkeypatch.setattr(assignments, "MAX_ARCHIVE_SIZE", 16)
+        archive = self.zip_archive({"a.pdf": b"%PDF-a" * 2, "b.pdf": b"%PDF-b" * 2})
+
+        # when
+        response = test_client.post(
+            "/api/v1/assignments/batch",
+            files=[("files", ("class.zip", archive, content_type.APPLICATION_ZIP))],
+        )
+
+        # then
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert not job_repository._data  # pylint: disable=protected-access
+
+    def test_verify_assignments_batch_compression_ratio(self, test_client, job_repository):
+        """
+        GIVEN a ZIP archive holding a file compressed far more than any document is, e.g. a ZIP bomb
+        WHEN it is uploaded as a batch "POST /api/v1/assignments/batch"
+        THEN it should return 422 before inflating it, and queue nothing
+        """
+        # given
+        archive = self.zip_archive({"a.pdf": b"%PDF-a", "bomb.pdf": bytes(10 * 1024 * 1024)})
+
+        # when
+        response = test_client.post(
+            "/api/v1/assignments/batch",
+            files=[("files", ("class.zip", archive, content_type.APPLICATION_ZIP))],
+        )
+
+        # then
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert not job_repository._data  # pylint: disable=protected-access
@@ -0,0 +1,52 @@
+"""
+Test Cases for Jobs Entrypoint.
+"""
+import datetime
+import uuid
+from io import BytesIO
+
+import pytest
+from fastapi import status
+
+from heimdallr.domain.events.assignments import JobReported
+from heimdallr.domain.models.assignment import AssignmentVerification
+from heimdallr.domain.models.job import Job, JobStatus
+from heimdallr.domain.schemas import ResponseModel
+
+
+class TestJobsEntryPoint:
+    @pytest.mark.asyncio
+    async def test_get_running_job(self, test_client, job_repository):
+        """
+        GIVEN a running job that already found a plagiarized assignment
+        WHEN its status is requested "GET /api/v1/jobs/{id}"
+        THEN it should return 200, its progress, and the plagiarism found so far
+        """
+        # given
+        job = await job_repository.enqueue(Job(), BytesIO(b"data"))
+        await job_repository.claim(worker="worker", lease=datetime.timedelta(minutes=1), max_attempts=3)
+        found = AssignmentVerification(id=uuid.uuid4(), plagiarism=0.5)
+        await job_repository.report(job.id, worker="worker", compared=3, total=10, similarities=[found])
+
+        # when
+        response = test_client.get(f"/api/v1/jobs/{job.id}")
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        event = ResponseModel[JobReported].model_validate_json(response.content).data
+        assert event.status == JobStatus.RUNNING
+        assert (event.compared, event.total) == (3, 10)
+        assert event.elapsed >= 0
+        assert [similarity.id for similarity in event.similarities] == [found.id]
+
+    def test_get_missing_job(self, test_client, job_repository):
+        """
+        GIVEN no jobs
+        WHEN a job status is requested "GET /api/v1/jobs/{id}"
+        THEN it should return 404
+        """
+        # when
+        response = test_client.get(f"/api/v1/jobs/{uuid.uuid4()}")
+
+        # then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -3,15 +3,20 @@ Mocks Class for Testing
 """
 # mypy: ignore-errors
 
-from uuid import UUID
+import datetime
+from typing import BinaryIO, Iterable
+from uuid import UUID, uuid4
 
 from heimdallr.adapters.repository import (
     AsyncAssignmentRepository,
+    AsyncJobRepository,
     AsyncRepository,
     ReadOnlyRepository,
     T,
     WriteOnlyRepository,
 )
+from heimdallr.domain.models.assignment import AssignmentVerification
+from heimdallr.domain.models.job import Job, JobStatus, utcnow
 
 
 class InMemRepository(WriteOnlyRepository, ReadOnlyRepository):
@@ -61,4 +66,109 @@ class AsyncInMemRepository(AsyncRepository):
 
 
 class AsyncInMemAssignmentRepository(AsyncAssignmentRepository, AsyncInMemRepository):
-    pass
+    def __init__(self, data: dict | None = None):
+        super().__init__(data)
+        self._version = 0
+
+    async def delete(self, entity: T, *args, **kwargs) -> None:
+        await super().delete(entity, *args, **kwargs)
+        self._version += 1
+
+    async def save(self, entity: T, *args, **kwargs) -> T:
+        entity.revision = uuid4()
+        self._version += 1
+        return await super().save(entity, *args, **kwargs)
+
+    async def find_revisions(self) -> dict[UUID, UUID | None]:
+        return {key: entity.revision for key, entity in self._data.items()}
+
+    async def find_by_ids(self, ids: Iterable[UUID], exclude: Iterable[str] = ()) -> list[T]:
+        excluded = {field: None for field in exclude}
+        return [self._data[key].model_copy(update=excluded, deep=True) for key in ids if key in self._data]
+
+    async def version(self) -> int:
+        return self._version
+
+
+class AsyncInMemJobRepository(AsyncJobRepository, AsyncInMemRepository):
+    def __init__(self, data: dict | None = None):
+        super().__init__(data)
+        self.uploads: dict[UUID, bytes] = {}
+
+    async def enqueue(self, job: Job, file: BinaryIO) -> Job:
+        upload_id = uuid4()
+        self.uploads[upload_id] = file.read()
+        return await self.save(job.model_copy(update={"upload_id": upload_id}))
+
+    async def read_upload(self, job: Job, destination: BinaryIO) -> None:
+        if job.upload_id not in self.uploads:
+            raise FileNotFoundError(f"Job {job.id} holds no file.")
+
+        destination.write(self.uploads[job.upload_id])
+
+    async def claim(self, worker: str, lease: datetime.timedelta, max_attempts: int) -> Job | None:
+        now = utcnow()
+
+        for job in sorted(self._data.values(), key=lambda job: job.created_at):
+            expired = job.status == JobStatus.RUNNING and job.lease_until < now
+
+            if expired and job.attempts >= max_attempts:
+                job.status, job.error, job.lease_until = JobStatus.FAILED, "Lease expired.", None
+            elif job.status == JobStatus.QUEUED or expired:
+                return self._claimed(job, worker, now + lease)
+
+        return None
+
+    async def claim_batch(self, batch_id: UUID, worker: str, lease: datetime.timedelta) -> list[Job]:
+        now = utcnow()
+
+        return [
+            self._claimed(job, worker, now + lease)
+            for job in sorted(self._data.values(), key=lambda job: job.created_at)
+            if job.batch_id == batch_id and job.status == JobStatus.QUEUED
+        ]
+
+    @staticmethod
+    def _claimed(job: Job, worker: str, lease_until: datetime.datetime) -> Job:
+        job.status, job.worker, job.lease_until = JobStatus.RUNNING, worker, lease_until
+        job.started_at, job.compared, job.total, job.similarities = utcnow(), 0, 0, []
+        job.attempts += 1
+        return job.model_copy(deep=True)
+
+    async def renew(self, job_id: UUID, worker: str, lease: datetime.timedelta) -> bool:
+        job = self._data.get(job_id)
+
+        if not job or job.worker != worker or job.status != JobStatus.RUNNING:
+            return False
+
+        job.lease_until = utcnow() + lease
+        return True
+
+    async def report(
+        self,
+        job_id: UUID,
+        worker: str,
+        compared: int,
+        total: int,
+        similarities: list[AssignmentVerification],
+    ) -> None:
+        job = self._data[job_id]
+        job.compared, job.total, job.similarities = compared, total, similarities
+
+    async def find_status(self, job_id: UUID) -> Job | None:
+        job = self._data.get(job_id)
+
+        return job.model_copy() if job else None
+
+    async def complete(self, job_id: UUID, worker: str) -> None:
+        job = self._data[job_id]
+        self.uploads.pop(job.upload_id, None)
+        job.status, job.lease_until, job.upload_id, job.finished_at = JobStatus.DONE, None, None, utcnow()
+
+    async def fail(self, job_id: UUID, worker: str, error: str, retry: bool) -> None:
+        job = self._data[job_id]
+        job.status, job.lease_until, job.error = JobStatus.QUEUED if retry else JobStatus.FAILED, None, error
+
+        if not retry:
+            self.uploads.pop(job.upload_id, None)
+            job.upload_id, job.finished_at = None, utcnow()
@@ -0,0 +1,122 @@
+"""
+Unit test for the SpacyAssignmentReader class.
+"""
+from io import BytesIO
+
+import docx
+import pytest
+import spacy
+from fastapi import UploadFile
+from spacy import Language
+
+from heimdallr.adapters.assignment_reader import SpacyAssignmentReader
+from heimdallr.domain.models.assignment import UNKNOWN_AUTHOR
+from heimdallr.utils import content_type
+
+
+class TestSpacyAssignmentReader:
+    @pytest.fixture(name="ner_nlp")
+    def fixture_ner_nlp(self) -> Language:
+        """
+        Injects a pipeline that splits sentences and recognizes a few people by name.
+        """
+        nlp = spacy.blank("es")
+        nlp.add_pipe("sentencizer")
+        ruler = nlp.add_pipe("entity_ruler", name="ner")
+        ruler.add_patterns(
+            [
+                {"label": "PER", "pattern": "Alejandro Prince"},
+                {"label": "PER", "pattern": "Ing. Juan Perez"},
+                {"label": "PER", "pattern": "Ana Gomez"},
+                {"label": "PER", "pattern": "Luis Diaz"},
+            ]
+        )
+
+        return nlp
+
+    @staticmethod
+    def docx_file(paragraphs: list[str]) -> UploadFile:
+        """
+        Writes a DOCX file holding the paragraphs.
+        """
+        document = docx.Document()
+
+        for paragraph in paragraphs:
+            document.add_paragraph(paragraph)
+
+        data = BytesIO()
+        document.save(data)
+        data.seek(0)
+
+        return UploadFile(file=data, filename="a.docx", headers={"content-type": content_type.APPLICATION_DOCX})
+
+    def test_read_docx_author_skips_excluded_names(self, ner_nlp: Language):
+        """
+        GIVEN a DOCX file naming the professors before the student
+        WHEN the reader reads it
+        THEN the author is the student, and every paragraph is split into sentences.
+        """
+        # given
+        reader = SpacyAssignmentReader(ner_nlp)
+        paragraphs = [
+            "Profesor Alejandro Prince.",
+            "Ing. Juan Perez.",
+            "Alumna Ana Gomez. Primer trabajo.",
+            "Luis Diaz escribió otro libro.",
+        ]
+
+        # when
+        assignment = reader.read(self.docx_file(paragraphs))
+
+        # then
+        assert assignment.author == "Ana Gomez"
+        assert assignment.content == [
+            "Profesor Alejandro Prince.",
+            "Ing. Juan Perez.",
+            "Alumna Ana Gomez.",
+            "Primer trabajo.",
+            "Luis Diaz escribió otro libro.",
+        ]
+
+    def test_parse_pages_stops_looking_for_the_author(self, ner_nlp: Language, monkeypatch):
+        """
+        GIVEN pages naming two people
+        WHEN the reader parses them
+        THEN the author is the first one, and the pages past the author's batch skip the recognizer.
+        """
+        # given
+        reader = SpacyAssignmentReader(ner_nlp)
+        pages = ["Ana Gomez."] + [f"Luis Diaz, page {number}." for number in range(2 * reader.AUTHOR_BATCH_SIZE)]
+        ruler = ner_nlp.get_pipe("ner")
+        call = type(ruler).__call__
+        recognized: list[str] = []
+
+        def recognize(component, doc):
+            recognized.append(doc.text)
+            return call(component, doc)
+
+        monkeypatch.setattr(type(ruler), "__call__", recognize)
+
+        # when
+        result, author = reader._parse_pages(pages, len(pages))
+
+        # then
+        assert author == "Ana Gomez"
+        assert result == [[page] for page in pages]
+        assert 0 < len(recognized) <= reader.AUTHOR_BATCH_SIZE
+        assert recognized == pages[: len(recognized)]
+
+    def test_parse_pages_without_author(self, nlp: Language):
+        """
+        GIVEN pages naming nobody
+        WHEN the reader parses them
+        THEN no author is found.
+        """
+        # given
+        reader = SpacyAssignmentReader(nlp)
+
+        # when
+        result, author = reader._parse_pages(["This is a sentence."], 1)
+
+        # then
+        assert (result, author or UNKNOWN_AUTHOR) == ([["This is a sentence."]], UNKNOWN_AUTHOR)
@@ -0,0 +1,228 @@
+"""
+Unit test for the Motor repositories, against mocked collections.
+"""
+import datetime
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from heimdallr.adapters.motor_repositories import (
+    MotorAssignmentRepository,
+    MotorJobRepository,
+)
+from heimdallr.domain.models.assignment import Assignment
+from heimdallr.domain.models.job import Job
+
+
+class AsyncCursor:
+    """
+    Iterates over some documents as a Motor cursor does.
+    """
+
+    def __init__(self, documents: list[dict]):
+        self.documents = iter(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self.documents)
+        except StopIteration as error:
+            raise StopAsyncIteration from error
+
+
+class TestMotorAssignmentRepository:
+    @pytest.fixture(name="collections")
+    def fixture_collections(self) -> dict[str, MagicMock]:
+        """
+        Injects a mocked collection per name.
+        """
+        return {"assignment": MagicMock(), "versions": MagicMock()}
+
+    @pytest.fixture(name="repository")
+    def fixture_repository(self, collections: dict[str, MagicMock]) -> MotorAssignmentRepository:
+        """
+        Injects a repository over a mocked client.
+        """
+        client = MagicMock()
+        client.get_database.return_value.get_collection.side_effect = collections.__getitem__
+
+        return MotorAssignmentRepository(client, "heimdallr")
+
+    def test_instantiate(self, repository: MotorAssignmentRepository):
+        """
+        GIVEN a Motor client
+        WHEN an assignment repository is created
+        THEN it implements every abstract method, over the assignment collection.
+        """
+        # then
+        assert not MotorAssignmentRepository.__abstractmethods__
+        assert repository.collection_name == "assignment"
+
+    @pytest.mark.asyncio
+    async def test_find_revisions(self, repository: MotorAssignmentRepository, collections: dict[str, MagicMock]):
+        """
+        GIVEN an assignment saved with a revision, and another saved before revisions
+        WHEN their revisions are found
+        THEN only the IDs and revisions are projected.
+        """
+        # given
+        key, revision, legacy = uuid4(), uuid4(), uuid4()
+        collections["assignment"].find.return_value = AsyncCursor(
+            [{"_id": str(key), "revision": str(revision)}, {"_id": str(legacy)}]
+        )
+
+        # when
+        found = await repository.find_revisions()
+
+        # then
+        assert found == {key: revision, legacy: None}
+        collections["assignment"].find.assert_called_once_with({}, projection={"_id": 1, "revision": 1})
+
+    @pytest.mark.asyncio
+    async def test_save_revises(self, repository: MotorAssignmentRepository, collections: dict[str, MagicMock]):
+        """
+        GIVEN a stored assignment
+        WHEN it is saved again
+        THEN it is stored under a new revision.
+        """
+        # given
+        collections["assignment"].replace_one = AsyncMock()
+        collections["versions"].update_one = AsyncMock()
+        assignment = await repository.save(Assignment(content=["A sentence."]))
+        revision = assignment.revision
+
+        # when
+        await repository.save(assignment)
+
+        # then
+        [*_, (args, _)] = collections["assignment"].replace_one.call_args_list
+        assert args[1]["revision"] == str(assignment.revision) != str(revision)
+        assert collections["versions"].update_one.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_find_by_ids(self, repository: MotorAssignmentRepository, collections: dict[str, MagicMock]):
+        """
+        GIVEN a stored assignment
+        WHEN it is found by its ID, excluding a field
+        THEN the field is not projected.
+        """
+        # given
+        assignment = Assignment(author="Author", content=["A sentence."])
+        collections["assignment"].find.return_value = AsyncCursor([assignment.model_dump(mode="json", by_alias=True)])
+
+        # when
+        found = await repository.find_by_ids([assignment.id], exclude=["similarities"])
+
+        # then
+        assert [entry.id for entry in found] == [assignment.id]
+        collections["assignment"].find.assert_called_once_with(
+            {"_id": {"$in": [str(assignment.id)]}}, projection={"similarities": 0}
+        )
+
+    @pytest.mark.asyncio
+    async def test_version(self, repository: MotorAssignmentRepository, collections: dict[str, MagicMock]):
+        """
+        GIVEN a collection saved to twice, and another never saved to
+        WHEN their versions are read
+        THEN they are the number of saves.
+        """
+        # given
+        collections["versions"].find_one = AsyncMock(side_effect=[{"_id": "assignment", "version": 2}, None])
+
+        # when
+        versions = [await repository.version(), await repository.version()]
+
+        # then
+        assert versions == [2, 0]
+
+
+class TestMotorJobRepository:
+    @pytest.fixture(name="repository")
+    def fixture_repository(self) -> MotorJobRepository:
+        """
+        Injects a repository over a client that never connects, whose collection and bucket are mocked.
+        """
+        repository = MotorJobRepository(AsyncIOMotorClient("mongodb://localhost:1", connect=False), "heimdallr")
+        repository.collection = MagicMock(replace_one=AsyncMock(), find_one_and_update=AsyncMock())
+        repository.uploads = MagicMock(
+            upload_from_stream_with_id=AsyncMock(),
+            download_to_stream=AsyncMock(side_effect=NoFile),
+            delete=AsyncMock(),
+        )
+
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_enqueue(self, repository: MotorJobRepository):
+        """
+        GIVEN a new job and its uploaded file
+        WHEN the job is queued
+        THEN the file is streamed into the bucket, and the job document only references it.
+        """
+        # given
+        file = BytesIO(b"%PDF")
+
+        # when
+        job = await repository.enqueue(Job(filename="a.pdf"), file)
+
+        # then
+        repository.uploads.upload_from_stream_with_id.assert_awaited_once_with(str(job.upload_id), "a.pdf", file)
+        [(args, _)] = repository.collection.replace_one.call_args_list
+        assert args[1]["upload_id"] == str(job.upload_id)
+
+    @pytest.mark.asyncio
+    async def test_complete_drops_upload(self, repository: MotorJobRepository):
+        """
+        GIVEN a running job referencing its file
+        WHEN it is done
+        THEN its file is deleted.
+        """
+        # given
+        upload_id = str(uuid4())
+        repository.collection.find_one_and_update.return_value = {"_id": str(uuid4()), "upload_id": upload_id}
+
+        # when
+        await repository.complete(uuid4(), worker="worker")
+
+        # then
+        repository.uploads.delete.assert_awaited_once_with(upload_id)
+
+    @pytest.mark.asyncio
+    async def test_read_missing_upload(self, repository: MotorJobRepository):
+        """
+        GIVEN a job whose file is not stored
+        WHEN its file is read
+        THEN it fails as a missing file.
+        """
+        # when, then
+        with pytest.raises(FileNotFoundError):
+            await repository.read_upload(Job(upload_id=uuid4()), BytesIO())
+
+    @pytest.mark.asyncio
+    async def test_claim_fails_expired_jobs_out_of_attempts(self, repository: MotorJobRepository):
+        """
+        GIVEN a job whose lease expired after its last attempt
+        WHEN another job is claimed
+        THEN the expired job fails, and its file is deleted.
+        """
+        # given
+        job_id, upload_id = str(uuid4()), str(uuid4())
+        repository.collection.find = MagicMock(return_value=AsyncCursor([{"_id": job_id}]))
+        repository.collection.find_one_and_update.side_effect = [{"_id": job_id, "upload_id": upload_id}, None]
+
+        # when
+        job = await repository.claim("worker", datetime.timedelta(seconds=60), max_attempts=3)
+
+        # then
+        assert job is None
+        (query, update), _ = repository.collection.find_one_and_update.call_args_list[0]
+        assert query["_id"] == job_id
+        assert update["$set"]["status"] == "failed"
+        assert update["$set"]["upload_id"] is None
+        repository.uploads.delete.assert_awaited_once_with(upload_id)
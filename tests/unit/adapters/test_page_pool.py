@@ -0,0 +1,101 @@
+"""
+Unit test for the ProcessPoolPageReader class.
+"""
+import tempfile
+from io import BytesIO
+
+import fitz
+import pytest
+from spacy import Language
+
+from heimdallr.adapters.assignment_reader import SpacyAssignmentReader
+from heimdallr.adapters.page_pool import ProcessPoolPageReader
+from heimdallr.utils.uploads import unspool
+
+
+class TestProcessPoolPageReader:
+    PAGES = [f"This is the sentence of page {number}. This is another very long sentence." for number in range(7)]
+
+    @pytest.fixture(name="page_reader")
+    def fixture_page_reader(self, nlp: Language) -> ProcessPoolPageReader:
+        """
+        Injects a page reader with small chunks, so that every document spreads over its workers.
+        """
+        page_reader = ProcessPoolPageReader(SpacyAssignmentReader(nlp)._parse_pages, workers=2, chunk_size=2)
+        yield page_reader
+        page_reader.shutdown()
+
+    @staticmethod
+    def pdf(pages: list[str]) -> bytes:
+        """
+        Writes a PDF holding a text per page.
+        """
+        document = fitz.open()
+
+        for text in pages:
+            document.new_page().insert_text((72, 72), text)
+
+        data = document.tobytes()
+        document.close()
+
+        return data
+
+    def test_read_matches_in_process(self, nlp: Language, page_reader: ProcessPoolPageReader):
+        """
+        GIVEN a PDF of several pages
+        WHEN the pool reads it
+        THEN it produces the same sentences, in the same order, as the calling process.
+        """
+        # given
+        data = self.pdf(self.PAGES)
+        expected = SpacyAssignmentReader(nlp)._parse_pages(self.PAGES, 1)
+
+        # when
+        pages, author = page_reader.read(BytesIO(data))
+
+        # then
+        assert (pages, author) == expected
+        assert len(pages) == len(self.PAGES)
+        assert pages[3] == ["This is the sentence of page 3.", "This is another very long sentence."]
+
+    def test_read_from_disk(self, nlp: Language, page_reader: ProcessPoolPageReader):
+        """
+        GIVEN a PDF of several pages, in an unnamed temporary file
+        WHEN the pool reads it
+        THEN its workers open the file by its descriptor path, and produce the same sentences as the calling process.
+        """
+        # given
+        expected = SpacyAssignmentReader(nlp)._parse_pages(self.PAGES, 1)
+
+        with tempfile.TemporaryFile() as file:
+            file.write(self.pdf(self.PAGES))
+
+            # when
+            pages, author = page_reader.read(unspool(file))
+
+        # then
+        assert (pages, author) == expected
+
+    def test_read_short_document_in_process(self, page_reader: ProcessPoolPageReader):
+        """
+        GIVEN a PDF with fewer pages than a chunk
+        WHEN the pool reads it
+        THEN it reads the pages in the calling process.
+        """
+        # given
+        data = self.pdf(self.PAGES[:1])
+
+        # when
+        pages, _ = page_reader.read(BytesIO(data))
+
+        # then
+        assert pages == [["This is the sentence of page 0.", "This is another very long sentence."]]
+
+    def test_workers_forked_on_creation(self, page_reader: ProcessPoolPageReader):
+        """
+        GIVEN a new page reader
+        WHEN nothing was submitted to it yet
+        THEN every worker process is already running.
+        """
+        # then
+        assert len(page_reader._pool._executor._processes) == 2
@@ -0,0 +1,94 @@
+"""
+Unit test for the UploadLimitMiddleware class.
+"""
+import pytest
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+from heimdallr.entrypoint.middleware import UploadLimitMiddleware
+
+
+class TestUploadLimitMiddleware:
+    @pytest.fixture(name="client")
+    def fixture_client(self) -> TestClient:
+        """
+        Injects a client of an application that accepts uploads of up to 1000 bytes, and batches of up to 2000.
+        """
+        app = FastAPI()
+        app.add_middleware(UploadLimitMiddleware, max_size=1000, limits={"/batch": 2000})
+
+        @app.post("/upload")
+        async def upload(file: UploadFile) -> int:
+            return len(await file.read())
+
+        @app.post("/batch")
+        async def batch(file: UploadFile) -> int:
+            return len(await file.read())
+
+        return TestClient(app)
+
+    def test_accepts_small_upload(self, client: TestClient):
+        """
+        GIVEN a file smaller than the limit
+        WHEN it is uploaded
+        THEN the application receives it.
+        """
+        # when
+        response = client.post("/upload", files={"file": ("a.pdf", b"%PDF", "application/pdf")})
+
+        # then
+        assert response.status_code == 200
+        assert response.json() == 4
+
+    def test_rejects_declared_length(self, client: TestClient):
+        """
+        GIVEN a file larger than the limit
+        WHEN it is uploaded
+        THEN the request is rejected as too large.
+        """
+        # when
+        response = client.post("/upload", files={"file": ("a.pdf", b"%PDF" * 300, "application/pdf")})
+
+        # then
+        assert response.status_code == 413
+
+    def test_rejects_streamed_body(self, client: TestClient):
+        """
+        GIVEN a body sent in chunks, without a length, that grows larger than the limit
+        WHEN it is uploaded
+        THEN the request is rejected as too large.
+        """
+        # given
+        boundary = "boundary"
+        chunks = [
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="a.pdf"\r\n\r\n'.encode(),
+            *[b"%PDF" * 100] * 10,
+            f"\r\n--{boundary}--\r\n".encode(),
+        ]
+
+        # when
+        response = client.post(
+            "/upload",
+            content=iter(chunks),
+            headers={"content-type": f"multipart/form-data; boundary={boundary}"},
+        )
+
+        # then
+        assert response.status_code == 413
+        assert response.json() == {"detail": "The upload is larger than 1000 bytes."}
+
+    def test_path_limit(self, client: TestClient):
+        """
+        GIVEN a path with a limit of its own
+        WHEN a file larger than the default limit, but not than the path one, is uploaded to it
+        THEN the application receives it, and a file larger than the path limit is rejected.
+        """
+        # when
+        accepted = client.post("/batch", files={"file": ("a.pdf", b"%PDF" * 300, "application/pdf")})
+        rejected = client.post("/batch", files={"file": ("a.pdf", b"%PDF" * 600, "application/pdf")})
+
+        # then
+        assert accepted.status_code == 200
+        assert accepted.json() == 1200
+        assert rejected.status_code == 413
+        assert rejected.json() == {"detail": "The upload is larger than 2000 bytes."}
@@ -1,8 +1,24 @@
 """
 Unit test for the AssignmentVerifier class.
 """
-from heimdallr.domain.models.assignment import Assignment
+import asyncio
+import time
+from io import BytesIO
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import UploadFile
+
+from heimdallr.domain.commands.assignments import VerifyAssignment
+from heimdallr.domain.models.assignment import Assignment, Topic
 from heimdallr.service_layer.assignment_verifier import AssignmentVerifier
+from heimdallr.service_layer.extraction_cache import ExtractionCache
+from heimdallr.service_layer.passages import PassageIndex
+from heimdallr.service_layer.progress import VerificationProgress
+from heimdallr.service_layer.sentence_index import SentenceIndex
+from heimdallr.service_layer.topic_index import TopicFallback
+from heimdallr.service_layer.vector_store import VectorStore
 
 
 class TestAssignmentVerifier:
@@ -81,3 +97,332 @@ class TestAssignmentVerifier:
         assert result.id == assignment.id
         assert result.author == assignment.author
         assert result.plagiarism == 1
+
+    def test_vectorize(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN an assignment without vectors
+        WHEN the verifier vectorizes it
+        THEN each sentence gets a vector stamped with the language model.
+        """
+        # given
+        assignment = Assignment(content=[self.SENTENCE, self.SENTENCE.replace(".", ", a very long sentence.")])
+
+        # when
+        assignment_verifier.vectors.vectorize(assignment)
+
+        # then
+        assert len(assignment.vectors) == len(assignment.content)
+        assert assignment.vectors_model == assignment_verifier.vectors.model
+
+    def test_vectorize_uses_cache(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN an assignment whose sentences were already vectorized
+        WHEN the verifier vectorizes another assignment with the same sentences
+        THEN the vectors come from the cache, and are the same.
+        """
+        # given
+        content = [self.SENTENCE, self.SENTENCE.replace(".", ", a very long sentence.")]
+        assignment = assignment_verifier.vectors.vectorize(Assignment(content=content))
+        hits = assignment_verifier.vectors.cache.hits
+
+        # when
+        result = assignment_verifier.vectors.vectorize(Assignment(content=content))
+
+        # then
+        assert assignment_verifier.vectors.cache.hits == hits + len(content)
+        assert result.vectors == assignment.vectors
+        assert result.document_vector == assignment.document_vector
+
+    def test_search_reports_progress(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN a corpus holding a copy of an entry, and an unrelated assignment
+        WHEN the verifier searches it
+        THEN the progress settles the whole corpus, and holds the plagiarized assignment.
+        """
+        # given
+        content = [self.SENTENCE.replace(".", f", a very long sentence number {number}.") for number in range(5)]
+        copy, unrelated = Assignment(content=content), Assignment(content=["Nothing to see here, move along please."])
+        progress = VerificationProgress()
+
+        # when
+        results = assignment_verifier.searcher.search(Assignment(content=content), [copy, unrelated], progress)
+
+        # then
+        compared, total, found = progress.snapshot()
+        assert (compared, total) == (2, 2)
+        assert [result.id for result in found] == [result.id for result in results] == [copy.id]
+
+    @pytest.mark.asyncio
+    async def test_verify_batch_compares_peers(self, assignment_verifier: AssignmentVerifier, assignment_repository):
+        """
+        GIVEN two files submitted together, one copying the other, and an empty one
+        WHEN the verifier verifies them as a batch
+        THEN each copy reports the other, and both are saved.
+        """
+        # given
+        content = [self.SENTENCE.replace(".", f", a very long sentence number {number}.") for number in range(5)]
+        contents = {"a.pdf": content, "b.pdf": content[:4], "empty.pdf": []}
+        assignment_verifier.reader = Mock(read=lambda file: Assignment(content=contents[file.filename]))
+        commands = [VerifyAssignment(id=uuid4(), file=UploadFile(file=BytesIO(), filename=name)) for name in contents]
+
+        # when
+        first, second, empty = await assignment_verifier.verify_batch(commands)
+
+        # then
+        assert [similarity.id for similarity in first.similarities] == [second.id]
+        assert [similarity.id for similarity in second.similarities] == [first.id]
+        assert second.similarities[0].plagiarism == 1.0
+        assert empty.similarities is None
+        assert (await assignment_repository.find_revisions()).keys() == {first.id, second.id}
+
+    @pytest.mark.asyncio
+    async def test_verify_batch_unreadable_file(self, assignment_verifier: AssignmentVerifier, assignment_repository):
+        """
+        GIVEN two files submitted together, one copying the other, and a corrupt one
+        WHEN the verifier verifies them as a batch
+        THEN the error reading the corrupt file is returned in its place, and the rest are verified and saved.
+        """
+        # given
+        content = [self.SENTENCE.replace(".", f", a very long sentence number {number}.") for number in range(5)]
+        contents = {"a.pdf": content, "b.pdf": content[:4]}
+
+        def read(file):
+            if file.filename not in contents:
+                raise ValueError("corrupt")
+
+            return Assignment(content=contents[file.filename])
+
+        assignment_verifier.reader = Mock(read=read)
+        files = [UploadFile(file=BytesIO(), filename=name) for name in ("a.pdf", "corrupt.pdf", "b.pdf")]
+        commands = [VerifyAssignment(id=uuid4(), file=file) for file in files]
+
+        # when
+        first, corrupt, second = await assignment_verifier.verify_batch(commands)
+
+        # then
+        assert isinstance(corrupt, ValueError)
+        assert [similarity.id for similarity in first.similarities] == [second.id]
+        assert (await assignment_repository.find_revisions()).keys() == {first.id, second.id}
+
+    @pytest.mark.asyncio
+    async def test_verify_reads_one_file_at_a_time(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN a batch, and a single file, verified at the same time
+        WHEN the verifier reads their files
+        THEN the shared reader never reads two files at once.
+        """
+        # given
+        reading = 0
+        most_reading = 0
+
+        def read(file):
+            nonlocal reading, most_reading
+
+            reading += 1
+            most_reading = max(most_reading, reading)
+            time.sleep(0.05)
+            reading -= 1
+
+            return Assignment(content=[])
+
+        assignment_verifier.reader = Mock(read=read)
+        files = [UploadFile(file=BytesIO(), filename=f"{number}.pdf") for number in range(4)]
+        commands = [VerifyAssignment(id=uuid4(), file=file) for file in files]
+
+        # when
+        await asyncio.gather(assignment_verifier.verify_batch(commands[:3]), assignment_verifier.verify(commands[3]))
+
+        # then
+        assert most_reading == 1
+
+    @pytest.mark.asyncio
+    async def test_verify_keeps_event_loop_responsive(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN a file that takes a while to read
+        WHEN the verifier verifies it
+        THEN other coroutines keep running meanwhile.
+        """
+
+        # given
+        def read(file):
+            time.sleep(0.3)
+            return Assignment(content=[self.SENTENCE])
+
+        assignment_verifier.reader = Mock(read=read)
+        command = VerifyAssignment(id=uuid4(), file=UploadFile(file=BytesIO(), filename="slow.pdf"))
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+
+        # when
+        verified = await assignment_verifier.verify(command)
+        ticker.cancel()
+
+        # then
+        assert verified.id == command.id
+        assert ticks > 10
+
+    @pytest.mark.asyncio
+    async def test_verify_same_file_again(self, assignment_verifier: AssignmentVerifier, tmp_path):
+        """
+        GIVEN a file already verified
+        WHEN the verifier verifies the very same file again
+        THEN the file is not read again, and the first one is reported as a full copy.
+        """
+        # given
+        content = [self.SENTENCE.replace(".", f", a very long sentence number {number}.") for number in range(5)]
+        assignment_verifier.reader = Mock(read=Mock(return_value=Assignment(content=content)))
+        assignment_verifier.extraction_cache = ExtractionCache(str(tmp_path), "version")
+        first = await assignment_verifier.verify(
+            VerifyAssignment(id=uuid4(), file=UploadFile(file=BytesIO(), filename="a.pdf"), sha256="hash")
+        )
+
+        # when
+        second = await assignment_verifier.verify(
+            VerifyAssignment(id=uuid4(), file=UploadFile(file=BytesIO(), filename="b.pdf"), sha256="hash")
+        )
+
+        # then
+        assert assignment_verifier.reader.read.call_count == 1
+        assert second.title == "b.pdf"
+        assert [(similarity.id, similarity.plagiarism) for similarity in second.similarities] == [(first.id, 1.0)]
+        assert len(second.similarities[0].similarities) == len(content)
+
+    def test_search_other_topics_fallback(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN copies of an entry, one of its own topic and one of another topic
+        WHEN the verifier searches them, with each topic fallback
+        THEN the other topic is searched always, never, or only when the own topic holds no plagiarism.
+        """
+        # given
+        content = [self.SENTENCE.replace(".", f", a very long sentence number {number}.") for number in range(5)]
+        entry = Assignment(content=content, topic=Topic.INNOVATION)
+        own = Assignment(content=content, topic=Topic.INNOVATION)
+        other = Assignment(content=content, topic=Topic.DIGITAL_ECONOMY)
+        results = {}
+
+        # when
+        for fallback in TopicFallback:
+            assignment_verifier.searcher.topic_fallback = fallback
+            results[fallback] = {result.id for result in assignment_verifier.searcher.search(entry, [own, other])}
+
+        assignment_verifier.searcher.topic_fallback = TopicFallback.EMPTY
+        results["alone"] = {result.id for result in assignment_verifier.searcher.search(entry, [other])}
+
+        # then
+        assert results[TopicFallback.ALWAYS] == {own.id, other.id}
+        assert results[TopicFallback.EMPTY] == {own.id}
+        assert results[TopicFallback.NEVER] == {own.id}
+        assert results["alone"] == {other.id}
+
+    def test_search_with_vector_store(self, assignment_verifier: AssignmentVerifier, tmp_path):
+        """
+        GIVEN a corpus holding a partial copy of an entry, and a verifier keeping its vectors in a vector store
+        WHEN the verifier searches it
+        THEN it finds the same plagiarized sentences as with the vectors in memory, without keeping them in memory.
+        """
+        # given
+        content = [self.SENTENCE.replace(".", f", a very long sentence number {number}.") for number in range(5)]
+        entry = assignment_verifier.vectors.vectorize(Assignment(content=content))
+        in_memory = assignment_verifier.searcher.search(entry, [Assignment(content=content[:3])])
+
+        store = VectorStore(str(tmp_path / "vectors"), width=assignment_verifier.vectors.embedder.width)
+        index = assignment_verifier.searcher.index
+        assignment_verifier.vectors.store = store
+        index.indexes = index.indexes._replace(sentences=SentenceIndex(store=store))
+        copy = Assignment(content=content[:3])
+
+        # when
+        results = assignment_verifier.searcher.search(entry, [copy])
+
+        # then
+        assert copy.vectors is None
+        assert str(copy.id) in store
+        assert [result.plagiarism for result in results] == pytest.approx(
+            [result.plagiarism for result in in_memory], abs=0.01
+        )
+
+    def test_search_finds_identical_sentences(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN an assignment different from an entry as a whole, but holding one of its sentences as it is
+        WHEN the verifier searches it
+        THEN the identical sentence is plagiarized.
+        """
+        # given
+        copied = "Esta oración fue copiada tal cual de otro trabajo práctico."
+        entry = assignment_verifier.vectors.vectorize(
+            Assignment(content=[copied] + [f"Una respuesta original de la entrega número {n}." for n in range(9)])
+        )
+        assignment = Assignment(content=["Nada que ver con la entrega, otro tema completamente distinto.", copied])
+        # too few shared fingerprints to look for verbatim passages
+        assignment_verifier.searcher.verbatim_threshold = 1.0
+
+        # when
+        results = assignment_verifier.searcher.search(entry, [assignment])
+
+        # then
+        assert [result.id for result in results] == [assignment.id]
+        assert [(result.present, result.plagiarism) for result in results[0].similarities] == [(copied, 1.0)]
+
+    def test_search_indexes_saved_again(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN an indexed assignment holding a sentence of an entry as it is
+        WHEN the assignment is saved again under a new revision, without the sentence, and the entry is searched
+        THEN the assignment is indexed again, and no longer plagiarized.
+        """
+        # given
+        copied = "Esta oración fue copiada tal cual de otro trabajo práctico."
+        entry = assignment_verifier.vectors.vectorize(
+            Assignment(content=[copied] + [f"Una respuesta original de la entrega número {n}." for n in range(9)])
+        )
+        assignment = Assignment(content=["Nada que ver con la entrega, otro tema completamente distinto.", copied])
+        assignment_verifier.searcher.verbatim_threshold = 1.0
+        assert assignment_verifier.searcher.search(entry, [assignment])
+
+        # when
+        saved = assignment.model_copy(update={"content": assignment.content[:1], "revision": uuid4()})
+        results = assignment_verifier.searcher.search(entry, [saved])
+
+        # then
+        assert not results
+
+    def test_search_finds_passages_across_sentences(self, assignment_verifier: AssignmentVerifier):
+        """
+        GIVEN an assignment sharing a passage with an entry, split in other sentences
+        WHEN the verifier searches it, keeping a passage index
+        THEN the assignment is plagiarized by the shared passage.
+        """
+        # given
+        index = assignment_verifier.searcher.index
+        index.indexes = index.indexes._replace(passages=PassageIndex(min_words=8))
+        assignment_verifier.searcher.verbatim_threshold = 1.0
+        entry = assignment_verifier.vectors.vectorize(
+            Assignment(
+                content=[
+                    "La revolución industrial cambió la economía. Internet cambió las cosas otra vez",
+                    "Una respuesta original de la entrega.",
+                ]
+            )
+        )
+        assignment = Assignment(
+            content=[
+                "Según Rifkin, la revolución industrial cambió la economía.",
+                "Internet cambió las cosas otra vez.",
+            ]
+        )
+
+        # when
+        results = assignment_verifier.searcher.search(entry, [assignment])
+
+        # then
+        assert [result.id for result in results] == [assignment.id]
+        assert [(passage.compared, passage.position, passage.words) for passage in results[0].passages] == [
+            ("La revolución industrial cambió la economía. Internet cambió las cosas otra vez", 0, 12)
+        ]
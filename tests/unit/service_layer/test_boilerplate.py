@@ -0,0 +1,68 @@
+"""
+Unit test for the BoilerplateTable class.
+"""
+from heimdallr.service_layer.boilerplate import BoilerplateTable, sentence_hash
+
+
+class TestBoilerplateTable:
+    COVER = ["CÁTEDRA: ALEJANDRO PRINCE", "TRABAJO PRÁCTICO N° 6"]
+
+    def test_sentence_hash_ignores_layout(self):
+        """
+        GIVEN a sentence written with another case, spacing and punctuation
+        WHEN both are hashed
+        THEN their hashes are equal.
+        """
+        assert sentence_hash("CÁTEDRA: ALEJANDRO PRINCE") == sentence_hash("Cátedra   alejandro prince.")
+        assert sentence_hash("CÁTEDRA: ALEJANDRO PRINCE") != sentence_hash("Cátedra: Alejandro")
+
+    def test_positions(self):
+        """
+        GIVEN a table with a cover page repeated across documents
+        WHEN the boilerplate sentences of a new document are looked up
+        THEN only the cover page lines that reach the cutoff are found.
+        """
+        # given
+        table = BoilerplateTable(cutoff=3)
+        for key in range(3):
+            table.add(key, self.COVER + [f"Una respuesta original número {key}."])
+
+        # when
+        result = table.positions(["Una respuesta original número 1.", "Cátedra: Alejandro Prince", "Otra."])
+
+        # then
+        assert result == {1}
+        assert table.frequency("TRABAJO PRÁCTICO N° 6") == 3
+
+    def test_add_counts_documents_once(self):
+        """
+        GIVEN a document that repeats a sentence
+        WHEN it is added twice under the same key
+        THEN the sentence frequency is one.
+        """
+        # given
+        table = BoilerplateTable()
+
+        # when
+        table.add("doc", self.COVER * 2)
+        table.add("doc", self.COVER)
+
+        # then
+        assert table.frequency(self.COVER[0]) == 1
+
+    def test_remove(self):
+        """
+        GIVEN a table with a document
+        WHEN it is removed
+        THEN its sentences are no longer counted.
+        """
+        # given
+        table = BoilerplateTable()
+        table.add("doc", self.COVER)
+
+        # when
+        table.remove("doc")
+
+        # then
+        assert "doc" not in table
+        assert table.frequency(self.COVER[0]) == 0
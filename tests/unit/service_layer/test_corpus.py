@@ -0,0 +1,119 @@
+"""
+Unit test for the CorpusSnapshot class.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from heimdallr.domain.models.assignment import Assignment, AssignmentVerification
+from heimdallr.service_layer.corpus import CorpusSnapshot
+from tests.mocks import AsyncInMemAssignmentRepository
+
+
+class TestCorpusSnapshot:
+    @pytest.mark.asyncio
+    async def test_refresh_loads_changes_only(self):
+        """
+        GIVEN a snapshot of a repository
+        WHEN the repository changes, and the snapshot is refreshed
+        THEN only the new assignments are loaded, and the deleted are dropped.
+        """
+        # given
+        repository = AsyncInMemAssignmentRepository()
+        first, second = Assignment(content=["First."]), Assignment(content=["Second."])
+        await repository.save(first)
+        snapshot = CorpusSnapshot(repository)
+        await snapshot.refresh()
+
+        # when
+        await repository.save(second)
+        await repository.delete(first)
+        result = await snapshot.refresh()
+
+        # then
+        assert [assignment.id for assignment in result] == [second.id]
+        assert snapshot.version == await repository.version()
+
+    @pytest.mark.asyncio
+    async def test_refresh_reloads_saved_again(self):
+        """
+        GIVEN a snapshot of a repository
+        WHEN another process saves a stored assignment again, and the snapshot is refreshed
+        THEN the assignment is loaded again.
+        """
+        # given
+        repository = AsyncInMemAssignmentRepository()
+        assignment = Assignment(content=["First."])
+        await repository.save(assignment)
+        snapshot = CorpusSnapshot(repository)
+        await snapshot.refresh()
+
+        # when
+        await repository.save(assignment.model_copy(update={"content": ["Second."]}))
+        [result] = await snapshot.refresh()
+
+        # then
+        assert result.id == assignment.id
+        assert result.content == ["Second."]
+
+    @pytest.mark.asyncio
+    async def test_refresh_after_own_saves(self):
+        """
+        GIVEN a refreshed snapshot
+        WHEN only its process saves assignments, and adds them to the snapshot
+        THEN the refresh catches up with the repository version, without diffing the stored assignments.
+        """
+        # given
+        repository = AsyncInMemAssignmentRepository()
+        snapshot = CorpusSnapshot(repository)
+        await snapshot.refresh()
+        repository.find_revisions = AsyncMock(side_effect=AssertionError)
+
+        # when
+        for assignment in [Assignment(content=["First."]), Assignment(content=["Second."])]:
+            snapshot.add(await repository.save(assignment))
+
+        result = await snapshot.refresh()
+
+        # then
+        assert len(result) == 2
+        assert snapshot.version == await repository.version()
+
+    @pytest.mark.asyncio
+    async def test_refresh_unchanged(self):
+        """
+        GIVEN a refreshed snapshot
+        WHEN it is refreshed again without changes in the repository
+        THEN the same assignments are kept, without loading them again.
+        """
+        # given
+        repository = AsyncInMemAssignmentRepository()
+        await repository.save(Assignment(content=["First."]))
+        snapshot = CorpusSnapshot(repository)
+        [loaded] = await snapshot.refresh()
+
+        # when
+        [result] = await snapshot.refresh()
+
+        # then
+        assert result is loaded
+
+    @pytest.mark.asyncio
+    async def test_add_drops_similarities(self):
+        """
+        GIVEN a verified assignment
+        WHEN it is added to the snapshot
+        THEN its similarity reports are not kept.
+        """
+        # given
+        snapshot = CorpusSnapshot(AsyncInMemAssignmentRepository())
+        verification = AssignmentVerification(id=Assignment(content=[]).id, plagiarism=1.0)
+        assignment = Assignment(content=["A sentence."], similarities=[verification])
+
+        # when
+        snapshot.add(assignment)
+
+        # then
+        [result] = snapshot.assignments()
+        assert result.id in snapshot
+        assert result.similarities is None
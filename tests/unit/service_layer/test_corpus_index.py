@@ -0,0 +1,30 @@
+"""
+Unit test for the CorpusIndex class.
+"""
+from spacy import Language
+
+from heimdallr.domain.models.assignment import Assignment
+from heimdallr.service_layer.assignment_vectors import AssignmentVectors
+from heimdallr.service_layer.corpus_index import CorpusIndex
+from heimdallr.service_layer.lexical_gate import LexicalGate
+from heimdallr.service_layer.sentence_comparer import SentenceComparer
+
+
+class TestCorpusIndex:
+    def test_sync_forgets_deleted_assignments(self, nlp: Language):
+        """
+        GIVEN an index holding two stored assignments
+        WHEN one of them is deleted from the corpus
+        THEN neither its sentences nor its revision are kept.
+        """
+        # given
+        index = CorpusIndex(AssignmentVectors(nlp, SentenceComparer(LexicalGate())))
+        kept, deleted = Assignment(content=["Una oración que queda."]), Assignment(content=["Una oración borrada."])
+        index.sync({kept.id: kept, deleted.id: deleted})
+
+        # when
+        index.sync({kept.id: kept})
+
+        # then
+        assert index.indexes.sentences.keys() == {kept.id}
+        assert index._revisions.keys() == {kept.id}
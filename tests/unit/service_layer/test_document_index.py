@@ -0,0 +1,82 @@
+"""
+Unit test for the DocumentIndex class.
+"""
+import numpy as np
+
+from heimdallr.service_layer.document_index import DocumentIndex
+
+
+class TestDocumentIndex:
+    VECTORS = np.random.default_rng(42).standard_normal((5, 16), dtype=np.float32)
+
+    def test_search(self):
+        """
+        GIVEN an index with some documents
+        WHEN it is searched with one of their vectors
+        THEN only that document reaches the threshold.
+        """
+        # given
+        index = DocumentIndex()
+        for key, vector in enumerate(self.VECTORS):
+            index.add(key, vector)
+
+        # when
+        result = index.search(self.VECTORS[2], threshold=0.99)
+
+        # then
+        assert list(result) == [2]
+        assert np.isclose(result[2], 1.0)
+
+    def test_add_grows_capacity(self):
+        """
+        GIVEN an index with a small capacity
+        WHEN more documents than its capacity are added
+        THEN all of them are found.
+        """
+        # given
+        index = DocumentIndex(capacity=2)
+
+        # when
+        for key, vector in enumerate(self.VECTORS):
+            index.add(key, vector)
+
+        # then
+        assert len(index) == len(self.VECTORS)
+        assert all(key in index.search(vector, threshold=0.99) for key, vector in enumerate(self.VECTORS))
+
+    def test_add_replaces_vector(self):
+        """
+        GIVEN an indexed document
+        WHEN it is added again with another vector
+        THEN it is only found by its new vector.
+        """
+        # given
+        index = DocumentIndex()
+        index.add("doc", self.VECTORS[0])
+
+        # when
+        index.add("doc", self.VECTORS[1])
+
+        # then
+        assert len(index) == 1
+        assert index.search(self.VECTORS[0], threshold=0.99) == {}
+        assert "doc" in index.search(self.VECTORS[1], threshold=0.99)
+
+    def test_remove(self):
+        """
+        GIVEN an index with some documents
+        WHEN one of them is removed
+        THEN it is no longer found, while the others still are.
+        """
+        # given
+        index = DocumentIndex()
+        for key, vector in enumerate(self.VECTORS):
+            index.add(key, vector)
+
+        # when
+        index.remove(1)
+
+        # then
+        assert 1 not in index
+        assert index.search(self.VECTORS[1], threshold=0.99) == {}
+        assert all(key in index.search(self.VECTORS[key], threshold=0.99) for key in (0, 2, 3, 4))
@@ -0,0 +1,41 @@
+"""
+Unit test for the SpacyEmbedder class.
+"""
+import numpy as np
+from spacy import Language
+
+from heimdallr.service_layer.embeddings import SpacyEmbedder
+
+
+class TestSpacyEmbedder:
+    SENTENCES = ["This is a sentence.", "This is another very long sentence.", ""]
+
+    def test_embed(self, nlp: Language):
+        """
+        GIVEN some sentences
+        WHEN they are embedded in small batches
+        THEN each row holds the same vector and token count as the whole pipeline would produce.
+        """
+        # given
+        embedder = SpacyEmbedder(nlp, batch_size=2)
+
+        # when
+        matrix, tokens = embedder.embed(self.SENTENCES)
+
+        # then
+        assert matrix.shape == (len(self.SENTENCES), embedder.width)
+        assert np.allclose(matrix, [nlp(sentence).vector for sentence in self.SENTENCES])
+        assert tokens.tolist() == [len(nlp(sentence)) for sentence in self.SENTENCES]
+
+    def test_embed_empty(self, nlp: Language):
+        """
+        GIVEN no sentences
+        WHEN they are embedded
+        THEN an empty matrix is returned.
+        """
+        # when
+        matrix, tokens = SpacyEmbedder(nlp).embed([])
+
+        # then
+        assert matrix.shape == (0, nlp.vocab.vectors_length)
+        assert tokens.size == 0
@@ -0,0 +1,61 @@
+"""
+Unit test for the ExactCopyIndex class.
+"""
+from heimdallr.service_layer.exact_copies import ExactCopyIndex
+
+
+class TestExactCopyIndex:
+    CONTENT = ["Una oración copiada tal cual.", "Otra oración original.", "Una oración copiada tal cual."]
+
+    def test_query_finds_first_identical_sentence(self):
+        """
+        GIVEN an index with two documents
+        WHEN it is queried with sentences of one of them, and a sentence changed by a single character
+        THEN only the identical sentences are found, at their first position.
+        """
+        # given
+        index = ExactCopyIndex()
+        index.add("doc", self.CONTENT)
+        index.add("other", ["Nada que ver."])
+
+        # when
+        copies = index.query(["Otra oración original", "Una oración copiada tal cual."])
+
+        # then
+        assert copies == {"doc": {1: 0}}
+
+    def test_query_filters_keys_and_removed_documents(self):
+        """
+        GIVEN an index with two documents holding the same sentence, one of them removed
+        WHEN it is queried, restricted to some keys
+        THEN only the documents both indexed and allowed are found.
+        """
+        # given
+        index = ExactCopyIndex()
+        for key in ("doc", "other", "gone"):
+            index.add(key, self.CONTENT)
+        index.remove("gone")
+
+        # when
+        copies = index.query(self.CONTENT[:1], keys={"doc", "gone"})
+
+        # then
+        assert copies == {"doc": {0: 0}}
+        assert index.keys() == {"doc", "other"}
+
+    def test_remove_drops_postings(self):
+        """
+        GIVEN an index with a single document
+        WHEN it is removed
+        THEN none of its sentences are found, nor kept.
+        """
+        # given
+        index = ExactCopyIndex()
+        index.add("doc", self.CONTENT)
+
+        # when
+        index.remove("doc")
+
+        # then
+        assert not index.query(self.CONTENT)
+        assert not index._postings
@@ -0,0 +1,53 @@
+"""
+Unit test for the ExtractionCache class.
+"""
+from heimdallr.domain.models.assignment import Assignment, Topic
+from heimdallr.service_layer.extraction_cache import ExtractionCache
+
+
+class TestExtractionCache:
+    ASSIGNMENT = Assignment(
+        title="a.pdf",
+        author="John Doe",
+        topic=Topic.INNOVATION,
+        content=["This is a sentence."],
+        vectors=[[1.0, 0.0]],
+        document_vector=[1.0, 0.0],
+        vectors_model="es_core_news_lg-3.7.0",
+    )
+
+    def test_get(self, tmp_path):
+        """
+        GIVEN a cache holding what was read from a file
+        WHEN it is looked up by the file hash, and by another hash
+        THEN what was read from the file comes back, without the upload details, and nothing for the other hash.
+        """
+        # given
+        cache = ExtractionCache(str(tmp_path), "1.0.0")
+        cache.put("hash", self.ASSIGNMENT)
+
+        # when
+        result = cache.get("hash")
+        missing = cache.get("other")
+
+        # then
+        assert (result.author, result.topic, result.content) == ("John Doe", Topic.INNOVATION, ["This is a sentence."])
+        assert (result.vectors, result.document_vector) == (self.ASSIGNMENT.vectors, self.ASSIGNMENT.document_vector)
+        assert result.id != self.ASSIGNMENT.id
+        assert result.title == "Unknown"
+        assert missing is None
+
+    def test_get_other_version(self, tmp_path):
+        """
+        GIVEN a cache holding what a pipeline version read from a file
+        WHEN another version looks the file up
+        THEN nothing comes back.
+        """
+        # given
+        ExtractionCache(str(tmp_path), "1.0.0").put("hash", self.ASSIGNMENT)
+
+        # when
+        result = ExtractionCache(str(tmp_path), "2.0.0").get("hash")
+
+        # then
+        assert result is None
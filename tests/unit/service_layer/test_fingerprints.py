@@ -0,0 +1,84 @@
+"""
+Unit test for the winnowing fingerprints.
+"""
+from heimdallr.service_layer.fingerprints import (
+    FingerprintIndex,
+    SharedFingerprint,
+    fingerprints,
+)
+
+
+class TestFingerprints:
+    CONTENT = [
+        "Podría caracterizar la Primera y Segunda revolución industrial al decir de Rifkin?",
+        "Qué inventos son las metáforas de cada infraestructura en cada una de esas etapas.",
+        "Qué dice Rifkin que la internet de las cosas le aportará a la tercera revolución industrial?",
+    ]
+
+    OTHER_CONTENT = [
+        "La economía de la experiencia convierte los servicios en memorias para el cliente.",
+        "Las empresas escenifican experiencias que involucran a sus clientes de forma personal.",
+    ]
+
+    def test_fingerprints_ignore_layout(self):
+        """
+        GIVEN a text and the same text with another case, spacing and punctuation
+        WHEN their fingerprints are computed
+        THEN both have the same fingerprint values.
+        """
+        # given
+        text = ["Una oración bastante larga, escrita con cuidado.", "Otra oración más, también larga."]
+        layout = ["UNA ORACIÓN   bastante larga escrita con cuidado", "Otra oración más... también larga!"]
+
+        # when
+        result = fingerprints(text)
+
+        # then
+        assert result
+        assert [fingerprint.value for fingerprint in result] == [
+            fingerprint.value for fingerprint in fingerprints(layout)
+        ]
+
+    def test_fingerprints_short_content(self):
+        """
+        GIVEN a text shorter than a k-gram
+        WHEN its fingerprints are computed
+        THEN there are none.
+        """
+        assert not fingerprints(["Hola mundo."])
+
+    def test_query_finds_verbatim_passage(self):
+        """
+        GIVEN an index with a document and an unrelated one
+        WHEN it is queried with a text that copies one sentence of the document
+        THEN only the document is found, through the copied sentence.
+        """
+        # given
+        index = FingerprintIndex()
+        index.add("original", fingerprints(self.CONTENT))
+        index.add("other", fingerprints(self.OTHER_CONTENT))
+
+        # when
+        result = index.query(fingerprints(["Una introducción propia sin relación alguna.", self.CONTENT[1]]))
+
+        # then
+        assert list(result) == ["original"]
+        assert all(isinstance(shared, SharedFingerprint) for shared in result["original"])
+        assert {(shared.entry_position, shared.position) for shared in result["original"]} >= {(1, 1)}
+
+    def test_remove(self):
+        """
+        GIVEN an index with a document
+        WHEN it is removed
+        THEN it is no longer found.
+        """
+        # given
+        index = FingerprintIndex()
+        index.add("original", fingerprints(self.CONTENT))
+
+        # when
+        index.remove("original")
+
+        # then
+        assert "original" not in index
+        assert not index.query(fingerprints(self.CONTENT))
@@ -0,0 +1,228 @@
+"""
+Unit test for the JobWorker class.
+"""
+import asyncio
+import datetime
+import uuid
+from io import BytesIO
+from unittest.mock import AsyncMock
+
+import pytest
+
+from heimdallr.domain.events.assignments import AssignmentCompared, AssignmentVerified
+from heimdallr.domain.models.job import Job, JobStatus
+from heimdallr.service_layer.job_worker import JobWorker
+from heimdallr.utils.uploads import descriptor_path
+from tests.mocks import AsyncInMemJobRepository
+
+
+class TestJobWorker:
+    @pytest.mark.asyncio
+    async def test_run_once_completes_job(self):
+        """
+        GIVEN a queued job
+        WHEN a worker runs it successfully
+        THEN the file is verified under the job ID, from a file on disk closed afterwards, and the job is done, its file
+            dropped.
+        """
+        # given
+        jobs = AsyncInMemJobRepository()
+        job = await jobs.enqueue(Job(filename="a.pdf", content_type="application/pdf"), BytesIO(b"%PDF"))
+        read = []
+        verifier = AsyncMock()
+        verifier.verify.side_effect = lambda command, progress: read.append(
+            (descriptor_path(command.file.file) is not None, command.file.file.read())
+        )
+        worker = JobWorker(jobs=jobs, verifier=verifier, name="worker")
+
+        # when
+        result = await worker.run_once()
+
+        # then
+        assert result
+        command = verifier.verify.await_args.kwargs["command"]
+        assert command.id == job.id
+        assert command.file.content_type == "application/pdf"
+        assert read == [(True, b"%PDF")]
+        assert command.file.file.closed
+        stored = await jobs.find_by(id=job.id)
+        assert stored.status == JobStatus.DONE
+        assert stored.upload_id is None
+        assert stored.finished_at is not None
+        assert not jobs.uploads
+
+    @pytest.mark.asyncio
+    async def test_run_once_retries_then_fails(self):
+        """
+        GIVEN a queued job whose verification fails
+        WHEN a worker runs it up to the maximum attempts
+        THEN it is queued again after each failure, and failed for good after the last one, its file dropped.
+        """
+        # given
+        jobs = AsyncInMemJobRepository()
+        job = await jobs.enqueue(Job(), BytesIO(b"broken"))
+        verifier = AsyncMock()
+        verifier.verify.side_effect = ValueError("unreadable")
+        worker = JobWorker(jobs=jobs, verifier=verifier, name="worker", max_attempts=2)
+
+        # when
+        await worker.run_once()
+        retried, kept = (await jobs.find_by(id=job.id)).status, len(jobs.uploads)
+        await worker.run_once()
+
+        # then
+        stored = await jobs.find_by(id=job.id)
+        assert (retried, kept) == (JobStatus.QUEUED, 1)
+        assert not jobs.uploads
+        assert stored.status == JobStatus.FAILED
+        assert stored.attempts == 2
+        assert "unreadable" in stored.error
+        assert not await worker.run_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_claimed_again(self):
+        """
+        GIVEN a job claimed by a worker that died
+        WHEN its lease expires
+        THEN another worker claims it.
+        """
+        # given
+        jobs = AsyncInMemJobRepository()
+        job = await jobs.enqueue(Job(), BytesIO(b"data"))
+        await jobs.claim(worker="dead", lease=datetime.timedelta(seconds=-1), max_attempts=3)
+        worker = JobWorker(jobs=jobs, verifier=AsyncMock(), name="alive")
+
+        # when
+        result = await worker.run_once()
+
+        # then
+        stored = await jobs.find_by(id=job.id)
+        assert result
+        assert stored.status == JobStatus.DONE
+        assert stored.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_run_once_stops_verifying_lost_job(self):
+        """
+        GIVEN a running job another worker claims while it is verified
+        WHEN the worker fails to renew its lease
+        THEN the verification is cancelled before it saves anything, and the job is left to the other worker.
+        """
+        # given
+        jobs = AsyncInMemJobRepository()
+        job = await jobs.enqueue(Job(), BytesIO(b"data"))
+        saved = []
+
+        async def verify(command, progress):
+            (await jobs.find_by(id=job.id)).worker = "other"
+            await asyncio.sleep(1)
+            saved.append(command.id)
+
+        verifier = AsyncMock()
+        verifier.verify.side_effect = verify
+        worker = JobWorker(jobs=jobs, verifier=verifier, name="worker")
+        worker.lease = datetime.timedelta(seconds=0.03)
+
+        # when
+        await asyncio.wait_for(worker.run_once(), timeout=0.5)
+
+        # then
+        stored = await jobs.find_by(id=job.id)
+        assert not saved
+        assert verifier.verify.await_args.kwargs["command"].file.file.closed
+        assert (stored.status, stored.worker) == (JobStatus.RUNNING, "other")
+
+    @pytest.mark.asyncio
+    async def test_run_stops(self):
+        """
+        GIVEN a worker polling an empty queue
+        WHEN it is asked to stop
+        THEN it returns.
+        """
+        # given
+        worker = JobWorker(jobs=AsyncInMemJobRepository(), verifier=AsyncMock(), poll_interval=0.01)
+        stop = asyncio.Event()
+
+        # when
+        running = asyncio.create_task(worker.run(stop))
+        await asyncio.sleep(0.05)
+        stop.set()
+
+        # then
+        await asyncio.wait_for(running, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_run_once_reports_progress(self):
+        """
+        GIVEN a queued job whose verification records progress
+        WHEN a worker runs it
+        THEN the progress of the verification is reported on the job.
+        """
+        # given
+        jobs = AsyncInMemJobRepository()
+        job = await jobs.enqueue(Job(), BytesIO(b"data"))
+
+        async def verify(command, progress):
+            progress.start(4)
+            progress.advance(4, [AssignmentCompared(id=uuid.uuid4(), plagiarism=0.5)])
+
+        worker = JobWorker(jobs=jobs, verifier=AsyncMock(verify=verify), name="worker")
+
+        # when
+        await worker.run_once()
+
+        # then
+        stored = await jobs.find_status(job.id)
+        assert (stored.compared, stored.total) == (4, 4)
+        assert [similarity.plagiarism for similarity in stored.similarities] == [0.5]
+
+    @pytest.mark.asyncio
+    async def test_run_once_verifies_batch_together(self):
+        """
+        GIVEN the queued jobs of a batch
+        WHEN a worker claims one of them
+        THEN it verifies the whole batch at once, and every job is done.
+        """
+        # given
+        jobs = AsyncInMemJobRepository()
+        batch_id = uuid.uuid4()
+        batch = [
+            await jobs.enqueue(Job(filename=name, batch_id=batch_id), BytesIO(b"data")) for name in ("a.pdf", "b.pdf")
+        ]
+        verifier = AsyncMock()
+        worker = JobWorker(jobs=jobs, verifier=verifier, name="worker")
+
+        # when
+        await worker.run_once()
+
+        # then
+        commands = verifier.verify_batch.await_args.kwargs["commands"]
+        assert [command.id for command in commands] == [job.id for job in batch]
+        verifier.verify.assert_not_awaited()
+        assert [(await jobs.find_status(job.id)).status for job in batch] == [JobStatus.DONE, JobStatus.DONE]
+
+    @pytest.mark.asyncio
+    async def test_run_once_fails_unreadable_job_of_batch(self):
+        """
+        GIVEN the queued jobs of a batch, one of whose files cannot be read
+        WHEN a worker runs the batch
+        THEN only that job is queued again, and the rest are done.
+        """
+        # given
+        jobs = AsyncInMemJobRepository()
+        batch_id = uuid.uuid4()
+        readable, unreadable = [
+            await jobs.enqueue(Job(filename=name, batch_id=batch_id), BytesIO(b"data")) for name in ("a.pdf", "b.pdf")
+        ]
+        verifier = AsyncMock()
+        verifier.verify_batch.return_value = [AssignmentVerified(id=readable.id), ValueError("unreadable")]
+        worker = JobWorker(jobs=jobs, verifier=verifier, name="worker")
+
+        # when
+        await worker.run_once()
+
+        # then
+        assert (await jobs.find_status(readable.id)).status == JobStatus.DONE
+        stored = await jobs.find_by(id=unreadable.id)
+        assert stored.status == JobStatus.QUEUED
+        assert "unreadable" in stored.error
@@ -0,0 +1,77 @@
+"""
+Unit test for the LexicalGate class.
+"""
+from heimdallr.service_layer.lexical_gate import LexicalGate
+
+
+class TestLexicalGate:
+    SENTENCES = [
+        "La revolución industrial cambió la economía de los países.",
+        "Internet es una red de redes.",
+    ]
+
+    def test_mask(self):
+        """
+        GIVEN stored sentences, and entry sentences sharing their words or not
+        WHEN the gate masks the pairs
+        THEN only the pairs of similar lengths that share enough words pass.
+        """
+        # given
+        gate = LexicalGate(min_length_ratio=0.5, min_overlap=0.5)
+        entry_sentences = [
+            "La Revolución Industrial cambió la economía de muchos países.",
+            "Nada que ver con ninguna de las dos oraciones.",
+            "Internet.",
+        ]
+
+        # when
+        passed = gate.mask(self.SENTENCES, entry_sentences)
+
+        # then
+        assert passed.tolist() == [[True, False], [False, False], [False, False]]
+
+    def test_counters(self):
+        """
+        GIVEN a gate
+        WHEN it masks pairs ruled out by each check
+        THEN it counts the pairs pruned by each check, and those that passed.
+        """
+        # given
+        gate = LexicalGate(min_length_ratio=0.5, min_overlap=0.5)
+
+        # when
+        gate.mask(self.SENTENCES, [self.SENTENCES[0], "Internet."])
+
+        # then
+        assert (gate.pruned_by_length, gate.pruned_by_overlap, gate.passed) == (2, 1, 1)
+
+    def test_disabled(self):
+        """
+        GIVEN a gate with both checks disabled
+        WHEN it masks unrelated sentences
+        THEN every pair passes.
+        """
+        # given
+        gate = LexicalGate(min_length_ratio=0, min_overlap=0)
+
+        # when
+        passed = gate.mask(self.SENTENCES, ["Nada que ver.", ""])
+
+        # then
+        assert passed.all()
+
+    def test_disabled_by_default(self):
+        """
+        GIVEN a gate whose minimums were not set
+        WHEN it masks sentences of very different lengths, sharing no words
+        THEN every pair passes, and none is counted as pruned.
+        """
+        # given
+        gate = LexicalGate()
+
+        # when
+        passed = gate.mask(self.SENTENCES, ["Internet."])
+
+        # then
+        assert passed.all()
+        assert (gate.pruned_by_length, gate.pruned_by_overlap, gate.passed) == (0, 0, 2)
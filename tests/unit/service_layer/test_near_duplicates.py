@@ -0,0 +1,93 @@
+"""
+Unit test for the near duplicates detection.
+"""
+from heimdallr.service_layer.near_duplicates import (
+    PERMUTATIONS,
+    NearDuplicateIndex,
+    minhash,
+    shingles,
+)
+
+
+class TestNearDuplicates:
+    CONTENT = [
+        "Podría caracterizar la Primera y Segunda revolución industrial al decir de Rifkin?",
+        "Qué inventos son las metáforas de cada infraestructura en cada una de esas etapas.",
+        "Qué dice Rifkin que la internet de las cosas le aportará a la tercera revolución industrial?",
+        "Qué ejemplos actuales de procomunes se le ocurren?",
+        "Qué límites le ve usted a los procomunes como forma de producción?",
+    ]
+
+    OTHER_CONTENT = [
+        "La economía de la experiencia convierte los servicios en memorias para el cliente.",
+        "Las empresas escenifican experiencias que involucran a sus clientes de forma personal.",
+        "El valor económico progresa desde los commodities hasta las transformaciones.",
+    ]
+
+    def test_shingles(self):
+        """
+        GIVEN a text
+        WHEN it is split into shingles
+        THEN each shingle holds the given amount of words, in lowercase.
+        """
+        # when
+        result = shingles(["Uno dos tres", "cuatro"], size=3)
+
+        # then
+        assert result == {"uno dos tres", "dos tres cuatro"}
+
+    def test_minhash_same_content(self):
+        """
+        GIVEN the same content twice
+        WHEN their signatures are computed
+        THEN both signatures are equal.
+        """
+        # when
+        signature = minhash(self.CONTENT)
+
+        # then
+        assert len(signature) == PERMUTATIONS
+        assert signature == minhash(list(self.CONTENT))
+
+    def test_minhash_empty_content(self):
+        """
+        GIVEN an empty content
+        WHEN its signature is computed
+        THEN it is empty.
+        """
+        assert not minhash([])
+
+    def test_query_finds_near_duplicate(self):
+        """
+        GIVEN an index with a document and an unrelated one
+        WHEN it is queried with a near copy of the document
+        THEN only the document is found.
+        """
+        # given
+        index = NearDuplicateIndex()
+        index.add("original", minhash(self.CONTENT))
+        index.add("other", minhash(self.OTHER_CONTENT))
+
+        # when
+        result = index.query(minhash(self.CONTENT + ["Qué estaría faltando?"]), threshold=0.8)
+
+        # then
+        assert list(result) == ["original"]
+        assert 0.8 <= result["original"] <= 1.0
+
+    def test_remove(self):
+        """
+        GIVEN an index with a document
+        WHEN it is removed
+        THEN it is no longer found.
+        """
+        # given
+        index = NearDuplicateIndex()
+        index.add("original", minhash(self.CONTENT))
+
+        # when
+        index.remove("original")
+
+        # then
+        assert "original" not in index
+        assert not index.query(minhash(self.CONTENT), threshold=0.8)
@@ -0,0 +1,109 @@
+"""
+Unit test for the PassageIndex class.
+"""
+import numpy as np
+
+from heimdallr.service_layer.passages import (
+    PassageIndex,
+    SharedPassage,
+    lcp_array,
+    passage_text,
+    suffix_array,
+    words,
+)
+
+
+class TestSuffixArray:
+    TOKENS = np.random.default_rng(42).integers(0, 4, 200)
+
+    def test_suffix_array(self):
+        """
+        GIVEN a stream of tokens with many repetitions
+        WHEN its suffix array is built
+        THEN the suffixes are sorted as their token lists.
+        """
+        # when
+        order = suffix_array(self.TOKENS)
+
+        # then
+        assert order.tolist() == sorted(range(len(self.TOKENS)), key=lambda start: self.TOKENS[start:].tolist())
+
+    def test_lcp_array(self):
+        """
+        GIVEN a stream of tokens, and its suffix array
+        WHEN its LCP array is built
+        THEN each value is the common prefix length of a suffix and the previous one.
+        """
+        # given
+        order = suffix_array(self.TOKENS)
+
+        # when
+        lcp = lcp_array(self.TOKENS, order)
+
+        # then
+        for rank in range(1, len(order)):
+            first, second = self.TOKENS[order[rank - 1] :].tolist(), self.TOKENS[order[rank] :].tolist()
+            common = next((index for index, pair in enumerate(zip(first, second)) if pair[0] != pair[1]), None)
+            assert lcp[rank] == (min(len(first), len(second)) if common is None else common)
+
+
+class TestPassageIndex:
+    CONTENT = ["Uno dos tres cuatro.", "Cinco seis siete ocho nueve.", "Nada más."]
+
+    def test_query_across_sentences(self):
+        """
+        GIVEN an index with two documents
+        WHEN it is queried with a passage of one of them that crosses a sentence boundary
+        THEN the whole passage is found once, and its text is found in both documents.
+        """
+        # given
+        index = PassageIndex(min_words=4)
+        index.add("doc", self.CONTENT)
+        index.add("other", ["Nada que ver con ninguna otra oración."])
+        entry = ["Cero uno dos tres cuatro, cinco seis.", "Diez."]
+
+        # when
+        passages = index.query(entry)
+
+        # then
+        assert passages == [SharedPassage("doc", entry_start=1, start=0, length=6)]
+        assert passage_text(entry, words(entry), 1, 6) == "uno dos tres cuatro, cinco seis"
+        assert passage_text(self.CONTENT, words(self.CONTENT), 0, 6) == "Uno dos tres cuatro. Cinco seis"
+
+    def test_query_skips_removed_and_replaced_documents(self):
+        """
+        GIVEN an index whose documents were sealed in a segment, and then removed or replaced
+        WHEN it is queried with their former content
+        THEN no passage is found.
+        """
+        # given
+        index = PassageIndex(min_words=4)
+        index.add("doc", self.CONTENT)
+        index.add("replaced", self.CONTENT)
+        index.query(self.CONTENT)
+
+        # when
+        index.remove("doc")
+        index.add("replaced", ["Nada que ver con ninguna otra oración."])
+
+        # then
+        assert index.query(self.CONTENT) == []
+        assert index.keys() == {"replaced"}
+
+    def test_query_filters_keys(self):
+        """
+        GIVEN an index with two documents holding the same passage, added at different times
+        WHEN it is queried, restricted to one of them
+        THEN only the passage of that document is found.
+        """
+        # given
+        index = PassageIndex(min_words=4)
+        index.add("doc", self.CONTENT)
+        index.query(self.CONTENT)
+        index.add("other", self.CONTENT)
+
+        # when
+        passages = index.query(self.CONTENT, keys={"other"})
+
+        # then
+        assert [passage.key for passage in passages] == ["other"]
@@ -0,0 +1,81 @@
+"""
+Unit test for the SentenceComparer class.
+"""
+import numpy as np
+import pytest
+
+from heimdallr.service_layer.lexical_gate import LexicalGate
+from heimdallr.service_layer.sentence_comparer import SentenceComparer, SentencePair
+
+
+class TestSentenceComparer:
+    SENTENCES = ["El perro come carne todos los días.", "La casa es muy grande y blanca.", "Corto."]
+    ENTRY_SENTENCES = ["La casa es muy grande y blanca.", "El perro come carne cada día.", "Corto."]
+
+    @pytest.fixture(name="comparer")
+    def fixture_comparer(self) -> SentenceComparer:
+        """
+        Injects a sentence comparer that compares every pair of sentences.
+        """
+        return SentenceComparer(LexicalGate(min_length_ratio=0.0, min_overlap=0.0), threshold=0.9, min_length=10)
+
+    @staticmethod
+    def pair(skipped: list[int]) -> SentencePair:
+        """
+        Builds a pair whose first entry sentence is a copy, and the second one a paraphrase, of an assignment sentence.
+        """
+        vectors = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]], dtype=np.float32)
+        entry_vectors = np.array([[0.0, 1.0], [1.0, 0.1], [1.0, 1.0]], dtype=np.float32)
+
+        return SentencePair(
+            TestSentenceComparer.SENTENCES,
+            vectors,
+            TestSentenceComparer.ENTRY_SENTENCES,
+            entry_vectors,
+            skipped,
+        )
+
+    def test_compare(self, comparer: SentenceComparer):
+        """
+        GIVEN an entry copying a sentence, paraphrasing another, and holding a sentence too short
+        WHEN it is compared against the assignment
+        THEN the copy and the paraphrase are matched, and the short sentence is not.
+        """
+        # when
+        matches = comparer.compare(self.pair([]))
+
+        # then
+        assert matches.rows == [0, 1]
+        assert matches.columns == [1, 0]
+        assert matches.similarities[0] == pytest.approx(1.0)
+        assert matches.similarities[1] == pytest.approx(0.995, abs=1e-3)
+
+    def test_compare_skips(self, comparer: SentenceComparer):
+        """
+        GIVEN an entry whose copied sentence is skipped, e.g. as boilerplate
+        WHEN it is compared against the assignment
+        THEN only the paraphrase is matched.
+        """
+        # when
+        matches = comparer.compare(self.pair([0]))
+
+        # then
+        assert matches.rows == [1]
+
+    def test_compare_mutual(self, comparer: SentenceComparer):
+        """
+        GIVEN two entries
+        WHEN they are compared both ways
+        THEN each direction matches as comparing them apart.
+        """
+        # given
+        pair = self.pair([1])
+        reversed_pair = SentencePair(pair.entry_sentences, pair.entry_vectors, pair.sentences, pair.vectors, [0])
+
+        # when
+        matches, mutual = comparer.compare_mutual(pair, [0])
+
+        # then
+        assert matches == comparer.compare(pair)
+        assert mutual == comparer.compare(reversed_pair)
+        assert mutual.rows == [1]
@@ -0,0 +1,98 @@
+"""
+Unit test for the SentenceIndex class.
+"""
+import numpy as np
+
+from heimdallr.service_layer.sentence_index import SentenceIndex
+
+
+class TestSentenceIndex:
+    VECTORS = np.random.default_rng(42).standard_normal((20, 32), dtype=np.float32)
+
+    def test_query_finds_same_sentence(self):
+        """
+        GIVEN an index with a document
+        WHEN it is queried with the document sentences
+        THEN each sentence finds itself, fully similar.
+        """
+        # given
+        index = SentenceIndex()
+        index.add("doc", self.VECTORS)
+
+        # when
+        hits = index.query(self.VECTORS, threshold=0.95)
+
+        # then
+        for position, sentence_hits in enumerate(hits):
+            assert sentence_hits[0].key == "doc"
+            assert sentence_hits[0].position == position
+            assert np.isclose(sentence_hits[0].similarity, 1.0)
+
+    def test_query_respects_threshold(self):
+        """
+        GIVEN an index with a document
+        WHEN it is queried with unrelated sentences
+        THEN no hits are returned.
+        """
+        # given
+        index = SentenceIndex()
+        index.add("doc", self.VECTORS[:10])
+
+        # when
+        hits = index.query(self.VECTORS[10:], threshold=0.95)
+
+        # then
+        assert all(not sentence_hits for sentence_hits in hits)
+
+    def test_add_with_positions(self):
+        """
+        GIVEN a document indexed with only some of its sentences
+        WHEN it is queried
+        THEN hits refer to the original sentence positions.
+        """
+        # given
+        index = SentenceIndex()
+        index.add("doc", self.VECTORS[[3, 7]], positions=[3, 7])
+
+        # when
+        hits = index.query(self.VECTORS[[7]], threshold=0.95)
+
+        # then
+        assert [hit.position for hit in hits[0]] == [7]
+
+    def test_remove(self):
+        """
+        GIVEN an index with two documents
+        WHEN one of them is removed
+        THEN it is no longer found.
+        """
+        # given
+        index = SentenceIndex()
+        index.add("doc", self.VECTORS)
+        index.add("other", self.VECTORS)
+
+        # when
+        index.remove("doc")
+
+        # then
+        hits = index.query(self.VECTORS, threshold=0.95)
+        assert "doc" not in index
+        assert len(index) == 1
+        assert all(hit.key == "other" for sentence_hits in hits for hit in sentence_hits)
+
+    def test_query_limits_neighbours(self):
+        """
+        GIVEN an index with the same document stored many times
+        WHEN it is queried with a limited number of neighbours
+        THEN no more hits than neighbours are returned per sentence.
+        """
+        # given
+        index = SentenceIndex()
+        for key in range(5):
+            index.add(key, self.VECTORS)
+
+        # when
+        hits = index.query(self.VECTORS, threshold=0.95, neighbours=2)
+
+        # then
+        assert all(len(sentence_hits) == 2 for sentence_hits in hits)
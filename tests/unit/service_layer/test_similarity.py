@@ -0,0 +1,73 @@
+"""
+Unit test for the vectorized similarity functions.
+"""
+import numpy as np
+
+from heimdallr.service_layer.similarity import (
+    cosine_similarities,
+    first_matches,
+    normalize,
+)
+
+
+class TestSimilarity:
+    def test_normalize(self):
+        """
+        GIVEN a matrix with a zero row
+        WHEN it is normalized
+        THEN every other row has unit length, and the zero row remains zero.
+        """
+        # given
+        vectors = [[3.0, 4.0], [0.0, 0.0]]
+
+        # when
+        result = normalize(vectors)
+
+        # then
+        assert np.allclose(result, [[0.6, 0.8], [0.0, 0.0]])
+
+    def test_cosine_similarities(self):
+        """
+        GIVEN two matrices
+        WHEN their cosine similarities are computed
+        THEN a (n x m) matrix with the similarity of every pair of rows is returned.
+        """
+        # given
+        vectors = [[1.0, 0.0], [0.0, 1.0]]
+        other_vectors = [[2.0, 0.0], [1.0, 1.0], [0.0, 0.0]]
+
+        # when
+        result = cosine_similarities(vectors, other_vectors)
+
+        # then
+        assert result.shape == (2, 3)
+        assert np.allclose(result, [[1.0, np.sqrt(0.5), 0.0], [0.0, np.sqrt(0.5), 0.0]])
+
+    def test_first_matches(self):
+        """
+        GIVEN a similarity matrix
+        WHEN the first matches above a threshold are looked for
+        THEN only rows with a match are returned, along with their first matching column.
+        """
+        # given
+        similarities = np.array([[0.1, 0.96, 0.99], [0.2, 0.3, 0.4], [0.95, 0.1, 0.1]])
+
+        # when
+        rows, columns = first_matches(similarities, threshold=0.95)
+
+        # then
+        assert rows.tolist() == [0, 2]
+        assert columns.tolist() == [1, 0]
+
+    def test_first_matches_empty(self):
+        """
+        GIVEN an empty similarity matrix
+        WHEN the first matches are looked for
+        THEN no match is returned.
+        """
+        # when
+        rows, columns = first_matches(np.zeros((3, 0)), threshold=0.95)
+
+        # then
+        assert rows.size == 0
+        assert columns.size == 0
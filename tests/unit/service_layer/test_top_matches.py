@@ -0,0 +1,64 @@
+"""
+Unit test for the TopMatches class.
+"""
+from uuid import uuid4
+
+from heimdallr.domain.events.assignments import AssignmentCompared, SentenceCompared
+from heimdallr.service_layer.top_matches import TopMatches
+
+
+def comparison(plagiarism: float) -> AssignmentCompared:
+    """
+    Creates a comparison result with a single plagiarized sentence.
+    """
+    sentence = SentenceCompared(present="A sentence.", compared="A sentence.", plagiarism=plagiarism)
+    return AssignmentCompared(id=uuid4(), plagiarism=plagiarism, similarities=[sentence])
+
+
+class TestTopMatches:
+    def test_results_keep_the_most_plagiarized(self):
+        """
+        GIVEN a selection limited to two results
+        WHEN several results are pushed
+        THEN only the two most plagiarized are kept, from the most plagiarized.
+        """
+        # given
+        top = TopMatches(limit=2)
+
+        # when
+        for plagiarism in (0.2, 0.9, 0.1, 0.5):
+            top.push(comparison(plagiarism))
+
+        # then
+        assert [result.plagiarism for result in top.results()] == [0.9, 0.5]
+
+    def test_push_ignores_results_without_similarities(self):
+        """
+        GIVEN an unlimited selection
+        WHEN a result without plagiarized sentences is pushed
+        THEN it is not kept.
+        """
+        # given
+        top = TopMatches()
+
+        # when
+        top.push(AssignmentCompared(id=uuid4(), plagiarism=0.0))
+
+        # then
+        assert not top.results()
+
+    def test_admits(self):
+        """
+        GIVEN a full selection
+        WHEN it is asked whether a result could still be kept
+        THEN only the results that could beat the weakest kept one are admitted.
+        """
+        # given
+        top = TopMatches(limit=1)
+        top.push(comparison(0.5))
+
+        # then
+        assert top.full
+        assert top.admits(0.6)
+        assert not top.admits(0.5)
+        assert TopMatches().admits(0.0)
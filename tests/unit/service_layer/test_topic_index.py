@@ -0,0 +1,65 @@
+"""
+Unit test for the TopicIndex class.
+"""
+from uuid import uuid4
+
+from heimdallr.domain.models.assignment import Topic
+from heimdallr.service_layer.topic_index import TopicIndex
+
+
+class TestTopicIndex:
+    def test_partitions_own_topic_first(self):
+        """
+        GIVEN assignments of two topics, and one without a topic
+        WHEN the partitions of one of those topics are requested
+        THEN its assignments and the one without a topic come first, and the rest after.
+        """
+        # given
+        index = TopicIndex()
+        own, other, undefined = uuid4(), uuid4(), uuid4()
+        index.add(own, Topic.INNOVATION)
+        index.add(other, Topic.DIGITAL_ECONOMY)
+        index.add(undefined, Topic.UNDEFINED)
+
+        # when
+        result = index.partitions(Topic.INNOVATION)
+
+        # then
+        assert result == [{own, undefined}, {other}]
+
+    def test_partitions_without_topic(self):
+        """
+        GIVEN assignments of two topics
+        WHEN the partitions of an entry without a topic are requested
+        THEN every assignment is in a single partition.
+        """
+        # given
+        index = TopicIndex()
+        keys = {uuid4(), uuid4()}
+
+        for key, topic in zip(keys, [Topic.INNOVATION, Topic.DIGITAL_ECONOMY]):
+            index.add(key, topic)
+
+        # when
+        result = index.partitions(Topic.UNDEFINED)
+
+        # then
+        assert result == [keys]
+
+    def test_remove(self):
+        """
+        GIVEN an indexed assignment
+        WHEN it is removed
+        THEN it belongs to no partition.
+        """
+        # given
+        index = TopicIndex()
+        key = uuid4()
+        index.add(key, Topic.INNOVATION)
+
+        # when
+        index.remove(key)
+
+        # then
+        assert key not in index
+        assert index.partitions(Topic.INNOVATION) == [set()]
@@ -0,0 +1,66 @@
+"""
+Unit test for the VectorCache class.
+"""
+import numpy as np
+
+from heimdallr.service_layer.vector_cache import VectorCache
+
+
+class TestVectorCache:
+    VECTOR = np.ones(3, dtype=np.float32)
+
+    def test_get(self):
+        """
+        GIVEN a cache with a sentence
+        WHEN it is looked up, along with a missing one
+        THEN the cached vector is returned, and hits and misses are counted.
+        """
+        # given
+        cache = VectorCache(maxsize=2)
+        cache.put("A sentence.", self.VECTOR, 3)
+
+        # when
+        result = cache.get("A sentence.")
+        missing = cache.get("Another sentence.")
+
+        # then
+        vector, tokens = result
+        assert np.array_equal(vector, self.VECTOR)
+        assert tokens == 3
+        assert missing is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_put_evicts_least_recently_used(self):
+        """
+        GIVEN a full cache
+        WHEN a new sentence is kept after looking up the oldest one
+        THEN the least recently used sentence is evicted.
+        """
+        # given
+        cache = VectorCache(maxsize=2)
+        cache.put("first", self.VECTOR, 1)
+        cache.put("second", self.VECTOR, 1)
+        cache.get("first")
+
+        # when
+        cache.put("third", self.VECTOR, 1)
+
+        # then
+        assert len(cache) == 2
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+
+    def test_disabled(self):
+        """
+        GIVEN a cache with no room
+        WHEN a sentence is kept
+        THEN it is not cached.
+        """
+        # given
+        cache = VectorCache(maxsize=0)
+
+        # when
+        cache.put("A sentence.", self.VECTOR, 3)
+
+        # then
+        assert not len(cache)
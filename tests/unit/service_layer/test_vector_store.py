@@ -0,0 +1,106 @@
+"""
+Unit test for the VectorStore class.
+"""
+import numpy as np
+
+from heimdallr.service_layer.similarity import normalize
+from heimdallr.service_layer.vector_store import VectorStore
+
+
+class TestVectorStore:
+    VECTORS = normalize(np.random.default_rng(42).standard_normal((20, 32), dtype=np.float32))
+
+    def test_put_and_get(self, tmp_path):
+        """
+        GIVEN a store holding the vectors of a document, quantized to int8 and to float16
+        WHEN they are read back
+        THEN they are close to the original vectors.
+        """
+        for quantization in ("int8", "float16"):
+            # given
+            store = VectorStore(str(tmp_path / quantization), width=32, quantization=quantization)
+            store.put("doc", self.VECTORS)
+
+            # when
+            vectors = store.get("doc")
+
+            # then
+            assert "doc" in store
+            assert store.count("doc") == len(self.VECTORS)
+            assert np.allclose(vectors, self.VECTORS, atol=0.01)
+
+    def test_similarities_on_quantized_rows(self, tmp_path):
+        """
+        GIVEN a store holding the vectors of two documents
+        WHEN the similarity of some rows is computed against given vectors
+        THEN it matches the float similarity.
+        """
+        # given
+        store = VectorStore(str(tmp_path / "vectors"), width=32)
+        store.put_all({"doc": self.VECTORS[:10], "other": self.VECTORS[10:]})
+        rows = np.array([0, 3, 9])
+
+        # when
+        similarities = store.similarities("other", rows, self.VECTORS[[1, 2, 3]])
+
+        # then
+        expected = np.einsum("ij,ij->i", self.VECTORS[[1, 2, 3]], self.VECTORS[10 + rows])
+        assert np.allclose(similarities, expected, atol=0.01)
+
+    def test_shared_across_instances(self, tmp_path):
+        """
+        GIVEN two stores on the same file, e.g. of two worker processes
+        WHEN one of them stores and removes documents
+        THEN the other finds the changes after a refresh.
+        """
+        # given
+        path = str(tmp_path / "vectors")
+        store, other = VectorStore(path, width=32), VectorStore(path, width=32)
+
+        # when
+        store.put("doc", self.VECTORS[:10])
+        store.put("gone", self.VECTORS[10:])
+        store.remove("gone")
+        other.refresh()
+
+        # then
+        assert other.keys() == {"doc"}
+        assert np.array_equal(other.get("doc", [2, 5]), store.get("doc", [2, 5]))
+
+    def test_quantizations_kept_apart(self, tmp_path):
+        """
+        GIVEN a store on a path, quantized to 8 bits integers
+        WHEN another store on the same path is quantized to 16 bits floats
+        THEN it holds none of the documents of the first one, and their vectors are both read back.
+        """
+        # given
+        path = str(tmp_path / "vectors")
+        store = VectorStore(path, width=32, quantization="int8")
+        store.put("doc", self.VECTORS[:10])
+
+        # when
+        other = VectorStore(path, width=32, quantization="float16")
+        other.put("other", self.VECTORS[10:])
+        store.refresh()
+
+        # then
+        assert (store.keys(), other.keys()) == ({"doc"}, {"other"})
+        assert np.allclose(store.get("doc"), self.VECTORS[:10], atol=0.01)
+        assert np.allclose(other.get("other"), self.VECTORS[10:], atol=0.01)
+
+    def test_put_skips_stored_documents(self, tmp_path):
+        """
+        GIVEN a store holding the vectors of a document
+        WHEN the same vectors are stored again
+        THEN no rows are appended.
+        """
+        # given
+        store = VectorStore(str(tmp_path / "vectors"), width=32)
+        store.put("doc", self.VECTORS)
+        size = (tmp_path / "vectors.int8").stat().st_size
+
+        # when
+        store.put("doc", self.VECTORS)
+
+        # then
+        assert (tmp_path / "vectors.int8").stat().st_size == size
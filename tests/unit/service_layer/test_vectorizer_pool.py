@@ -0,0 +1,173 @@
+"""
+Unit test for the ProcessPoolVectorizer class.
+"""
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+from spacy import Language
+
+from heimdallr.service_layer import vectorizer_pool
+from heimdallr.service_layer.embeddings import SpacyEmbedder
+from heimdallr.service_layer.lexical_gate import LexicalGate
+from heimdallr.service_layer.sentence_comparer import SentenceComparer, SentencePair
+from heimdallr.service_layer.vectorizer_pool import ProcessPoolVectorizer
+
+
+class TestProcessPoolVectorizer:
+    SENTENCES = [
+        "This is a sentence.",
+        "This is another very long sentence.",
+        "",
+        "Qué dice Rifkin que la internet de las cosas le aportará a la tercera revolución industrial?",
+    ] * 5
+
+    @pytest.fixture(name="comparer")
+    def fixture_comparer(self) -> SentenceComparer:
+        """
+        Injects a sentence comparer that only rules out the sentences sharing too few words.
+        """
+        return SentenceComparer(LexicalGate(min_length_ratio=0.0), threshold=0.9, min_length=10)
+
+    @pytest.fixture(name="vectorizer")
+    def fixture_vectorizer(self, nlp: Language, comparer: SentenceComparer) -> ProcessPoolVectorizer:
+        """
+        Injects a vectorizer with small chunks, so that every call spreads over its workers.
+        """
+        vectorizer = ProcessPoolVectorizer(SpacyEmbedder(nlp), comparer, workers=2, chunk_size=3)
+        yield vectorizer
+        vectorizer.shutdown()
+
+    def pairs(self, nlp: Language) -> list[SentencePair]:
+        """
+        Builds pairs of assignments sharing some sentences, and the same entry.
+        """
+        embedder = SpacyEmbedder(nlp)
+        entry = self.SENTENCES[:4]
+        entry_vectors, _ = embedder.embed(entry)
+
+        return [
+            SentencePair(sentences, embedder.embed(sentences)[0], entry, entry_vectors, skipped)
+            for sentences, skipped in (
+                (self.SENTENCES[1:4], []),
+                (["Nothing in common here at all.", self.SENTENCES[0]], [0]),
+                ([], []),
+            )
+        ]
+
+    def test_vectorize_matches_in_process(self, nlp: Language, vectorizer: ProcessPoolVectorizer):
+        """
+        GIVEN some sentences
+        WHEN the pool vectorizes them
+        THEN it produces the same vectors and token counts as the calling process.
+        """
+        # given
+        expected_matrix, expected_tokens = SpacyEmbedder(nlp).embed(self.SENTENCES)
+
+        # when
+        matrix, tokens = vectorizer.vectorize(self.SENTENCES)
+
+        # then
+        assert matrix.shape == (len(self.SENTENCES), nlp.vocab.vectors_length)
+        assert np.allclose(matrix, expected_matrix)
+        assert tokens.tolist() == expected_tokens.tolist()
+
+    def test_vectorize_empty(self, vectorizer: ProcessPoolVectorizer):
+        """
+        GIVEN no sentences
+        WHEN the pool vectorizes them
+        THEN it returns an empty matrix.
+        """
+        # when
+        matrix, tokens = vectorizer.vectorize([])
+
+        # then
+        assert matrix.shape[0] == 0
+        assert tokens.size == 0
+
+    def test_workers_forked_on_creation(self, vectorizer: ProcessPoolVectorizer):
+        """
+        GIVEN a new vectorizer
+        WHEN nothing was submitted to it yet
+        THEN every worker process is already running.
+        """
+        # then
+        assert len(vectorizer._pool._executor._processes) == 2
+
+    def test_compare_all_matches_in_process(
+        self,
+        nlp: Language,
+        comparer: SentenceComparer,
+        vectorizer: ProcessPoolVectorizer,
+    ):
+        """
+        GIVEN pairs of assignments sharing the same entry
+        WHEN the pool compares them
+        THEN it finds the same plagiarized sentences as the calling process.
+        """
+        # given
+        pairs = self.pairs(nlp)
+
+        # when
+        results = vectorizer.compare_all(pairs)
+
+        # then
+        assert results == [comparer.compare(pair) for pair in pairs]
+        assert results[0].rows == [1, 3]
+        assert results[1].rows == []
+
+    def test_compare_mutual_all_matches_in_process(
+        self,
+        nlp: Language,
+        comparer: SentenceComparer,
+        vectorizer: ProcessPoolVectorizer,
+    ):
+        """
+        GIVEN pairs of entries
+        WHEN the pool compares them both ways
+        THEN it finds the same plagiarized sentences as the calling process.
+        """
+        # given
+        pairs = self.pairs(nlp)
+        skipped = [[0], [], []]
+
+        # when
+        results = vectorizer.compare_mutual_all(pairs, skipped)
+
+        # then
+        assert results == [comparer.compare_mutual(pair, pair_skipped) for pair, pair_skipped in zip(pairs, skipped)]
+
+    def test_compare_all_publishes_entry_once(
+        self,
+        nlp: Language,
+        comparer: SentenceComparer,
+        vectorizer: ProcessPoolVectorizer,
+        monkeypatch,
+    ):
+        """
+        GIVEN pairs holding the same entry, each with its own copy of the entry vectors
+        WHEN the pool compares them
+        THEN the entry vectors are published once, by the entry ID, and the results are the same.
+        """
+        # given
+        pairs = [
+            pair._replace(entry_vectors=pair.entry_vectors.copy(), key=key, entry_key="entry")
+            for key, pair in enumerate(self.pairs(nlp))
+        ]
+        sizes = []
+
+        def shared_memory(*args, **kwargs):
+            if kwargs.get("create"):
+                sizes.append(kwargs["size"])
+
+            return SharedMemory(*args, **kwargs)
+
+        monkeypatch.setattr(vectorizer_pool, "SharedMemory", shared_memory)
+
+        # when
+        results = vectorizer.compare_all(pairs)
+
+        # then
+        rows = len(pairs[0].entry_sentences) + sum(len(pair.sentences) for pair in pairs)
+        assert sizes == [rows * nlp.vocab.vectors_length * np.dtype(np.float32).itemsize]
+        assert results == [comparer.compare(pair) for pair in pairs]
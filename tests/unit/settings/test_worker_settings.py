@@ -0,0 +1,22 @@
+"""
+Worker settings tests.
+"""
+from heimdallr.settings.worker_settings import WorkerSettings
+
+
+class TestWorkerSettings:
+    """
+    Test suite for Worker Settings
+    """
+
+    def test_worker_default_values(self):
+        """
+        Test Worker default values
+        """
+        settings = WorkerSettings()
+
+        assert settings.NAME is None
+        assert settings.LEASE_SECONDS > 0
+        assert settings.MAX_ATTEMPTS > 0
+        assert settings.POLL_INTERVAL > 0
+        assert settings.PROGRESS_INTERVAL > 0
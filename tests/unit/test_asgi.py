@@ -24,7 +24,7 @@ class TestASGI:
         """
         GIVEN a FastAPI application
         WHEN the lifespan is called
-        THEN the NLP is initialized
+        THEN the application starts and shuts down
         """
 
         # given
@@ -0,0 +1,93 @@
+"""
+Unit test for the ForkedProcessPool class.
+"""
+import os
+
+import pytest
+
+from heimdallr.utils.process_pool import ForkedProcessPool
+
+_inherited: dict[str, str] = {}
+
+
+def _keep(key: str, value: str) -> None:
+    """
+    Keeps a value inherited by a forked worker.
+    """
+    _inherited[key] = value
+
+
+def _read(key: str) -> tuple[int, str]:
+    """
+    Returns the worker process ID, and a value it inherited.
+    """
+    return os.getpid(), _inherited[key]
+
+
+class TestForkedProcessPool:
+    @pytest.fixture(name="pool")
+    def fixture_pool(self) -> ForkedProcessPool:
+        """
+        Injects a pool of two workers, not forked yet.
+        """
+        pool = ForkedProcessPool(workers=2)
+        yield pool
+        pool.shutdown()
+
+    def test_start_forks_workers_once_for_every_user(self, pool: ForkedProcessPool):
+        """
+        GIVEN a pool two users registered what its workers inherit
+        WHEN it is started
+        THEN every worker is forked once, and inherits what both registered.
+        """
+        # given
+        pool.register(_keep, "reader", "pages")
+        pool.register(_keep, "vectorizer", "vectors")
+
+        # when
+        pool.start()
+
+        # then
+        assert len(pool._executor._processes) == 2
+        assert pool.submit(_read, "reader").result()[1] == "pages"
+        assert pool.submit(_read, "vectorizer").result()[1] == "vectors"
+        assert os.getpid() not in {pool.submit(_read, "reader").result()[0] for _ in range(4)}
+
+    def test_register_after_start(self, pool: ForkedProcessPool):
+        """
+        GIVEN a started pool
+        WHEN another user registers what its workers inherit
+        THEN it fails, since the workers were already forked.
+        """
+        # given
+        pool.register(_keep, "reader", "pages")
+        pool.start()
+
+        # when, then
+        with pytest.raises(RuntimeError):
+            pool.register(_keep, "vectorizer", "vectors")
+
+    def test_submit_before_start(self, pool: ForkedProcessPool):
+        """
+        GIVEN a pool that was not started
+        WHEN a task is submitted
+        THEN it fails, rather than forking the workers from the submitting thread.
+        """
+        # given
+        pool.register(_keep, "reader", "pages")
+
+        # when, then
+        with pytest.raises(RuntimeError):
+            pool.submit(_read, "reader")
+
+    def test_start_without_users(self, pool: ForkedProcessPool):
+        """
+        GIVEN a pool nothing registered on
+        WHEN it is started
+        THEN no worker is forked.
+        """
+        # when
+        pool.start()
+
+        # then
+        assert pool._executor is None
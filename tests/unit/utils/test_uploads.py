@@ -0,0 +1,59 @@
+"""
+Unit test for the upload utilities.
+"""
+import os
+import tempfile
+from io import BytesIO
+
+from heimdallr.utils.uploads import descriptor_path, unspool
+
+
+class TestUploads:
+    def test_unspool_in_memory(self):
+        """
+        GIVEN a spooled file still in memory
+        WHEN it is unspooled
+        THEN it is rolled over to disk, rewound, and may be opened by its descriptor path.
+        """
+        # given
+        spooled = tempfile.SpooledTemporaryFile(max_size=1024)
+        spooled.write(b"%PDF")
+
+        # when
+        file = unspool(spooled)
+
+        # then
+        assert file.read() == b"%PDF"
+        path = descriptor_path(file)
+        assert path is not None
+
+        with open(path, "rb") as opened:
+            assert opened.read() == b"%PDF"
+
+    def test_descriptor_path_in_memory(self):
+        """
+        GIVEN a file only in memory
+        WHEN its descriptor path is asked for
+        THEN there is none.
+        """
+        # when, then
+        assert descriptor_path(unspool(BytesIO(b"%PDF"))) is None
+
+    def test_unspool_on_disk(self):
+        """
+        GIVEN a spooled file rolled over to disk
+        WHEN it is unspooled
+        THEN the file may be opened again by its descriptor path.
+        """
+        # given
+        spooled = tempfile.SpooledTemporaryFile(max_size=2)
+        spooled.write(b"%PDF")
+
+        # when
+        path = descriptor_path(unspool(spooled))
+
+        # then
+        assert path is not None and os.path.exists(path)
+
+        with open(path, "rb") as file:
+            assert file.read() == b"%PDF"